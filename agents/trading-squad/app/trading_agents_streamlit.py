@@ -783,6 +783,7 @@ def run_real_analysis(
 
     # Import TradingAgents
     try:
+        from tradingagents.dataflows.config import config_context, iterate_in_context
         from tradingagents.default_config import DEFAULT_CONFIG
         from tradingagents.graph.trading_graph import TradingAgentsGraph
     except ImportError as e:
@@ -1120,7 +1121,10 @@ def run_real_analysis(
                 except Exception:
                     pass
 
-            for chunk in ta.graph.stream(init_agent_state, **args):
+            # The agents read ta.config as the run's config, as in propagate()
+            for chunk in iterate_in_context(
+                config_context(ta.config), ta.graph.stream(init_agent_state, **args)
+            ):
                 if not st.session_state.analysis_running:
                     break
 
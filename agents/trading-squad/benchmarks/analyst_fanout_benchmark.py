@@ -0,0 +1,162 @@
+"""
+Time a full graph run with the analysts chained in sequence vs fanned out in parallel.
+
+Run from the trading-squad directory:
+    python -m benchmarks.analyst_fanout_benchmark
+    python -m benchmarks.analyst_fanout_benchmark --llm-latency 1.5 --tool-latency 0.5
+
+The graph from GraphSetup runs end to end on a simulated chat model that
+sleeps --llm-latency per call (analysts make one tool call each, then
+write their report) and tools that sleep --tool-latency, so the timings
+reflect the topology rather than any provider. Memories use the local
+hashing embedder. Both topologies must produce identical reports and
+final decisions.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+from typing import List
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt import ToolNode
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.dataflows.config import freeze_config
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.setup import ANALYST_REPORTS, GraphSetup
+
+# Toolkit tools each analyst binds with online_tools on
+ANALYST_TOOLS = {
+    "market": ["get_YFin_data_online", "get_stockstats_indicators_report_online"],
+    "social": ["get_stock_news_openai"],
+    "news": ["get_global_news_openai", "get_google_news"],
+    "fundamentals": ["get_fundamentals_openai"],
+}
+
+
+class SimulatedChatModel(BaseChatModel):
+    """Answers after a fixed delay; with tools bound, calls the first one once."""
+
+    latency: float = 0.0
+    tool_names: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.model_copy(update={"tool_names": [tool.name for tool in tools]})
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+    def _respond(self, messages):
+        if self.tool_names and not isinstance(messages[-1], ToolMessage):
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": self.tool_names[0], "args": {}, "id": uuid.uuid4().hex}
+                ],
+            )
+        elif self.tool_names:
+            message = AIMessage(content=f"Report based on {messages[-1].content}")
+        else:
+            message = AIMessage(content="FINAL TRANSACTION PROPOSAL: **HOLD**")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def simulated_toolkit(tool_latency):
+    def make_tool(name):
+        def run() -> str:
+            time.sleep(tool_latency)
+            return f"{name} data"
+
+        async def arun() -> str:
+            await asyncio.sleep(tool_latency)
+            return f"{name} data"
+
+        return StructuredTool.from_function(
+            run, name=name, description=name, coroutine=arun
+        )
+
+    tools = {
+        name: make_tool(name) for names in ANALYST_TOOLS.values() for name in names
+    }
+    toolkit = SimpleNamespace(config={"online_tools": True}, **tools)
+    tool_nodes = {
+        analyst: ToolNode([tools[name] for name in names])
+        for analyst, names in ANALYST_TOOLS.items()
+    }
+    return toolkit, tool_nodes
+
+
+def build_graph(analyst_execution, args, llm=None):
+    llm = llm or SimulatedChatModel(latency=args.llm_latency)
+    toolkit, tool_nodes = simulated_toolkit(args.tool_latency)
+    config = freeze_config({"embedding_backend": "hashing", "memory_store": "numpy"})
+    memories = [
+        FinancialSituationMemory(f"bench_{name}", config)
+        for name in ("bull", "bear", "trader", "judge", "risk")
+    ]
+    setup = GraphSetup(llm, llm, toolkit, tool_nodes, *memories, ConditionalLogic())
+    return setup.setup_graph(list(ANALYST_TOOLS), analyst_execution)
+
+
+def run(graph):
+    """Wall time of the analyst phase and of the whole run, and the final state."""
+    propagator = Propagator()
+    state = propagator.create_initial_state("NVDA", "2025-01-02")
+    start = time.perf_counter()
+    analysts_done = None
+    for state in graph.stream(state, **propagator.get_graph_args()):
+        if analysts_done is None and all(
+            state[report] for report in ANALYST_REPORTS.values()
+        ):
+            analysts_done = time.perf_counter() - start
+    return analysts_done, time.perf_counter() - start, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--tool-latency", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("sequential", "parallel"):
+        graph = build_graph(mode, args)
+        runs = [run(graph) for _ in range(args.repeat)]
+        results[mode] = runs
+
+    sequential_state = results["sequential"][-1][2]
+    parallel_state = results["parallel"][-1][2]
+    for key in [*ANALYST_REPORTS.values(), "final_trade_decision"]:
+        if sequential_state[key] != parallel_state[key]:
+            raise SystemExit(f"{key} differs between sequential and parallel runs")
+
+    print(
+        f"LLM call {args.llm_latency:.2f} s, tool call {args.tool_latency:.2f} s, "
+        f"{len(ANALYST_TOOLS)} analysts: identical reports and decisions"
+    )
+    print(f"{'analysts':<12}{'analyst phase s':>17}{'end to end s':>14}")
+    for mode, runs in results.items():
+        analysts = statistics.median(analysts_done for analysts_done, _, _ in runs)
+        total = statistics.median(total for _, total, _ in runs)
+        print(f"{mode:<12}{analysts:>17.2f}{total:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Drive many concurrent graph runs from one event loop vs one thread per run.
+
+Run from the trading-squad directory:
+    python -m benchmarks.async_propagate_benchmark
+    python -m benchmarks.async_propagate_benchmark --runs 64 --llm-latency 1.0
+
+Uses the simulated chat model and tools of analyst_fanout_benchmark, whose
+async versions await asyncio.sleep instead of blocking. "threads" runs
+graph.invoke for each run on its own worker thread, as a server calling
+propagate would; "asyncio" gathers graph.ainvoke for every run on the
+calling thread, as apropagate does. Both must reach the same decisions.
+Threads is the number alive while the runs execute: each one is a stack
+held for the whole run, mostly blocked waiting on the network. The asyncio
+runs take no llm_max_concurrency slots unless --llm-cap is given.
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.analyst_fanout_benchmark import build_graph
+from tradingagents.dataflows.config import config_context, freeze_config
+from tradingagents.graph.propagation import Propagator
+
+
+def run_threads(graph, states, args):
+    with ThreadPoolExecutor(max_workers=len(states)) as pool:
+        futures = [pool.submit(graph.invoke, state, **args) for state in states]
+        peak_threads = threading.active_count()
+        return [future.result() for future in futures], peak_threads
+
+
+def run_asyncio(graph, states, args):
+    async def gather():
+        return await asyncio.gather(*(graph.ainvoke(state, **args) for state in states))
+
+    # asyncio.run's task copies the context, and with it the run's config
+    return asyncio.run(gather()), threading.active_count()
+
+
+def measure(runner, graph, states, args):
+    """Wall time, threads alive during the runs and the final states."""
+    start = time.perf_counter()
+    final_states, threads = runner(graph, states, args)
+    return time.perf_counter() - start, threads, final_states
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=32)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--tool-latency", type=float, default=0.3)
+    parser.add_argument("--llm-cap", type=int, default=None)
+    args = parser.parse_args()
+
+    llm_caps = {"openai": args.llm_cap} if args.llm_cap else {}
+    config = freeze_config({"llm_provider": "openai", "llm_max_concurrency": llm_caps})
+
+    graph = build_graph("parallel", args)
+    propagator = Propagator()
+    states = [
+        propagator.create_initial_state(f"T{i:03d}", "2025-01-02")
+        for i in range(args.runs)
+    ]
+    graph_args = propagator.get_graph_args()
+
+    results = {
+        mode: config_context(config).run(measure, runner, graph, states, graph_args)
+        for mode, runner in (("threads", run_threads), ("asyncio", run_asyncio))
+    }
+
+    decisions = {
+        mode: [state["final_trade_decision"] for state in final_states]
+        for mode, (*_, final_states) in results.items()
+    }
+    if decisions["threads"] != decisions["asyncio"]:
+        raise SystemExit("threads and asyncio runs reached different decisions")
+
+    print(
+        f"{args.runs} concurrent runs, LLM call {args.llm_latency:.2f} s, "
+        f"tool call {args.tool_latency:.2f} s, LLM cap {args.llm_cap or 'none'}: "
+        "identical decisions"
+    )
+    print(f"{'mode':<10}{'wall s':>8}{'runs/min':>10}{'threads':>9}")
+    for mode, (elapsed, threads, _) in results.items():
+        runs_per_minute = 60 * args.runs / elapsed
+        print(f"{mode:<10}{elapsed:>8.2f}{runs_per_minute:>10.0f}{threads:>9}")
+
+
+if __name__ == "__main__":
+    main()
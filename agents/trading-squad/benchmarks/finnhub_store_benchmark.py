@@ -0,0 +1,143 @@
+"""
+Compare Finnhub range query latency: per-call json.load vs the indexed Finnhub store.
+
+Run from the trading-squad directory:
+    python -m benchmarks.finnhub_store_benchmark
+    python -m benchmarks.finnhub_store_benchmark --days 7300 --items-per-day 40
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from tradingagents.dataflows.finnhub_store import (
+    FinnhubStore,
+    finnhub_data_path,
+    unique_entries,
+)
+
+
+def write_synthetic_file(data_dir, ticker, data_type, days, items_per_day, seed=0):
+    """Write a {ticker}_data_formatted.json with `days` daily keys."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for day in pd.date_range("2005-01-01", periods=days).strftime("%Y-%m-%d"):
+        count = int(rng.integers(0, 2 * items_per_day + 1))
+        data[day] = [
+            {
+                "headline": f"Headline {day} #{i}",
+                "summary": "lorem ipsum " * int(rng.integers(5, 40)),
+                "id": int(rng.integers(0, 1 << 40)),
+            }
+            for i in range(count)
+        ]
+    path = finnhub_data_path(ticker, data_type, data_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+def json_query(path, start_date, end_date):
+    """The pre-store code path: load the whole file and scan every key."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    return {
+        key: value
+        for key, value in data.items()
+        if start_date <= key <= end_date and len(value) > 0
+    }
+
+
+def list_dedup(days):
+    """The pre-store deduplication: a linear scan over every entry seen."""
+    seen_dicts = []
+    for entries in days.values():
+        for entry in entries:
+            if entry not in seen_dicts:
+                seen_dicts.append(entry)
+    return seen_dicts
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=3650)
+    parser.add_argument("--items-per-day", type=int, default=20)
+    parser.add_argument("--look-back-days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_file(
+            tmp, "BENCH", "news_data", args.days, args.items_per_day
+        )
+        print(f"synthetic file: {os.path.getsize(path) / 1e6:.1f} MB, {args.days} days")
+
+        days = pd.date_range("2005-01-01", periods=args.days).strftime("%Y-%m-%d")
+        rng = np.random.default_rng(1)
+        queries = [
+            (days[end - args.look_back_days], days[end])
+            for end in rng.integers(args.look_back_days, args.days, args.repeat)
+        ]
+
+        stores = {
+            "memory store": FinnhubStore(),
+            "sqlite store": FinnhubStore(
+                sqlite_path=os.path.join(tmp, "finnhub.sqlite")
+            ),
+        }
+        for store in stores.values():
+            for start, end in queries:
+                expected = json_query(path, start, end)
+                actual = store.get_range("BENCH", start, end, "news_data", tmp)
+                assert actual == expected
+
+        json_warm = [timed(json_query, path, *query) for query in queries]
+        results = [("json.load", json_warm[0], json_warm)]
+        for name, store in stores.items():
+            # cold: the first query parses (or ingests) the file
+            fresh = FinnhubStore(
+                sqlite_path=store.sqlite_path and os.path.join(tmp, "cold.sqlite")
+            )
+            cold = timed(fresh.get_range, "BENCH", *queries[0], "news_data", tmp)
+            warm = [
+                timed(store.get_range, "BENCH", *query, "news_data", tmp)
+                for query in queries
+            ]
+            results.append((name, cold, warm))
+
+        print(f"{'path':<14}{'cold ms':>10}{'warm p50 ms':>14}{'warm p99 ms':>14}")
+        for name, cold, warm in results:
+            p99 = np.percentile(warm, 99)
+            print(
+                f"{name:<14}{cold:>10.3f}{statistics.median(warm):>14.3f}{p99:>14.3f}"
+            )
+
+        # Deduplication over a year of entries, each repeated on three days
+        year = stores["memory store"].get_range(
+            "BENCH", "2006-01-01", "2006-12-31", "news_data", tmp
+        )
+        repeated = {
+            f"{day}-{i}": entries for day, entries in year.items() for i in range(3)
+        }
+        assert list(unique_entries(repeated)) == list_dedup(repeated)
+        print(
+            f"\ndedup of {sum(map(len, repeated.values()))} entries:"
+            f" list scan {timed(list_dedup, repeated):.1f} ms,"
+            f" hashed {timed(lambda d: list(unique_entries(d)), repeated):.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Check the NumPy indicator engine against stockstats and compare throughput.
+
+Run from the trading-squad directory:
+    python -m benchmarks.indicator_engine_benchmark
+    python -m benchmarks.indicator_engine_benchmark --tickers 500 --days 2600
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+from tradingagents.dataflows.indicator_cache import SUPPORTED_INDICATORS
+from tradingagents.dataflows.indicator_engine import compute_indicators
+
+
+def synthetic_prices(tickers, days, seed=0):
+    """Random-walk OHLCV matrices of shape (tickers, days)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, (tickers, days)), axis=1))
+    high = close * (1 + rng.uniform(0, 0.02, (tickers, days)))
+    low = close * (1 - rng.uniform(0, 0.02, (tickers, days)))
+    volume = rng.integers(100_000, 50_000_000, (tickers, days)).astype(np.float64)
+    return high, low, close, volume
+
+
+def with_missing_closes(close, seed=1):
+    """
+    A copy of close with gaps: one missing bar per ticker, two in a row for
+    every other ticker, and the first bar for the first ticker.
+    """
+    rng = np.random.default_rng(seed)
+    close = close.copy()
+    tickers, days = close.shape
+    for i, day in enumerate(rng.integers(1, days - 1, tickers)):
+        close[i, day : day + 1 + i % 2] = np.nan
+    close[0, 0] = np.nan
+    return close
+
+
+def stockstats_indicators(high, low, close, volume):
+    df = wrap(
+        pd.DataFrame(
+            {
+                "Date": pd.bdate_range("2015-01-01", periods=len(close)).strftime(
+                    "%Y-%m-%d"
+                ),
+                "Open": close,
+                "High": high,
+                "Low": low,
+                "Close": close,
+                "Volume": volume,
+            }
+        )
+    )
+    return {name: df[name].to_numpy(dtype=float) for name in SUPPORTED_INDICATORS}
+
+
+def parity(high, low, close, volume):
+    """Largest absolute and relative deviation from stockstats per indicator."""
+    worst = {name: (0.0, 0.0) for name in SUPPORTED_INDICATORS}
+    engine = compute_indicators(high, low, close, volume)
+    for i in range(close.shape[0]):
+        reference = stockstats_indicators(high[i], low[i], close[i], volume[i])
+        for name in SUPPORTED_INDICATORS:
+            ours, theirs = engine[name][i], reference[name]
+            if not np.array_equal(np.isnan(ours), np.isnan(theirs)):
+                raise AssertionError(f"{name}: NaN positions differ for ticker {i}")
+            valid = ~np.isnan(theirs)
+            abs_err = np.abs(ours[valid] - theirs[valid])
+            rel_err = abs_err / np.maximum(np.abs(theirs[valid]), 1.0)
+            worst[name] = (
+                max(worst[name][0], float(abs_err.max(initial=0.0))),
+                max(worst[name][1], float(rel_err.max(initial=0.0))),
+            )
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--days", type=int, default=2600)
+    parser.add_argument("--parity-tickers", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=1e-8)
+    args = parser.parse_args()
+
+    high, low, close, volume = synthetic_prices(args.tickers, args.days)
+
+    n = min(args.parity_tickers, args.tickers)
+    worst = parity(high[:n], low[:n], close[:n], volume[:n])
+    # Missing closes must not poison the bars after them, as in stockstats
+    gaps = parity(high[:n], low[:n], with_missing_closes(close[:n]), volume[:n])
+    worst = {
+        name: tuple(map(max, worst[name], gaps[name])) for name in SUPPORTED_INDICATORS
+    }
+    print(f"{'indicator':<14}{'max abs err':>14}{'max rel err':>14}")
+    for name, (abs_err, rel_err) in worst.items():
+        print(f"{name:<14}{abs_err:>14.3e}{rel_err:>14.3e}")
+    failed = [name for name, (_, rel_err) in worst.items() if rel_err > args.tolerance]
+    if failed:
+        raise SystemExit(f"parity check failed for: {', '.join(failed)}")
+
+    start = time.perf_counter()
+    compute_indicators(high, low, close, volume)
+    engine_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(args.tickers):
+        stockstats_indicators(high[i], low[i], close[i], volume[i])
+    stockstats_s = time.perf_counter() - start
+
+    bars = args.tickers * args.days
+    print(f"\n{args.tickers} tickers x {args.days} days, all 13 indicators")
+    for name, seconds in (("engine (2-D)", engine_s), ("stockstats", stockstats_s)):
+        print(
+            f"{name:<14}{seconds * 1000:>10.1f} ms{bars / seconds / 1e6:>10.2f} Mbars/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
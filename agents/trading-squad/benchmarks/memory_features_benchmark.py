@@ -0,0 +1,95 @@
+"""
+Time memory retrieval by numeric market state against retrieval by text embedding.
+
+Run from the trading-squad directory:
+    python -m benchmarks.memory_features_benchmark
+    python -m benchmarks.memory_features_benchmark --sizes 1000 10000 100000
+
+Each size is a FeatureIndex of random market state vectors (one value per
+MARKET_FEATURES), checked against an exact float64 ranking. For comparison,
+the text path embeds a situation with the local hashing embedder and
+searches a NumpyCollection of the same size; with the OpenAI backend it
+would add an API round trip on a cache miss.
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from benchmarks.memory_search_benchmark import synthetic_situation
+from tradingagents.agents.utils.embeddings import HashingEmbedder
+from tradingagents.agents.utils.vector_store import FeatureIndex, NumpyCollection
+from tradingagents.dataflows.market_features import MARKET_FEATURES
+
+
+def percentiles(samples_us):
+    samples_us = sorted(samples_us)
+    p99 = samples_us[min(len(samples_us) - 1, int(len(samples_us) * 0.99))]
+    return statistics.median(samples_us), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--dim", type=int, default=1024, help="text embedding width")
+    parser.add_argument("--k", type=int, default=2)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embedder = HashingEmbedder(dim=args.dim)
+    situation = synthetic_situation(0)
+    embedder.embed_one(situation)  # warm the term hash cache
+
+    print(
+        f"{'entries':>9}{'features p50 us':>17}{'p99 us':>9}"
+        f"{'text p50 us':>13}{'p99 us':>9}"
+    )
+    for size in args.sizes:
+        ids = [str(i) for i in range(size)]
+        # Features spread like the real ones: a few percent to tens of percent
+        features = rng.standard_normal((size, len(MARKET_FEATURES)), np.float32)
+        features *= rng.uniform(0.01, 0.5, len(MARKET_FEATURES)).astype(np.float32)
+        index = FeatureIndex("bench")
+        index.add(ids, features)
+
+        scale = features.astype(np.float64).std(axis=0)
+        queries = features[rng.integers(0, size, args.queries)] * 1.05
+        index.query(queries[0], args.k)  # scale the matrix once
+        feature_samples = []
+        for query in queries:
+            start = time.perf_counter()
+            top, _ = index.query(query, args.k)
+            feature_samples.append((time.perf_counter() - start) * 1e6)
+
+            exact = np.linalg.norm((features - query) / scale, axis=1)
+            if top != [str(i) for i in np.argsort(exact, kind="stable")[: args.k]]:
+                raise SystemExit(f"top-{args.k} differs from exact search at {size}")
+
+        collection = NumpyCollection("bench")
+        collection.add(
+            ids=ids,
+            embeddings=rng.standard_normal((size, args.dim), dtype=np.float32),
+            documents=[""] * size,
+            metadatas=[{}] * size,
+        )
+        text_samples = []
+        for _ in range(args.queries):
+            start = time.perf_counter()
+            collection.query(
+                query_embeddings=[embedder.embed_one(situation)], n_results=args.k
+            )
+            text_samples.append((time.perf_counter() - start) * 1e6)
+
+        feature_p50, feature_p99 = percentiles(feature_samples)
+        text_p50, text_p99 = percentiles(text_samples)
+        print(
+            f"{size:>9}{feature_p50:>17.1f}{feature_p99:>9.1f}"
+            f"{text_p50:>13.1f}{text_p99:>9.1f}"
+        )
+    print("feature top-k identical to exact float64 search")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Time offline memory retrieval: local hashing embeddings plus NumPy brute-force top-k.
+
+Run from the trading-squad directory:
+    python -m benchmarks.memory_search_benchmark
+    python -m benchmarks.memory_search_benchmark --sizes 1000 10000 100000 --dim 1536
+
+Collections of random unit vectors are searched with NumpyCollection and
+checked against an exact float64 ranking. The hashing embedder is timed on
+situation texts shaped like the four concatenated analyst reports.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+from tradingagents.agents.utils.embeddings import HashingEmbedder
+from tradingagents.agents.utils.vector_store import NumpyCollection
+
+
+def synthetic_situation(seed, words=700):
+    rng = random.Random(seed)
+    vocabulary = (
+        "revenue growth margin rsi macd boll atr vwma support resistance rally "
+        "selloff inflation fed rates guidance insider buying selling volume "
+        "earnings beat miss upgrade downgrade 52-week high low 1.5% 3.2%"
+    ).split()
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def percentiles(samples_ms):
+    samples_ms = sorted(samples_ms)
+    p99 = samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.99))]
+    return statistics.median(samples_ms), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--k", type=int, default=2)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    embedder = HashingEmbedder(dim=args.dim)
+    texts = [synthetic_situation(seed) for seed in range(50)]
+    embedder.embed(texts[:1])  # warm the term hash cache
+    samples = []
+    for text in texts:
+        start = time.perf_counter()
+        embedder.embed_one(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    p50, p99 = percentiles(samples)
+    print(
+        f"hashing embed ({len(texts[0]) / 1000:.1f} KB text): "
+        f"p50 {p50:.3f} ms, p99 {p99:.3f} ms"
+    )
+
+    rng = np.random.default_rng(0)
+    print(f"{'entries':>9}{'add ms':>10}{'query p50 ms':>14}{'query p99 ms':>14}")
+    for size in args.sizes:
+        vectors = rng.standard_normal((size, args.dim), dtype=np.float32)
+        queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+
+        collection = NumpyCollection("bench")
+        start = time.perf_counter()
+        collection.add(
+            ids=[str(i) for i in range(size)],
+            embeddings=vectors,
+            documents=[""] * size,
+            metadatas=[{}] * size,
+        )
+        add_ms = (time.perf_counter() - start) * 1000
+
+        reference = vectors.astype(np.float64)
+        reference /= np.linalg.norm(reference, axis=1, keepdims=True)
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            result = collection.query(query_embeddings=[query], n_results=args.k)
+            samples.append((time.perf_counter() - start) * 1000)
+
+            expected = np.argsort(-(reference @ query.astype(np.float64)))[: args.k]
+            if result["ids"][0] != [str(i) for i in expected]:
+                raise SystemExit(f"top-{args.k} differs from exact search at {size}")
+
+        p50, p99 = percentiles(samples)
+        print(f"{size:>9}{add_ms:>10.1f}{p50:>14.3f}{p99:>14.3f}")
+    print("top-k identical to exact float64 search")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Measure agent memory startup time and footprint: persistent warm start vs rebuilding in memory.
+
+Run from the trading-squad directory:
+    python -m benchmarks.memory_store_benchmark
+    python -m benchmarks.memory_store_benchmark --entries 50000 --path /tmp/memory
+
+A persistent store with --entries situations (random embeddings of the
+text-embedding-3-small width, documents of --doc-bytes) is written once.
+Each start is then measured in a fresh interpreter: "persistent" opens the
+store on disk, as FinancialSituationMemory does with memory_persist;
+"in-memory" re-adds every embedding to an in-memory client, the best case of
+the old behaviour (it still excludes re-embedding every document through the
+API). Both must return the same neighbours for the probe queries.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+COLLECTION = "bench_memory"
+
+
+def rss_mb():
+    """Resident set size of this process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        import resource
+
+        # Peak rather than current RSS where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def synthetic_entries(entries, dim, doc_bytes, seed=0):
+    rng = np.random.default_rng(seed)
+    embeddings = rng.standard_normal((entries, dim), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    filler = "market report " * (doc_bytes // 14 + 1)
+    documents = [f"situation {i}: {filler[:doc_bytes]}" for i in range(entries)]
+    metadatas = [{"recommendation": f"lesson {i}"} for i in range(entries)]
+    ids = [str(i) for i in range(entries)]
+    return ids, embeddings, documents, metadatas
+
+
+def add_all(collection, client, ids, embeddings, documents, metadatas):
+    step = client.get_max_batch_size()
+    for start in range(0, len(ids), step):
+        stop = start + step
+        collection.add(
+            ids=ids[start:stop],
+            embeddings=embeddings[start:stop].tolist(),
+            documents=documents[start:stop],
+            metadatas=metadatas[start:stop],
+        )
+
+
+def probe_queries(dim, queries, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((queries, dim), dtype=np.float32).tolist()
+
+
+def probe(args):
+    """One start in this (fresh) interpreter; prints a JSON result line."""
+    rss_before = rss_mb()
+    start = time.perf_counter()
+
+    import chromadb
+    from chromadb.config import Settings
+
+    settings = Settings(allow_reset=True, anonymized_telemetry=False)
+    if args.probe == "persistent":
+        client = chromadb.PersistentClient(path=args.path, settings=settings)
+        collection = client.get_or_create_collection(name=COLLECTION)
+    else:
+        client = chromadb.Client(settings)
+        collection = client.get_or_create_collection(name=COLLECTION)
+        add_all(
+            collection,
+            client,
+            *synthetic_entries(args.entries, args.dim, args.doc_bytes),
+        )
+    count = collection.count()
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    neighbours = []
+    for query in probe_queries(args.dim, args.queries):
+        start = time.perf_counter()
+        result = collection.query(query_embeddings=[query], n_results=2)
+        latencies.append((time.perf_counter() - start) * 1000)
+        neighbours.append(result["ids"][0])
+
+    warm = sorted(latencies[1:]) or latencies
+    print(
+        json.dumps(
+            {
+                "count": count,
+                "startup_ms": startup_ms,
+                "first_query_ms": latencies[0],
+                "warm_p50_ms": statistics.median(warm),
+                "warm_p99_ms": warm[min(len(warm) - 1, int(len(warm) * 0.99))],
+                "rss_mb": rss_mb() - rss_before,
+                "neighbours": neighbours,
+            }
+        )
+    )
+
+
+def run_probe(mode, args):
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.memory_store_benchmark",
+        "--probe",
+        mode,
+        "--path",
+        args.path,
+        "--entries",
+        str(args.entries),
+        "--dim",
+        str(args.dim),
+        "--doc-bytes",
+        str(args.doc_bytes),
+        "--queries",
+        str(args.queries),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--doc-bytes", type=int, default=4000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--path", help="persistent store directory (default: temp)")
+    parser.add_argument("--probe", choices=["persistent", "in-memory"])
+    args = parser.parse_args()
+
+    if args.probe:
+        probe(args)
+        return
+
+    args.path = args.path or tempfile.mkdtemp(prefix="memory_store_")
+
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(
+        path=args.path,
+        settings=Settings(allow_reset=True, anonymized_telemetry=False),
+    )
+    collection = client.get_or_create_collection(name=COLLECTION)
+    if collection.count() != args.entries:
+        client.delete_collection(COLLECTION)
+        collection = client.get_or_create_collection(name=COLLECTION)
+        start = time.perf_counter()
+        add_all(
+            collection,
+            client,
+            *synthetic_entries(args.entries, args.dim, args.doc_bytes),
+        )
+        print(
+            f"wrote {args.entries} entries to {args.path} in "
+            f"{time.perf_counter() - start:.1f} s"
+        )
+    del collection, client
+
+    disk_mb = sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(args.path)
+        for name in files
+    )
+    disk_mb /= 1e6
+
+    results = {mode: run_probe(mode, args) for mode in ("persistent", "in-memory")}
+    if results["persistent"]["neighbours"] != results["in-memory"]["neighbours"]:
+        raise SystemExit("persistent store returned different neighbours")
+
+    print(
+        f"{args.entries} entries x {args.dim} dims, store on disk {disk_mb:.0f} MB: "
+        "identical neighbours"
+    )
+    print(
+        f"{'start':<12}{'startup ms':>12}{'first q ms':>12}"
+        f"{'warm p50 ms':>13}{'warm p99 ms':>13}{'RSS MB':>9}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<12}{result['startup_ms']:>12.0f}{result['first_query_ms']:>12.2f}"
+            f"{result['warm_p50_ms']:>13.2f}{result['warm_p99_ms']:>13.2f}"
+            f"{result['rss_mb']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
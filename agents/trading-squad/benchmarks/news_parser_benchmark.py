@@ -0,0 +1,100 @@
+"""
+Replay Google News results pages through every parser backend and compare throughput.
+
+Run from the trading-squad directory:
+    python -m benchmarks.news_parser_benchmark
+    python -m benchmarks.news_parser_benchmark --fixtures 'fixtures/google_news/*.html'
+
+Without --fixtures, synthetic pages shaped like Google News results are
+generated. Saved pages (e.g. response.content written to disk) are replayed
+offline. Every backend must produce the same results as html.parser.
+"""
+
+import argparse
+import glob
+import html
+import random
+import time
+
+from tradingagents.dataflows.news_parsers import PARSERS
+
+
+def synthetic_page(page, results=10, seed=0):
+    """A results page with Google News markup, page noise and a few odd results."""
+    rng = random.Random(seed * 1000 + page)
+    words = ["Apple", "shares", "rally", "Nvidia", "earnings", "Fed", "Zürich", "&"]
+
+    def sentence(n):
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    items = []
+    for i in range(results):
+        title = html.escape(sentence(8))
+        snippet = html.escape(sentence(30))
+        source = f'<div class="NUnG9d"><span>{html.escape(sentence(2))}</span></div>'
+        date = f'<div class="OSrXXb rbYSKb LfVVr"><span>{i + 1} days ago</span></div>'
+        if i == 3:
+            source = ""  # missing source
+        if i == 7:
+            date = ""  # missing date
+        link = (
+            f'<a class="WlydOe" href="https://news.example.com/{page}/{i}?a=1&amp;b=2">'
+        )
+        items.append(
+            f'<div class="SoaBEf" data-hveid="{i}"><div>{link}'
+            f'<div class="SoaBEf-inner"><div class="n0jPhd ynAwRc MBeuO nDgy9d" '
+            f'role="heading">{title} <b>bold</b></div>'
+            f'<div class="GI74Re nDgy9d">{snippet}</div>{date}{source}'
+            f"</div></a></div></div>"
+        )
+    noise = "".join(
+        f'<div class="noise n{j}"><span>{sentence(12)}</span></div>' for j in range(300)
+    )
+    next_link = '<a id="pnnext" href="/search?start=10">Next</a>' if page < 4 else ""
+    return (
+        "<!doctype html><html><head><meta charset='UTF-8'>"
+        f"<style>.x{{color:red}}</style><script>var a = '{sentence(40)}';</script>"
+        f"</head><body><div id='main'>{noise}<div id='rso'>{''.join(items)}</div>"
+        f"{next_link}</div></body></html>"
+    ).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", help="glob of saved results pages")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        pages = []
+        for path in sorted(glob.glob(args.fixtures)):
+            with open(path, "rb") as f:
+                pages.append(f.read())
+        if not pages:
+            raise SystemExit(f"no fixtures match {args.fixtures}")
+    else:
+        pages = [synthetic_page(page) for page in range(args.pages)]
+
+    reference = [PARSERS["html.parser"](page) for page in pages]
+    for name, parse in PARSERS.items():
+        if [parse(page) for page in pages] != reference:
+            raise SystemExit(f"{name} results differ from html.parser")
+
+    mb = sum(map(len, pages)) / 1e6
+    results = sum(len(page.results) for page in reference)
+    print(f"{len(pages)} pages, {mb:.1f} MB, {results} results: identical output")
+    print(f"{'backend':<14}{'ms/page':>10}{'pages/s':>10}")
+    for name, parse in PARSERS.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for page in pages:
+                parse(page)
+        seconds = (time.perf_counter() - start) / args.repeat
+        print(
+            f"{name:<14}{seconds / len(pages) * 1000:>10.2f}{len(pages) / seconds:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare YFin price query latency: per-call CSV parsing vs the columnar price store.
+
+Run from the trading-squad directory:
+    python -m benchmarks.price_store_benchmark
+    python -m benchmarks.price_store_benchmark --price-dir <data_dir>/market_data/price_data --symbol AAPL
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from tradingagents.dataflows import price_store
+from tradingagents.dataflows.price_store import YFIN_CSV_NAME, get_price_store
+
+
+def write_synthetic_csv(price_dir, symbol, rows):
+    """Write a YFin-shaped CSV with `rows` business days starting 2015-01-01."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2015-01-01", periods=rows)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    frame = pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.002, rows)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, rows),
+        }
+    )
+    frame.to_csv(
+        os.path.join(price_dir, YFIN_CSV_NAME.format(symbol=symbol)), index=False
+    )
+
+
+def csv_query(price_dir, symbol, start_date, end_date):
+    """The pre-store code path: parse the whole CSV and filter on Date strings."""
+    data = pd.read_csv(os.path.join(price_dir, YFIN_CSV_NAME.format(symbol=symbol)))
+    data["DateOnly"] = data["Date"].str[:10]
+    filtered = data[(data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)]
+    return filtered.drop("DateOnly", axis=1)
+
+
+def store_query(price_dir, symbol, start_date, end_date):
+    return get_price_store(symbol, price_dir).frame(start_date, end_date)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--price-dir", help="directory with YFin CSVs (default: synthetic)"
+    )
+    parser.add_argument("--symbol", default="BENCH")
+    parser.add_argument("--rows", type=int, default=2600)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--start-date", default="2024-01-02")
+    parser.add_argument("--end-date", default="2024-02-01")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        price_dir = args.price_dir
+        if price_dir is None:
+            price_dir = tmp
+            write_synthetic_csv(price_dir, args.symbol, args.rows)
+            args.start_date, args.end_date = "2018-01-02", "2018-02-01"
+        query = (price_dir, args.symbol, args.start_date, args.end_date)
+
+        pd.testing.assert_frame_equal(csv_query(*query), store_query(*query))
+
+        csv_cold = timed(csv_query, *query)
+        csv_warm = [timed(csv_query, *query) for _ in range(args.repeat)]
+
+        # cold: first open of an already-built store in a fresh process
+        price_store.clear_open_stores()
+        store_cold = timed(store_query, *query)
+        store_warm = [timed(store_query, *query) for _ in range(args.repeat)]
+
+        print(f"{'path':<14}{'cold ms':>10}{'warm p50 ms':>14}{'warm p99 ms':>14}")
+        for name, cold, warm in (
+            ("csv", csv_cold, csv_warm),
+            ("price store", store_cold, store_warm),
+        ):
+            p99 = np.percentile(warm, 99)
+            print(
+                f"{name:<14}{cold:>10.3f}{statistics.median(warm):>14.3f}{p99:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Throughput and tail latency of propagate_many over a watchlist at several concurrency caps.
+
+Run from the trading-squad directory:
+    python -m benchmarks.propagate_many_benchmark
+    python -m benchmarks.propagate_many_benchmark --jobs 500 --concurrency 16,64,128
+
+TradingAgentsGraph's apropagate and propagate_many run on the simulated
+chat model and tools of analyst_fanout_benchmark (state logging aside).
+Every --fail-every-th ticker raises before its run starts: those jobs must
+come back with their error and every other job with a decision. The LLM
+column is the most LLM calls seen in flight at once, which must stay
+within --llm-cap (llm_max_concurrency for the provider).
+"""
+
+import argparse
+
+from benchmarks.analyst_fanout_benchmark import SimulatedChatModel, build_graph
+from tradingagents.dataflows.config import freeze_config
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.signal_processing import SignalProcessor
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+class CountingChatModel(SimulatedChatModel):
+    """Counts the calls in flight across every copy (bind_tools) of the model."""
+
+    counter: dict
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.counter["now"] += 1
+        self.counter["peak"] = max(self.counter["peak"], self.counter["now"])
+        try:
+            return await super()._agenerate(messages, stop, run_manager, **kwargs)
+        finally:
+            self.counter["now"] -= 1
+
+
+class SimulatedTradingGraph:
+    """The async runs of TradingAgentsGraph over the simulated graph."""
+
+    propagate_many = TradingAgentsGraph.propagate_many
+    aprocess_signal = TradingAgentsGraph.aprocess_signal
+
+    def __init__(self, args):
+        llm = CountingChatModel(latency=args.llm_latency, counter={"now": 0, "peak": 0})
+        # The model holds its own copy of the dict, shared by its bound copies
+        self.counter = llm.counter
+        self.debug = False
+        self.config = freeze_config(
+            {
+                "llm_provider": "openai",
+                "llm_max_concurrency": {"openai": args.llm_cap},
+                "embedding_backend": "hashing",
+                "memory_store": "numpy",
+            }
+        )
+        self.graph = build_graph("parallel", args, llm)
+        self.propagator = Propagator()
+        self.signal_processor = SignalProcessor(llm)
+        self.fail_every = args.fail_every
+
+    async def apropagate(self, company_name, trade_date):
+        if int(company_name[1:]) % self.fail_every == 0:
+            raise RuntimeError(f"simulated failure for {company_name}")
+        return await TradingAgentsGraph.apropagate(self, company_name, trade_date)
+
+    def _log_state(self, trade_date, final_state):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--concurrency", default="4,16,64")
+    parser.add_argument("--llm-cap", type=int, default=32)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--tool-latency", type=float, default=0.1)
+    parser.add_argument("--fail-every", type=int, default=25)
+    args = parser.parse_args()
+
+    jobs = [(f"T{i:04d}", "2025-01-02") for i in range(1, args.jobs + 1)]
+    expected_failures = args.jobs // args.fail_every
+
+    print(
+        f"{args.jobs} jobs, LLM call {args.llm_latency:.2f} s, tool call "
+        f"{args.tool_latency:.2f} s, LLM cap {args.llm_cap}, "
+        f"{expected_failures} failing"
+    )
+    print(
+        f"{'runs':>5}{'runs/min':>10}{'p50 s':>8}{'p90 s':>8}{'p99 s':>8}"
+        f"{'max s':>8}{'LLM':>6}"
+    )
+    for max_concurrency in map(int, args.concurrency.split(",")):
+        graph = SimulatedTradingGraph(args)
+        batch = graph.propagate_many(jobs, max_concurrency)
+        results = list(batch)
+
+        failed = [result for result in results if result.error is not None]
+        if len(results) != args.jobs or len(failed) != expected_failures:
+            raise SystemExit(
+                f"{len(results)} results, {len(failed)} failed: expected "
+                f"{args.jobs} and {expected_failures}"
+            )
+        if any(result.decision is None for result in results if not result.error):
+            raise SystemExit("a run without an error has no decision")
+        if graph.counter["peak"] > args.llm_cap:
+            raise SystemExit(f"{graph.counter['peak']} LLM calls in flight")
+
+        stats = batch.stats
+        print(
+            f"{max_concurrency:>5}{stats.runs_per_minute:>10.0f}"
+            f"{stats.latency_p50:>8.2f}{stats.latency_p90:>8.2f}"
+            f"{stats.latency_p99:>8.2f}{stats.latency_max:>8.2f}"
+            f"{graph.counter['peak']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Compare SimFin as-of lookup latency: filtering the full bulk CSV vs the per-ticker store.
+
+Run from the trading-squad directory:
+    python -m benchmarks.simfin_store_benchmark
+    python -m benchmarks.simfin_store_benchmark --tickers 2000 --quarters 60
+
+The synthetic bulk file has quarterly statements per ticker, some published
+on the same day (ties), some rows without a Publish Date, and one ticker
+whose rows have none at all. Every lookup must return the same statement
+as the pre-store code path, or None where it found nothing.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from tradingagents.dataflows.simfin_store import (
+    get_simfin_statement_as_of,
+    simfin_csv_path,
+)
+
+
+def write_synthetic_csv(data_dir, tickers, quarters, seed=0):
+    """Write a quarterly us-balance CSV; returns the ticker symbols."""
+    rng = np.random.default_rng(seed)
+    symbols = [f"T{i:04d}" for i in range(tickers)]
+    rows = []
+    for simfin_id, symbol in enumerate(symbols):
+        report_dates = pd.date_range("2008-03-31", periods=quarters, freq="QE")
+        for report_date in report_dates:
+            publish_date = report_date + pd.Timedelta(days=int(rng.integers(20, 60)))
+            rows.append(
+                {
+                    "Ticker": symbol,
+                    "SimFinId": simfin_id,
+                    "Currency": "USD",
+                    "Fiscal Year": report_date.year,
+                    "Fiscal Period": f"Q{report_date.quarter}",
+                    "Report Date": report_date.strftime("%Y-%m-%d"),
+                    "Publish Date": publish_date.strftime("%Y-%m-%d"),
+                    "Total Assets": float(rng.integers(1_000, 1_000_000)),
+                    "Total Equity": float(rng.integers(100, 100_000)),
+                }
+            )
+    frame = pd.DataFrame(rows)
+    # Restatements published the same day as the original: ties
+    ties = frame.sample(frac=0.02, random_state=seed).assign(**{"Total Assets": -1.0})
+    frame = pd.concat([frame, ties]).sample(frac=1.0, random_state=seed)
+    # Rows without a Publish Date, and a ticker that has nothing else
+    frame.loc[frame.sample(frac=0.02, random_state=seed + 1).index, "Publish Date"] = ""
+    frame.loc[frame["Ticker"] == symbols[-1], "Publish Date"] = ""
+
+    path = simfin_csv_path(data_dir, "balance_sheet", "quarterly")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    frame.to_csv(path, sep=";", index=False)
+    return symbols
+
+
+def csv_as_of(path, ticker, curr_date):
+    """The pre-store code path: parse the full file, filter, take idxmax."""
+    df = pd.read_csv(path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    if filtered_df.empty:
+        return None
+    return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--quarters", type=int, default=60)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as data_dir:
+        symbols = write_synthetic_csv(data_dir, args.tickers, args.quarters)
+        path = simfin_csv_path(data_dir, "balance_sheet", "quarterly")
+        dates = pd.date_range("2007-01-01", "2024-12-31").strftime("%Y-%m-%d")
+
+        start = time.perf_counter()
+        get_simfin_statement_as_of(
+            symbols[0], "balance_sheet", "quarterly", dates[0], data_dir
+        )
+        build_s = time.perf_counter() - start
+
+        lookups = [
+            (symbols[i], dates[j])
+            for i, j in zip(
+                rng.integers(0, len(symbols), args.lookups),
+                rng.integers(0, len(dates), args.lookups),
+            )
+        ] + [(symbols[-1], dates[-1])]
+        # The pre-store path parses the whole file per call: check a sample
+        mismatches = 0
+        for ticker, curr_date in lookups[: min(len(lookups), 40)] + lookups[-1:]:
+            expected = csv_as_of(path, ticker, curr_date)
+            actual = get_simfin_statement_as_of(
+                ticker, "balance_sheet", "quarterly", curr_date, data_dir
+            )
+            if expected is None or actual is None:
+                mismatches += (expected is None) != (actual is None)
+            elif not expected.equals(actual) or expected.name != actual.name:
+                mismatches += 1
+        if mismatches:
+            raise SystemExit(f"{mismatches} lookups differ from the full-file filter")
+
+        ticker, curr_date = lookups[0]
+        csv_s = timed(lambda: csv_as_of(path, ticker, curr_date), args.repeat)
+        store_s = timed(
+            lambda: [
+                get_simfin_statement_as_of(
+                    ticker, "balance_sheet", "quarterly", curr_date, data_dir
+                )
+                for ticker, curr_date in lookups
+            ],
+            args.repeat,
+        ) / len(lookups)
+
+    print(
+        f"{args.tickers} tickers x {args.quarters} quarters, "
+        f"rows without a Publish Date included: identical statements"
+    )
+    print(f"store build (once per CSV version): {build_s * 1000:.1f} ms")
+    print(f"{'path':<12}{'per lookup ms':>15}")
+    print(f"{'full CSV':<12}{csv_s * 1000:>15.2f}")
+    print(f"{'store':<12}{store_s * 1000:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
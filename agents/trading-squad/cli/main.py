@@ -19,6 +19,7 @@ from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
+from tradingagents.dataflows.config import config_context, iterate_in_context
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 
@@ -857,7 +858,10 @@ def run_analysis():
 
         # Stream the analysis
         trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
+        # The agents read graph.config as the run's config, as in propagate()
+        for chunk in iterate_in_context(
+            config_context(graph.config), graph.graph.stream(init_agent_state, **args)
+        ):
             if len(chunk["messages"]) > 0:
                 # Get the last message from the chunk
                 last_message = chunk["messages"][-1]
@@ -1,4 +1,5 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from tradingagents.agents.utils.agent_utils import agent_node
 
 
 def create_market_analyst(llm, toolkit):
@@ -71,7 +72,7 @@ Volume-Based Indicators:
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -83,4 +84,4 @@ Volume-Based Indicators:
             "market_report": report,
         }
 
-    return market_analyst_node
+    return agent_node(market_analyst_node)
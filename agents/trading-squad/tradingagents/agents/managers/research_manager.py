@@ -1,3 +1,6 @@
+from tradingagents.agents.utils.agent_utils import agent_node
+
+
 def create_research_manager(llm, memory):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
@@ -9,7 +12,15 @@ def create_research_manager(llm, memory):
         investment_debate_state = state["investment_debate_state"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = yield (
+            memory.get_memories,
+            dict(
+                current_situation=curr_situation,
+                n_matches=2,
+                ticker=state["company_of_interest"],
+                curr_date=state["trade_date"],
+            ),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -32,7 +43,7 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -48,4 +59,4 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    return agent_node(research_manager_node)
@@ -1,3 +1,6 @@
+from tradingagents.agents.utils.agent_utils import agent_node
+
+
 def create_risk_manager(llm, memory):
     def risk_manager_node(state) -> dict:
         company_name = state["company_of_interest"]
@@ -11,7 +14,15 @@ def create_risk_manager(llm, memory):
         trader_plan = state["investment_plan"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = yield (
+            memory.get_memories,
+            dict(
+                current_situation=curr_situation,
+                n_matches=2,
+                ticker=state["company_of_interest"],
+                curr_date=state["trade_date"],
+            ),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -38,7 +49,7 @@ Deliverables:
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -58,4 +69,4 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    return agent_node(risk_manager_node)
@@ -1,3 +1,6 @@
+from tradingagents.agents.utils.agent_utils import agent_node
+
+
 def create_bear_researcher(llm, memory):
     def bear_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
@@ -11,7 +14,15 @@ def create_bear_researcher(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = yield (
+            memory.get_memories,
+            dict(
+                current_situation=curr_situation,
+                n_matches=2,
+                ticker=state["company_of_interest"],
+                curr_date=state["trade_date"],
+            ),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -39,7 +50,7 @@ Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -53,4 +64,4 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    return agent_node(bear_node)
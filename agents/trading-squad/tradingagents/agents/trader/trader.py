@@ -1,5 +1,7 @@
 import functools
 
+from tradingagents.agents.utils.agent_utils import agent_node
+
 
 def create_trader(llm, memory):
     def trader_node(state, name):
@@ -11,7 +13,15 @@ def create_trader(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = yield (
+            memory.get_memories,
+            dict(
+                current_situation=curr_situation,
+                n_matches=2,
+                ticker=state["company_of_interest"],
+                curr_date=state["trade_date"],
+            ),
+        )
 
         past_memory_str = ""
         if past_memories:
@@ -33,7 +43,7 @@ def create_trader(llm, memory):
             context,
         ]
 
-        result = llm.invoke(messages)
+        result = yield llm, messages
 
         return {
             "messages": [result],
@@ -41,4 +51,4 @@ def create_trader(llm, memory):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return agent_node(functools.partial(trader_node, name="Trader"))
@@ -1,10 +1,14 @@
+import asyncio
+import functools
 from datetime import datetime
 from typing import Annotated
 
 import tradingagents.dataflows.interface as interface
 from langchain_core.messages import HumanMessage, RemoveMessage
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_core.tools import tool
-from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.config import freeze_config
+from tradingagents.dataflows.llm_limits import llm_slot
 
 
 def create_msg_delete():
@@ -23,24 +27,94 @@ def create_msg_delete():
     return delete_messages
 
 
-class Toolkit:
-    _config = DEFAULT_CONFIG.copy()
+def _call(target, value):
+    if isinstance(target, Runnable):
+        return target.invoke(value)
+    return target(**value)
+
+
+async def _acall(target, value):
+    if isinstance(target, Runnable):
+        async with llm_slot():
+            return await target.ainvoke(value)
+    # Blocking helpers (e.g. memory lookups) run off the event loop
+    return await asyncio.to_thread(target, **value)
+
+
+def agent_node(step):
+    """
+    Make a graph node, runnable with both graph.invoke and graph.ainvoke, from
+    a generator function of the state.
+
+    The generator yields each call it needs as (runnable, input), e.g. its LLM
+    and the prompt, or as (function, keyword arguments) for a blocking helper
+    such as a memory lookup. It is sent the result and returns the state
+    update. Sync runs make the calls directly; async runs await ainvoke,
+    within a slot of the provider's llm_max_concurrency, and move blocking
+    helpers to a thread, so an agent's prompt logic is written once for both.
+    """
+
+    def node(state):
+        steps = step(state)
+        try:
+            call = next(steps)
+            while True:
+                call = steps.send(_call(*call))
+        except StopIteration as stop:
+            return stop.value
+
+    async def anode(state):
+        steps = step(state)
+        try:
+            call = next(steps)
+            while True:
+                call = steps.send(await _acall(*call))
+        except StopIteration as stop:
+            return stop.value
+
+    return RunnableLambda(node, afunc=anode)
+
 
-    @classmethod
-    def update_config(cls, config):
-        """Update the class-level configuration."""
-        cls._config.update(config)
+def _with_coroutine(coroutine):
+    """Give a tool a native async implementation, run by ainvoke and async ToolNodes."""
+
+    def decorator(structured_tool):
+        structured_tool.coroutine = coroutine
+        return structured_tool
+
+    return decorator
+
+
+def _offloaded(structured_tool):
+    """
+    Give a tool with pandas / disk bound work an async implementation that
+    runs its sync body on a worker thread, so the event loop stays free.
+    """
+    func = structured_tool.func
+
+    @functools.wraps(func)
+    async def coroutine(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    structured_tool.coroutine = coroutine
+    return structured_tool
+
+
+class Toolkit:
+    def update_config(self, config):
+        """Apply custom values on top of this toolkit's configuration."""
+        self._config = freeze_config({**self._config, **config})
 
     @property
     def config(self):
-        """Access the configuration."""
+        """Access the configuration (read-only, owned by this toolkit)."""
         return self._config
 
     def __init__(self, config=None):
-        if config:
-            self.update_config(config)
+        self._config = freeze_config(config)
 
     @staticmethod
+    @_offloaded
     @tool
     def get_reddit_news(
         curr_date: Annotated[str, "Date you want to get news for in yyyy-mm-dd format"],
@@ -58,6 +132,7 @@ class Toolkit:
         return global_news_result
 
     @staticmethod
+    @_offloaded
     @tool
     def get_finnhub_news(
         ticker: Annotated[
@@ -90,6 +165,7 @@ class Toolkit:
         return finnhub_news_result
 
     @staticmethod
+    @_offloaded
     @tool
     def get_reddit_stock_info(
         ticker: Annotated[
@@ -112,6 +188,7 @@ class Toolkit:
         return stock_news_results
 
     @staticmethod
+    @_offloaded
     @tool
     def get_YFin_data(
         symbol: Annotated[str, "ticker symbol of the company"],
@@ -133,6 +210,7 @@ class Toolkit:
         return result_data
 
     @staticmethod
+    @_offloaded
     @tool
     def get_YFin_data_online(
         symbol: Annotated[str, "ticker symbol of the company"],
@@ -154,6 +232,7 @@ class Toolkit:
         return result_data
 
     @staticmethod
+    @_offloaded
     @tool
     def get_stockstats_indicators_report(
         symbol: Annotated[str, "ticker symbol of the company"],
@@ -183,6 +262,7 @@ class Toolkit:
         return result_stockstats
 
     @staticmethod
+    @_offloaded
     @tool
     def get_stockstats_indicators_report_online(
         symbol: Annotated[str, "ticker symbol of the company"],
@@ -212,6 +292,7 @@ class Toolkit:
         return result_stockstats
 
     @staticmethod
+    @_offloaded
     @tool
     def get_finnhub_company_insider_sentiment(
         ticker: Annotated[str, "ticker symbol for the company"],
@@ -236,6 +317,7 @@ class Toolkit:
         return data_sentiment
 
     @staticmethod
+    @_offloaded
     @tool
     def get_finnhub_company_insider_transactions(
         ticker: Annotated[str, "ticker symbol"],
@@ -260,6 +342,7 @@ class Toolkit:
         return data_trans
 
     @staticmethod
+    @_offloaded
     @tool
     def get_simfin_balance_sheet(
         ticker: Annotated[str, "ticker symbol"],
@@ -284,6 +367,7 @@ class Toolkit:
         return data_balance_sheet
 
     @staticmethod
+    @_offloaded
     @tool
     def get_simfin_cashflow(
         ticker: Annotated[str, "ticker symbol"],
@@ -308,6 +392,7 @@ class Toolkit:
         return data_cashflow
 
     @staticmethod
+    @_offloaded
     @tool
     def get_simfin_income_stmt(
         ticker: Annotated[str, "ticker symbol"],
@@ -334,6 +419,34 @@ class Toolkit:
         return data_income_stmt
 
     @staticmethod
+    @_offloaded
+    @tool
+    def get_simfin_fundamental_ratios(
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve key figures and ratios (margins, free cash flow, leverage, liquidity) from a company's most recent financial statements
+        Args:
+            ticker (str): ticker symbol of the company
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+                str: a compact report of the company's key fundamentals and ratios
+        """
+
+        data_ratios = interface.get_simfin_fundamental_ratios(ticker, freq, curr_date)
+
+        return data_ratios
+
+    @staticmethod
+    @_with_coroutine(
+        lambda query, curr_date: interface.aget_google_news(query, curr_date, 7)
+    )
     @tool
     def get_google_news(
         query: Annotated[str, "Query to search with"],
@@ -354,6 +467,7 @@ class Toolkit:
         return google_news_results
 
     @staticmethod
+    @_with_coroutine(interface.aget_stock_news_openai)
     @tool
     def get_stock_news_openai(
         ticker: Annotated[str, "the company's ticker"],
@@ -373,6 +487,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
+    @_with_coroutine(interface.aget_global_news_openai)
     @tool
     def get_global_news_openai(
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -390,6 +505,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
+    @_with_coroutine(interface.aget_fundamentals_openai)
     @tool
     def get_fundamentals_openai(
         ticker: Annotated[str, "the company's ticker"],
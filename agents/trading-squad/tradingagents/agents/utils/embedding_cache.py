@@ -0,0 +1,157 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from typing import Annotated, Dict, List, Optional, Tuple
+
+_caches: Dict[Optional[str], "EmbeddingCache"] = {}
+_caches_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, digest)
+);
+"""
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Embeddings keyed by (model, sha256(text)), shared by the agent memories.
+
+    The most recently used max_entries vectors are kept in process. With
+    sqlite_path set, every embedding is also stored (as float32) in a SQLite
+    file, so later processes skip the embeddings API for texts they have
+    seen. Hits are counted per model, split into memory and disk hits.
+    """
+
+    def __init__(
+        self,
+        max_entries: Annotated[int, "vectors kept in process"] = 4096,
+        sqlite_path: Annotated[Optional[str], "optional SQLite backing file"] = None,
+    ):
+        self.max_entries = max_entries
+        self.sqlite_path = sqlite_path
+        self.memory_hits: Counter = Counter()
+        self.disk_hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connection(self):
+        if self._db is None:
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self.sqlite_path)), exist_ok=True
+            )
+            self._db = sqlite3.connect(
+                self.sqlite_path, timeout=30, check_same_thread=False
+            )
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _remember(self, key, embedding):
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Cached embedding of text under model, or None on a miss."""
+        return self.get_many(model, [text])[0]
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Cached embeddings of texts under model, None for each miss."""
+        keys = [(model, text_digest(text)) for text in texts]
+        embeddings: List[Optional[List[float]]] = []
+        with self._lock:
+            for key in keys:
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    self.memory_hits[model] += 1
+                elif self.sqlite_path:
+                    row = (
+                        self._connection()
+                        .execute(
+                            "SELECT vector FROM embeddings "
+                            "WHERE model = ? AND digest = ?",
+                            key,
+                        )
+                        .fetchone()
+                    )
+                    if row is not None:
+                        vector = array("f")
+                        vector.frombytes(row[0])
+                        embedding = vector.tolist()
+                        self._remember(key, embedding)
+                        self.disk_hits[model] += 1
+                if embedding is None:
+                    self.misses[model] += 1
+                embeddings.append(embedding)
+        return embeddings
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        self.put_many(model, [text], [embedding])
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]):
+        """Store embeddings of texts; disk writes share one transaction."""
+        keys = [(model, text_digest(text)) for text in texts]
+        with self._lock:
+            for key, embedding in zip(keys, embeddings):
+                self._remember(key, embedding)
+            if self.sqlite_path:
+                db = self._connection()
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, digest, vector) "
+                        "VALUES (?, ?, ?)",
+                        (
+                            (*key, array("f", embedding).tobytes())
+                            for key, embedding in zip(keys, embeddings)
+                        ),
+                    )
+
+    def clear(self):
+        """Drop the in-process entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits.clear()
+            self.disk_hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Memory hits, disk hits, misses and hit rate per model."""
+        with self._lock:
+            models = set(self.memory_hits) | set(self.disk_hits) | set(self.misses)
+            stats = {}
+            for model in sorted(models):
+                hits = self.memory_hits[model] + self.disk_hits[model]
+                stats[model] = {
+                    "memory_hits": self.memory_hits[model],
+                    "disk_hits": self.disk_hits[model],
+                    "misses": self.misses[model],
+                    "hit_rate": hits / (hits + self.misses[model]),
+                }
+            return stats
+
+
+def get_embedding_cache(
+    max_entries: Annotated[int, "vectors kept in process"] = 4096,
+    sqlite_path: Annotated[Optional[str], "optional SQLite backing file"] = None,
+) -> EmbeddingCache:
+    """Return the process-wide embedding cache for a backing file (or none)."""
+    with _caches_lock:
+        cache = _caches.get(sqlite_path)
+        if cache is None:
+            cache = _caches[sqlite_path] = EmbeddingCache(max_entries, sqlite_path)
+        cache.max_entries = max_entries
+    return cache
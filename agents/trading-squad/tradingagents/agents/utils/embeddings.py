@@ -0,0 +1,104 @@
+"""
+Embedding backends for the agent memories.
+
+"openai" calls an OpenAI-compatible embeddings endpoint (text-embedding-3-small,
+or nomic-embed-text on a local Ollama). "hashing" is a local CPU backend:
+hashed, sublinearly weighted unigram and bigram counts, so memory works with
+no network at all. Select one with the embedding_backend config setting.
+"""
+
+import functools
+import re
+import zlib
+from collections import Counter
+from typing import Annotated, Callable, Dict, List, Optional
+
+import numpy as np
+from tradingagents.dataflows.openai_clients import get_openai_client
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+
+# Very common words carry no signal about the market situation
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were which will with".split()
+)
+
+
+class OpenAIEmbedder:
+    """Embeddings from an OpenAI-compatible endpoint."""
+
+    # Results are worth caching: every call is a network round trip
+    cacheable = True
+
+    def __init__(self, config):
+        if config["backend_url"] == "http://localhost:11434/v1":
+            self.name = "nomic-embed-text"
+        else:
+            self.name = "text-embedding-3-small"
+        self.client = get_openai_client(config["backend_url"])
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.name, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _feature(term, dim):
+    """Bucket and sign of a term; crc32 keeps them stable across processes."""
+    digest = zlib.crc32(term.encode("utf-8"))
+    return digest % dim, 1.0 if digest & (1 << 31) else -1.0
+
+
+class HashingEmbedder:
+    """
+    Local embeddings by feature hashing.
+
+    Unigrams and bigrams of the lowercased text (numbers kept, stop words
+    dropped) are hashed into `dim` signed buckets and weighted 1 + log(tf);
+    the vector is L2-normalized. There is no corpus-wide IDF, so stored
+    vectors never change as memories are added.
+    """
+
+    cacheable = False
+
+    def __init__(
+        self,
+        config=None,
+        dim: Annotated[Optional[int], "embedding width"] = None,
+    ):
+        self.dim = dim or (config or {}).get("embedding_dim", 1024)
+        self.name = f"hashing-{self.dim}"
+
+    def embed_one(self, text: str) -> np.ndarray:
+        tokens = [t for t in _TOKEN.findall(text.lower()) if t not in _STOP_WORDS]
+        terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        counts = Counter(terms)
+        if not counts:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        features = [_feature(term, self.dim) for term in counts]
+        buckets = np.fromiter((bucket for bucket, _ in features), dtype=np.int64)
+        weights = np.fromiter((sign for _, sign in features), dtype=np.float64)
+        weights *= 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float64))
+        vector = np.bincount(buckets, weights=weights, minlength=self.dim)
+        vector = vector.astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_one(text).tolist() for text in texts]
+
+
+EMBEDDING_BACKENDS: Dict[str, Callable] = {
+    "openai": OpenAIEmbedder,
+    "hashing": HashingEmbedder,
+}
+
+
+def get_embedder(config):
+    """Return an embedder for the embedding_backend config setting."""
+    name = config.get("embedding_backend", "openai")
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend: {name}")
+    return EMBEDDING_BACKENDS[name](config)
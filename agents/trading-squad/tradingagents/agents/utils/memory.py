@@ -1,51 +1,479 @@
-import chromadb
-from chromadb.config import Settings
-from openai import OpenAI
+import itertools
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+import numpy as np
+from tradingagents.dataflows.config import use_config
+from tradingagents.dataflows.interface import get_market_state_features
+from tradingagents.dataflows.market_features import MARKET_FEATURES
+
+from .embedding_cache import get_embedding_cache
+from .embeddings import get_embedder
+from .vector_store import FeatureIndex, NumpyCollection
+
+_services: Dict[Tuple, "MemoryService"] = {}
+_services_lock = threading.Lock()
+
+# Settings that select a memory service; other config entries don't matter
+SERVICE_CONFIG_KEYS = (
+    "backend_url",
+    "results_dir",
+    "data_cache_dir",
+    "embedding_backend",
+    "embedding_dim",
+    "embedding_cache_enabled",
+    "embedding_cache_size",
+    "embedding_cache_disk",
+    "embedding_batch_size",
+    "embedding_max_concurrency",
+    "memory_store",
+    "memory_persist",
+    "memory_dir",
+)
+
+# Ways get_memories can match the current situation (memory_retrieval)
+MEMORY_RETRIEVAL_MODES = ("text", "features", "hybrid")
+
+
+def memory_dir(config):
+    """Directory of the persistent memory store."""
+    return config.get("memory_dir") or os.path.join(config["results_dir"], "memory")
+
+
+class MemoryService:
+    """
+    The embedding pipeline and vector store shared by every agent memory.
+
+    Each memory (bull, bear, trader, ...) is a namespace: a collection in
+    one store client. Embeddings go through one embedder and the shared
+    embedding cache. Use get_memory_service() for the process-wide instance
+    of a configuration, so graphs built per run share it instead of
+    opening new clients.
+    """
+
+    def __init__(self, config):
+        self.embedder = get_embedder(config)
+        self.embedding = self.embedder.name
+        self.batch_size = config.get("embedding_batch_size", 64)
+        self.max_concurrency = config.get("embedding_max_concurrency", 4)
+        self.store = config.get("memory_store", "chroma")
+        self.persist_dir = (
+            memory_dir(config) if config.get("memory_persist", False) else None
+        )
+
+        # Every memory of a run embeds the same situation text; the shared
+        # cache makes that one API call instead of five
+        self.embedding_cache = None
+        if self.embedder.cacheable and config.get("embedding_cache_enabled", True):
+            sqlite_path = None
+            if config.get("embedding_cache_disk", True):
+                sqlite_path = os.path.join(
+                    config["data_cache_dir"], "embeddings.sqlite"
+                )
+            self.embedding_cache = get_embedding_cache(
+                config.get("embedding_cache_size", 4096), sqlite_path
+            )
+
+        self._client = None
+        self._collections = {}
+        self._feature_indexes = {}
+        self._namespace_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _chroma_client(self):
+        import chromadb
+        from chromadb.config import Settings
+
+        if self.persist_dir:
+            # Warm start: embeddings learned in earlier runs are reloaded from
+            # disk instead of being recomputed
+            return chromadb.PersistentClient(
+                path=self.persist_dir,
+                settings=Settings(allow_reset=True, anonymized_telemetry=False),
+            )
+        return chromadb.Client(Settings(allow_reset=True))
+
+    def collection(self, namespace):
+        """The collection holding one memory's situations."""
+        with self._lock:
+            collection = self._collections.get(namespace)
+            if collection is None:
+                if self.store == "numpy":
+                    collection = NumpyCollection(namespace, self.persist_dir)
+                else:
+                    if self._client is None:
+                        self._client = self._chroma_client()
+                    collection = self._client.get_or_create_collection(name=namespace)
+                self._collections[namespace] = collection
+            return collection
+
+    def feature_index(self, namespace):
+        """The market state feature index of one memory's situations."""
+        with self._lock:
+            index = self._feature_indexes.get(namespace)
+            if index is None:
+                index = FeatureIndex(f"{namespace}_features", self.persist_dir)
+                self._feature_indexes[namespace] = index
+            return index
+
+    def namespace_lock(self, namespace):
+        """Lock serializing maintenance (compaction) of one namespace."""
+        with self._lock:
+            return self._namespace_locks.setdefault(namespace, threading.Lock())
+
+    @staticmethod
+    def new_ids(count):
+        """Unique entry ids, safe to allocate from concurrent runs."""
+        return [uuid.uuid4().hex for _ in range(count)]
+
+    def get_embeddings(self, texts):
+        """
+        Get embeddings for a list of texts, in order. Texts missing from the
+        embedding cache are deduplicated and sent in batches of
+        embedding_batch_size, with up to embedding_max_concurrency requests
+        in flight.
+        """
+        embeddings = [None] * len(texts)
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.get_many(self.embedding, texts)
+
+        missing = {}
+        for i, (text, embedding) in enumerate(zip(texts, embeddings)):
+            if embedding is None:
+                missing.setdefault(text, []).append(i)
+        if not missing:
+            return embeddings
+
+        unique = list(missing)
+        batches = [
+            unique[start : start + self.batch_size]
+            for start in range(0, len(unique), self.batch_size)
+        ]
+        if len(batches) == 1:
+            results = [self.embedder.embed(batches[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as pool:
+                results = list(pool.map(self.embedder.embed, batches))
+
+        for batch, vectors in zip(batches, results):
+            if self.embedding_cache is not None:
+                self.embedding_cache.put_many(self.embedding, batch, vectors)
+            for text, vector in zip(batch, vectors):
+                for i in missing[text]:
+                    embeddings[i] = vector
+        return embeddings
+
+
+def get_memory_service(config) -> MemoryService:
+    """Return the process-wide memory service for a configuration."""
+    key = tuple(config.get(name) for name in SERVICE_CONFIG_KEYS)
+    service = _services.get(key)
+    if service is None:
+        with _services_lock:
+            service = _services.get(key)
+            if service is None:
+                service = _services[key] = MemoryService(config)
+    return service
+
+
+def summarize_situation(situation, max_chars=1200):
+    """
+    Extractive summary of a situation: the lead sentence of each paragraph
+    of the analyst reports, up to max_chars.
+    """
+    leads = []
+    size = 0
+    for paragraph in situation.split("\n\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        lead = re.split(r"(?<=[.!?])\s", paragraph, maxsplit=1)[0]
+        if size + len(lead) > max_chars:
+            break
+        leads.append(lead)
+        size += len(lead) + 1
+    return "\n".join(leads) or situation[:max_chars]
+
+
+def retention_scores(metadatas, half_life):
+    """
+    How much each entry is worth keeping: recency halves every half_life
+    newer entries, and is weighted up by the size of the trade outcome and
+    by the number of situations an entry stands for.
+    """
+    created = np.array([m.get("created_at", 0.0) for m in metadatas])
+    rank = np.empty(len(created))
+    rank[np.argsort(-created, kind="stable")] = np.arange(len(created))
+    outcome = np.abs([m.get("outcome", 0.0) for m in metadatas])
+    merged = np.array([m.get("merged", 1) for m in metadatas], dtype=float)
+    return 0.5 ** (rank / half_life) * (1 + np.log1p(outcome)) * (1 + np.log(merged))
 
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
-        if config["backend_url"] == "http://localhost:11434/v1":
-            self.embedding = "nomic-embed-text"
-        else:
-            self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.get_or_create_collection(
-            name=name
-        )
+        # Cheap: the client, embedder and cache belong to the shared service
+        self.name = name
+        self.service = get_memory_service(config)
+        self.embedding_cache = self.service.embedding_cache
+        self.situation_collection = self.service.collection(name)
+        self.max_entries = config.get("memory_max_entries", 1000)
+        self.compaction_threshold = config.get("memory_compaction_threshold", 0.95)
+        self.half_life = config.get("memory_half_life_entries", 250)
+
+        self.config = config
+        self.retrieval = config.get("memory_retrieval", "text")
+        if self.retrieval not in MEMORY_RETRIEVAL_MODES:
+            raise ValueError(f"Unknown memory retrieval mode: {self.retrieval}")
+        self.feature_weight = config.get("memory_feature_weight", 0.5)
+        self.feature_index = self.service.feature_index(name)
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
+        """Get the embedding for a text, from the embedding cache if seen before"""
+        return self.service.get_embeddings([text])[0]
 
-        response = self.client.embeddings.create(model=self.embedding, input=text)
-        return response.data[0].embedding
+    def get_embeddings(self, texts):
+        """Get embeddings for a list of texts, in order (see MemoryService)"""
+        return self.service.get_embeddings(texts)
 
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+    def market_features(self, ticker, curr_date):
+        """Market state features of ticker on curr_date, or None if unavailable"""
+        if self.retrieval == "text" or not ticker or not curr_date:
+            return None
+        try:
+            with use_config(self.config):
+                return get_market_state_features(
+                    ticker, curr_date, self.config["online_tools"]
+                )
+        except Exception as e:
+            print(f"No market state features for {ticker} on {curr_date}: {e}")
+            return None
 
-        situations = []
-        advice = []
-        ids = []
-        embeddings = []
+    def add_situations(
+        self, situations_and_advice, outcome=None, ticker=None, curr_date=None
+    ):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec); outcome is the returns / losses they led to, if known. With ticker and curr_date, the market state on that day is indexed for the situations (unless memory_retrieval is "text")"""
 
-        offset = self.situation_collection.count()
+        situations = [situation for situation, _ in situations_and_advice]
+        advice = [recommendation for _, recommendation in situations_and_advice]
+        if not situations:
+            return
 
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
-            situations.append(situation)
-            advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+        ids = self.service.new_ids(len(situations))
+        embeddings = self.get_embeddings(situations)
+
+        metadata = {"created_at": time.time()}
+        try:
+            metadata["outcome"] = float(outcome)
+        except (TypeError, ValueError):
+            pass
 
         self.situation_collection.add(
             documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
+            metadatas=[{"recommendation": rec, **metadata} for rec in advice],
             embeddings=embeddings,
             ids=ids,
         )
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
+        features = self.market_features(ticker, curr_date)
+        if features is not None:
+            self.feature_index.add(ids, np.tile(features, (len(ids), 1)))
+
+        if self.max_entries and self.situation_collection.count() > self.max_entries:
+            self.compact()
+
+    def compact(self, similarity_threshold=None, max_entries=None):
+        """
+        Bound this memory: merge near-duplicate situations and evict the
+        least valuable entries.
+
+        Entries are visited by retention score (see retention_scores); each
+        absorbs the unvisited entries whose embeddings have cosine similarity
+        >= similarity_threshold with it, keeping its own embedding and
+        recommendation. Every kept situation is replaced by its extractive
+        summary; retrieval still uses the embedding of the full text. If
+        more than max_entries remain, the lowest scoring are evicted down
+        to 90% of max_entries. Returns (merged, evicted) counts.
+        """
+        if similarity_threshold is None:
+            similarity_threshold = self.compaction_threshold
+        if max_entries is None:
+            max_entries = self.max_entries
+
+        with self.service.namespace_lock(self.name):
+            entries = self.situation_collection.get(
+                include=["embeddings", "documents", "metadatas"]
+            )
+            ids, documents = entries["ids"], entries["documents"]
+            metadatas = [dict(m) for m in entries["metadatas"]]
+            if not ids:
+                return 0, 0
+
+            vectors = np.asarray(entries["embeddings"], dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms > 0, norms, 1.0)
+
+            scores = retention_scores(metadatas, self.half_life)
+            visited = np.zeros(len(ids), dtype=bool)
+            kept = []
+            absorbed = set()
+            for i in np.argsort(-scores, kind="stable"):
+                if visited[i]:
+                    continue
+                visited[i] = True
+                similar = np.flatnonzero(
+                    ~visited & (vectors @ vectors[i] >= similarity_threshold)
+                )
+                visited[similar] = True
+                if len(similar):
+                    absorbed.add(i)
+                for j in similar:
+                    metadatas[i]["merged"] = metadatas[i].get("merged", 1) + (
+                        metadatas[j].get("merged", 1)
+                    )
+                    metadatas[i]["created_at"] = max(
+                        metadatas[i].get("created_at", 0.0),
+                        metadatas[j].get("created_at", 0.0),
+                    )
+                kept.append(i)
+            merged = len(ids) - len(kept)
+
+            evicted = 0
+            if max_entries and len(kept) > max_entries:
+                kept_scores = retention_scores(
+                    [metadatas[i] for i in kept], self.half_life
+                )
+                order = np.argsort(-kept_scores, kind="stable")
+                target = int(max_entries * 0.9)
+                evicted = len(kept) - target
+                kept = [kept[i] for i in order[:target]]
+
+            # Summarize new entries; merged ones also carry updated metadata
+            rewrite = [
+                i for i in kept if i in absorbed or not metadatas[i].get("summarized")
+            ]
+            for i in rewrite:
+                if not metadatas[i].get("summarized"):
+                    documents[i] = summarize_situation(documents[i])
+                    metadatas[i]["summarized"] = True
+
+            kept_set = set(kept)
+            removed = [ids[i] for i in range(len(ids)) if i not in kept_set]
+            if removed or rewrite:
+                self.situation_collection.delete(
+                    ids=removed + [ids[i] for i in rewrite]
+                )
+            if removed:
+                self.feature_index.delete(removed)
+            if rewrite:
+                self.situation_collection.add(
+                    ids=[ids[i] for i in rewrite],
+                    embeddings=vectors[rewrite].tolist(),
+                    documents=[documents[i] for i in rewrite],
+                    metadatas=[metadatas[i] for i in rewrite],
+                )
+            return merged, evicted
+
+    def bulk_load(self, situations_and_advice, chunk_size=1024):
+        """
+        Add a large corpus of (situation, rec) pairs, e.g. historical lessons
+        read lazily from a file. The iterable is consumed chunk_size pairs at
+        a time, each chunk embedded in concurrent batches and written in one
+        add. Returns the number of pairs added.
+        """
+        iterator = iter(situations_and_advice)
+        added = 0
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return added
+            self.add_situations(chunk)
+            added += len(chunk)
+
+    def get_memories(self, current_situation, n_matches=1, ticker=None, curr_date=None):
+        """
+        Find matching recommendations. By default (memory_retrieval "text")
+        situations are matched by embedding similarity. Given the ticker and
+        date being traded, "features" matches the numeric market state
+        instead, with no embedding call, and "hybrid" ranks by
+        memory_feature_weight * feature similarity + the rest * text
+        similarity. Without market state features, text matching is used.
+        """
+        features = self.market_features(ticker, curr_date)
+        if features is None or not self.feature_index.count():
+            return self._text_memories(current_situation, n_matches)
+
+        if self.retrieval == "features":
+            ids, distances = self.feature_index.query(features, n_matches)
+            scores = self._feature_similarity(distances)
+        else:
+            ids, scores = self._hybrid_scores(current_situation, features, n_matches)
+
+        entries = self.situation_collection.get(
+            ids=ids, include=["documents", "metadatas"]
+        )
+        found = {
+            id_: (document, metadata)
+            for id_, document, metadata in zip(
+                entries["ids"], entries["documents"], entries["metadatas"]
+            )
+        }
+        return [
+            {
+                "matched_situation": found[id_][0],
+                "recommendation": found[id_][1]["recommendation"],
+                "similarity_score": float(score),
+            }
+            for id_, score in zip(ids, scores)
+            if id_ in found
+        ]
+
+    @staticmethod
+    def _feature_similarity(distances):
+        # Two unrelated market states are about sqrt(2 * features) apart in
+        # the scaled feature space; map that to ~0.37 and identical to 1
+        return np.exp(-np.square(distances) / (2 * len(MARKET_FEATURES)))
+
+    def _hybrid_scores(self, current_situation, features, n_matches):
+        """Top n_matches ids by combined feature and text similarity."""
+        n_candidates = max(4 * n_matches, 20)
+        feature_ids, distances = self.feature_index.query(features)
+        feature_scores = dict(zip(feature_ids, self._feature_similarity(distances)))
+
+        query = np.asarray(self.get_embedding(current_situation), dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+        results = self.situation_collection.query(
+            query_embeddings=[query.tolist()],
+            n_results=min(n_candidates, self.situation_collection.count()),
+            include=["distances"],
+        )
+        candidates = list(dict.fromkeys(results["ids"][0] + feature_ids[:n_candidates]))
+
+        # Cosine similarity from the stored embeddings, whatever distance the
+        # store ranks by
+        entries = self.situation_collection.get(ids=candidates, include=["embeddings"])
+        vectors = np.asarray(entries["embeddings"], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1)
+        text_scores = dict(
+            zip(entries["ids"], vectors @ query / np.where(norms > 0, norms, 1.0))
+        )
+
+        weight = self.feature_weight
+        scores = {
+            id_: weight * feature_scores.get(id_, 0.0) + (1 - weight) * text_score
+            for id_, text_score in text_scores.items()
+        }
+        ids = sorted(scores, key=scores.get, reverse=True)[:n_matches]
+        return ids, [scores[id_] for id_ in ids]
+
+    def _text_memories(self, current_situation, n_matches):
+        """Find matching recommendations by embedding similarity"""
         query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
@@ -0,0 +1,244 @@
+import json
+import os
+import threading
+import uuid
+from typing import Annotated, Dict, List, Optional
+
+import numpy as np
+
+
+class NumpyCollection:
+    """
+    Brute-force cosine search over a contiguous float32 matrix.
+
+    A drop-in for the part of the chromadb collection API the memories use
+    (count, add, get, delete, query). Rows are L2-normalized on insert, so a
+    query is one matrix-vector product plus an argpartition for the top k:
+    exact, and under a millisecond for collections of a few thousand entries.
+    Distances are cosine distances (1 - cosine similarity).
+
+    With a directory, the collection is persisted append-only: vectors go to
+    {name}.f32 and the rest of each entry to {name}.jsonl, and both are
+    reloaded on the next start. delete() rewrites both files.
+    """
+
+    def __init__(
+        self,
+        name: Annotated[str, "collection name"],
+        directory: Annotated[Optional[str], "persist under this directory"] = None,
+    ):
+        self.name = name
+        self.directory = directory
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict] = []
+        self._rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if directory:
+            self._load()
+
+    def _paths(self, suffix=""):
+        base = os.path.join(self.directory, self.name)
+        return f"{base}.f32{suffix}", f"{base}.jsonl{suffix}"
+
+    def _load(self):
+        vectors_path, entries_path = self._paths()
+        if not os.path.exists(entries_path):
+            return
+        with open(entries_path, "r") as f:
+            entries = [json.loads(line) for line in f if line.endswith("\n")]
+        if not entries:
+            return
+        dim = entries[0]["dim"]
+        vectors = np.fromfile(vectors_path, dtype=np.float32)
+        # A crash can leave one file ahead of the other; keep complete entries
+        rows = min(len(entries), len(vectors) // dim)
+        self._grow(rows, dim)
+        self._matrix[:rows] = vectors[: rows * dim].reshape(rows, dim)
+        self._size = rows
+        for entry in entries[:rows]:
+            self._ids.append(entry["id"])
+            self._documents.append(entry["document"])
+            self._metadatas.append(entry["metadata"])
+        self._rows = {id_: row for row, id_ in enumerate(self._ids)}
+
+    def _grow(self, rows, dim):
+        if self._matrix is None:
+            self._matrix = np.empty((max(rows, 64), dim), dtype=np.float32)
+        elif rows > len(self._matrix):
+            # Double the capacity so appends stay amortized O(1)
+            matrix = np.empty((max(rows, 2 * len(self._matrix)), dim), np.float32)
+            matrix[: self._size] = self._matrix[: self._size]
+            self._matrix = matrix
+
+    def count(self) -> int:
+        return self._size
+
+    def _prepare(self, embeddings):
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def add(self, ids, embeddings, documents, metadatas):
+        vectors = self._prepare(embeddings)
+
+        with self._lock:
+            start = self._size
+            self._grow(start + len(vectors), vectors.shape[1])
+            self._matrix[start : start + len(vectors)] = vectors
+            self._size += len(vectors)
+            self._ids.extend(ids)
+            self._rows.update(zip(ids, range(start, start + len(vectors))))
+            self._documents.extend(documents)
+            self._metadatas.extend(metadatas)
+
+            if self.directory:
+                self._write(self._paths(), "a", vectors, ids, documents, metadatas)
+
+    def _write(self, paths, mode, vectors, ids, documents, metadatas):
+        os.makedirs(self.directory, exist_ok=True)
+        vectors_path, entries_path = paths
+        with open(vectors_path, mode + "b") as f:
+            f.write(vectors.tobytes())
+        with open(entries_path, mode) as f:
+            for id_, document, metadata in zip(ids, documents, metadatas):
+                entry = {
+                    "id": id_,
+                    "dim": vectors.shape[1],
+                    "document": document,
+                    "metadata": metadata,
+                }
+                f.write(json.dumps(entry) + "\n")
+
+    def get(self, ids=None, include=None):
+        """Entries with the given ids in that order (all if None), embeddings normalized."""
+        with self._lock:
+            if ids is None:
+                rows = list(range(self._size))
+            else:
+                rows = [self._rows[id_] for id_ in ids if id_ in self._rows]
+            return {
+                "ids": [self._ids[i] for i in rows],
+                "embeddings": (
+                    self._matrix[rows].copy()
+                    if self._matrix is not None
+                    else np.empty((0, 0), np.float32)
+                ),
+                "documents": [self._documents[i] for i in rows],
+                "metadatas": [self._metadatas[i] for i in rows],
+            }
+
+    def delete(self, ids):
+        with self._lock:
+            removed = set(ids)
+            keep = [i for i, id_ in enumerate(self._ids) if id_ not in removed]
+            if len(keep) == self._size:
+                return
+            matrix = self._matrix[keep]
+            self._ids = [self._ids[i] for i in keep]
+            self._rows = {id_: row for row, id_ in enumerate(self._ids)}
+            self._documents = [self._documents[i] for i in keep]
+            self._metadatas = [self._metadatas[i] for i in keep]
+            self._size = len(keep)
+            self._matrix = None
+            self._grow(self._size, matrix.shape[1])
+            self._matrix[: self._size] = matrix
+
+            if self.directory:
+                # Write the survivors next to the old files, then swap them in
+                tmp_paths = self._paths(f".tmp-{os.getpid()}-{uuid.uuid4().hex}")
+                self._write(
+                    tmp_paths, "w", matrix, self._ids, self._documents, self._metadatas
+                )
+                for tmp_path, path in zip(tmp_paths, self._paths()):
+                    os.replace(tmp_path, path)
+
+    def query(self, query_embeddings, n_results=10, include=None):
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        with self._lock:
+            matrix = self._matrix[: self._size] if self._size else None
+            ids, documents, metadatas = self._ids, self._documents, self._metadatas
+
+        for query in query_embeddings:
+            if matrix is None:
+                top, distances = [], []
+            else:
+                query = np.asarray(query, dtype=np.float32)
+                norm = np.linalg.norm(query)
+                scores = matrix @ (query / norm if norm > 0 else query)
+                k = min(n_results, len(scores))
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+                distances = (1.0 - scores[top]).tolist()
+            results["ids"].append([ids[i] for i in top])
+            results["documents"].append([documents[i] for i in top])
+            results["metadatas"].append([metadatas[i] for i in top])
+            results["distances"].append(distances)
+        return results
+
+
+class FeatureIndex(NumpyCollection):
+    """
+    Exact k-nearest-neighbour search over numeric feature vectors, such as
+    the market state of each memory entry.
+
+    Vectors are stored as given. Each feature is scaled by its standard
+    deviation over the stored entries, so no single feature dominates, and
+    entries are ranked by Euclidean distance in that space. The scaled
+    matrix and its row norms are kept between queries, so a query is one
+    matrix-vector product: tens of microseconds for thousands of entries
+    of a couple dozen features, where a KD-tree would not pay for itself.
+    """
+
+    def __init__(
+        self,
+        name: Annotated[str, "index name"],
+        directory: Annotated[Optional[str], "persist under this directory"] = None,
+    ):
+        super().__init__(name, directory)
+        self._scaled = None
+
+    def _prepare(self, embeddings):
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def add(self, ids, features):
+        super().add(ids, features, [""] * len(ids), [{}] * len(ids))
+        with self._lock:
+            self._scaled = None
+
+    def delete(self, ids):
+        super().delete(ids)
+        with self._lock:
+            self._scaled = None
+
+    def _scaled_matrix(self):
+        if self._scaled is None:
+            matrix = self._matrix[: self._size]
+            scale = matrix.std(axis=0)
+            scale[scale == 0] = 1.0
+            scaled = matrix / scale
+            self._scaled = (scaled, np.einsum("ij,ij->i", scaled, scaled), scale)
+        return self._scaled
+
+    def query(self, features, n_results=None):
+        """
+        Ids and distances of the n_results entries nearest to features,
+        nearest first; every entry if n_results is None.
+        """
+        with self._lock:
+            if not self._size:
+                return [], np.empty(0, dtype=np.float32)
+            scaled, squared_norms, scale = self._scaled_matrix()
+            ids = self._ids
+
+        query = np.asarray(features, dtype=np.float32) / scale
+        squared = squared_norms - 2 * (scaled @ query) + query @ query
+        distances = np.sqrt(np.maximum(squared, 0.0))
+        if n_results is None or n_results >= len(distances):
+            top = np.argsort(distances, kind="stable")
+        else:
+            top = np.argpartition(distances, n_results - 1)[:n_results]
+            top = top[np.argsort(distances[top], kind="stable")]
+        return [ids[i] for i in top], distances[top]
@@ -1,4 +1,10 @@
+from .finnhub_store import FinnhubStore, get_finnhub_store
 from .finnhub_utils import get_data_in_range
+from .fundamentals import (
+    fundamental_ratios,
+    get_point_in_time_fundamentals,
+    get_point_in_time_statements,
+)
 from .googlenews_utils import getNewsData
 from .interface import (
     get_finnhub_company_insider_sentiment,
@@ -6,11 +12,13 @@ from .interface import (
     # News and sentiment functions
     get_finnhub_news,
     get_google_news,
+    get_market_state_features,
     get_reddit_company_news,
     get_reddit_global_news,
     # Financial statements functions
     get_simfin_balance_sheet,
     get_simfin_cashflow,
+    get_simfin_fundamental_ratios,
     get_simfin_income_statements,
     # Technical analysis functions
     get_stock_stats_indicators_window,
@@ -19,7 +27,9 @@ from .interface import (
     # Market data functions
     get_YFin_data_window,
 )
+from .price_store import PriceStore, get_price_store
 from .reddit_utils import fetch_top_from_category
+from .simfin_store import get_simfin_statement_as_of
 from .stockstats_utils import StockstatsUtils
 from .yfin_utils import YFinanceUtils
 
@@ -28,6 +38,8 @@ __all__ = [
     "get_finnhub_news",
     "get_finnhub_company_insider_sentiment",
     "get_finnhub_company_insider_transactions",
+    "FinnhubStore",
+    "get_finnhub_store",
     "get_google_news",
     "get_reddit_global_news",
     "get_reddit_company_news",
@@ -35,10 +47,20 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_fundamental_ratios",
+    "get_simfin_statement_as_of",
+    # Point-in-time fundamentals
+    "fundamental_ratios",
+    "get_point_in_time_fundamentals",
+    "get_point_in_time_statements",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
     "get_stockstats_indicator",
+    "get_market_state_features",
     # Market data functions
     "get_YFin_data_window",
     "get_YFin_data",
+    # Local price store
+    "PriceStore",
+    "get_price_store",
 ]
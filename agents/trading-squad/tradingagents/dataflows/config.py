@@ -1,35 +1,117 @@
-from typing import Dict, Optional
+"""
+Configuration read by the dataflows.
+
+Every analysis run gets its own read-only config: TradingAgentsGraph runs
+the graph in a context made by config_context(), and get_config() returns
+that run's config to everything the run reaches. That includes LangGraph
+nodes, tool calls on worker threads and asyncio tasks, which all copy the
+context. Concurrent runs with different settings therefore don't interfere.
+Outside a run, get_config() returns the process-wide default, which
+set_config() updates.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from types import MappingProxyType
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 
 import tradingagents.default_config as default_config
 
-# Use default config but allow it to be overridden
-_config: Optional[Dict] = None
-DATA_DIR: Optional[str] = None
+T = TypeVar("T")
+
+_default_config: Mapping = MappingProxyType(dict(default_config.DEFAULT_CONFIG))
+_run_config: ContextVar[Optional[Mapping]] = ContextVar("run_config", default=None)
+
+
+def freeze_config(config: Optional[Mapping] = None) -> Mapping:
+    """A read-only config: the defaults, overridden by config."""
+    return MappingProxyType({**default_config.DEFAULT_CONFIG, **(config or {})})
+
+
+def set_config(config: Mapping):
+    """Update the process-wide default configuration with custom values."""
+    global _default_config
+    _default_config = freeze_config({**_default_config, **config})
+
+
+def get_config() -> Mapping:
+    """
+    The current run's configuration, or the process-wide default outside a
+    run. The mapping is read-only and shared, not a copy.
+    """
+    return _run_config.get() or _default_config
+
+
+@contextmanager
+def use_config(config: Mapping) -> Iterator[Mapping]:
+    """Make config the current configuration inside the with block."""
+    token = _run_config.set(freeze_config(config))
+    try:
+        yield get_config()
+    finally:
+        _run_config.reset(token)
 
 
-def initialize_config():
-    """Initialize the configuration with default values."""
-    global _config, DATA_DIR
-    if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
-        DATA_DIR = _config["data_dir"]
+def config_context(config: Mapping) -> Context:
+    """A copy of the current context with config as the current configuration."""
+    context = copy_context()
+    context.run(_run_config.set, freeze_config(config))
+    return context
 
 
-def set_config(config: Dict):
-    """Update the configuration with custom values."""
-    global _config, DATA_DIR
-    if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
-    _config.update(config)
-    DATA_DIR = _config["data_dir"]
+def iterate_in_context(context: Context, iterable: Iterable[T]) -> Iterator[T]:
+    """
+    Iterate in context, which stays isolated from the caller between items.
+    Used for streamed runs, where a generator suspended at a yield must not
+    leak its configuration into the consumer's code.
+    """
+    iterator = context.run(iter, iterable)
+    while True:
+        try:
+            item = context.run(next, iterator)
+        except StopIteration:
+            return
+        yield item
 
 
-def get_config() -> Dict:
-    """Get the current configuration."""
-    if _config is None:
-        initialize_config()
-    return _config.copy()
+async def aiterate_in_context(
+    context: Context, aiterable: AsyncIterable[T]
+) -> AsyncIterator[T]:
+    """
+    Async counterpart of iterate_in_context. aiterable is consumed by one
+    task running in a copy of context, and items are handed over through a
+    queue of one, so the producer runs at most one item ahead.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    done = object()
 
+    async def produce():
+        try:
+            async for item in aiterable:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((done, e))
+        else:
+            await queue.put((done, None))
 
-# Initialize with default config
-initialize_config()
+    # Tasks copy the context current at creation
+    task = context.run(asyncio.ensure_future, produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
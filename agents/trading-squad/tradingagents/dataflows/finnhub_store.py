@@ -0,0 +1,175 @@
+import bisect
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Annotated, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_stores: Dict[Tuple[int, Optional[str]], "FinnhubStore"] = {}
+_stores_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, signature TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (path TEXT NOT NULL, date TEXT NOT NULL, payload TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS entries_path_date ON entries (path, date);
+"""
+
+
+def finnhub_data_path(ticker, data_type, data_dir, period=None):
+    if period:
+        file_name = f"{ticker}_{period}_data_formatted.json"
+    else:
+        file_name = f"{ticker}_data_formatted.json"
+    return os.path.join(data_dir, "finnhub_data", data_type, file_name)
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def _read_sorted(path):
+    """Parse a formatted Finnhub file into date-sorted keys and their entries."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    days = sorted(day for day, entries in data.items() if len(entries) > 0)
+    return days, [data[day] for day in days]
+
+
+class FinnhubStore:
+    """
+    Date-indexed access to the formatted Finnhub files under data_dir.
+
+    Each file is parsed once into date-sorted arrays and served with bisect
+    range queries; at most max_files parsed files are kept, least recently
+    used first out. With sqlite_path set, files are instead ingested once into
+    a single SQLite database with a (path, date) index, so they are shared
+    between processes and not held in memory. Either way a file is re-read
+    when its size or mtime changes.
+    """
+
+    def __init__(
+        self,
+        max_files: Annotated[int, "parsed files kept in memory"] = 64,
+        sqlite_path: Annotated[Optional[str], "optional SQLite backing file"] = None,
+    ):
+        self.max_files = max_files
+        self.sqlite_path = sqlite_path
+        self._files: "OrderedDict[str, Tuple[str, List[str], List[list]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _memory_range(self, path, start_date, end_date):
+        signature = _signature(path)
+        with self._lock:
+            loaded = self._files.get(path)
+            if loaded is not None and loaded[0] == signature:
+                self._files.move_to_end(path)
+        if loaded is None or loaded[0] != signature:
+            loaded = (signature, *_read_sorted(path))
+            with self._lock:
+                self._files[path] = loaded
+                self._files.move_to_end(path)
+                while len(self._files) > self.max_files:
+                    self._files.popitem(last=False)
+
+        _, days, entries = loaded
+        start = bisect.bisect_left(days, start_date)
+        stop = bisect.bisect_right(days, end_date)
+        return dict(zip(days[start:stop], entries[start:stop]))
+
+    def _connection(self):
+        if self._db is None:
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self.sqlite_path)), exist_ok=True
+            )
+            self._db = sqlite3.connect(
+                self.sqlite_path, timeout=30, check_same_thread=False
+            )
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _sqlite_range(self, path, start_date, end_date):
+        signature = _signature(path)
+        with self._lock:
+            db = self._connection()
+            row = db.execute(
+                "SELECT signature FROM sources WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None or row[0] != signature:
+                days, entries = _read_sorted(path)
+                with db:
+                    db.execute("DELETE FROM entries WHERE path = ?", (path,))
+                    db.executemany(
+                        "INSERT INTO entries (path, date, payload) VALUES (?, ?, ?)",
+                        (
+                            (path, day, json.dumps(day_entries))
+                            for day, day_entries in zip(days, entries)
+                        ),
+                    )
+                    db.execute(
+                        "INSERT OR REPLACE INTO sources (path, signature) VALUES (?, ?)",
+                        (path, signature),
+                    )
+            rows = db.execute(
+                "SELECT date, payload FROM entries "
+                "WHERE path = ? AND date >= ? AND date <= ? ORDER BY date",
+                (path, start_date, end_date),
+            ).fetchall()
+        return {day: json.loads(payload) for day, payload in rows}
+
+    def get_range(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        start_date: Annotated[str, "Start date in YYYY-MM-DD format"],
+        end_date: Annotated[str, "End date in YYYY-MM-DD format"],
+        data_type: Annotated[str, "insider_trans, SEC_filings, news_data, ..."],
+        data_dir: Annotated[str, "directory where the data is saved"],
+        period: Annotated[Optional[str], "annual / quarterly, if any"] = None,
+    ) -> Dict[str, list]:
+        """
+        Non-empty days with start_date <= day <= end_date, in date order. The
+        entry lists are shared with the store and must not be modified.
+        """
+        path = finnhub_data_path(ticker, data_type, data_dir, period)
+        if self.sqlite_path:
+            return self._sqlite_range(path, start_date, end_date)
+        return self._memory_range(path, start_date, end_date)
+
+
+def get_finnhub_store(
+    max_files: Annotated[int, "parsed files kept in memory"] = 64,
+    sqlite_path: Annotated[Optional[str], "optional SQLite backing file"] = None,
+) -> FinnhubStore:
+    """Return the process-wide store with the given settings."""
+    key = (max_files, sqlite_path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(key, FinnhubStore(max_files, sqlite_path))
+    return store
+
+
+def _freeze(value):
+    """Hashable equivalent of a JSON value; equal values freeze equally."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def unique_entries(
+    days: Annotated[Dict[str, Iterable[dict]], "entries per day"],
+) -> Iterator[dict]:
+    """Entries of all days in order, skipping repeats of an earlier entry."""
+    seen = set()
+    for entries in days.values():
+        for entry in entries:
+            key = _freeze(entry)
+            if key not in seen:
+                seen.add(key)
+                yield entry
@@ -1,5 +1,5 @@
-import json
-import os
+from .config import get_config
+from .finnhub_store import get_finnhub_store
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -13,24 +13,9 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
-
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    config = get_config()
+    store = get_finnhub_store(
+        config.get("finnhub_cache_files", 64), config.get("finnhub_sqlite_path")
+    )
+    # date-sorted, non-empty days with start_date <= date <= end_date
+    return store.get_range(ticker, start_date, end_date, data_type, data_dir, period)
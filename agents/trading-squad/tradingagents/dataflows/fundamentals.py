@@ -0,0 +1,184 @@
+from typing import Annotated, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .simfin_store import SIMFIN_FILES, get_simfin_partition
+
+TickersLike = Union[str, Sequence[str]]
+DatesLike = Union[str, pd.Timestamp, Sequence[Union[str, pd.Timestamp]]]
+
+
+def _query_frame(tickers, dates):
+    """Broadcast tickers and dates against each other into one query per row."""
+    tickers = np.atleast_1d(np.asarray(tickers, dtype=object))
+    dates = np.atleast_1d(np.asarray(dates, dtype=object))
+    tickers, dates = np.broadcast_arrays(tickers, dates)
+    return pd.DataFrame(
+        {
+            "Ticker": tickers.astype(str),
+            "As Of": pd.to_datetime(dates, utc=True).normalize(),
+        }
+    )
+
+
+def get_point_in_time_statements(
+    tickers: Annotated[TickersLike, "ticker symbols, broadcast against dates"],
+    dates: Annotated[DatesLike, "as-of dates (yyyy-mm-dd), broadcast against tickers"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> pd.DataFrame:
+    """
+    The latest statement published on or before each as-of date, for every
+    (ticker, date) query in one as-of join.
+
+    tickers and dates are broadcast like NumPy arrays, so one ticker over
+    many dates (a backtest) and many tickers on one date (a watchlist) both
+    work. Returns one row per query in input order: the Ticker and As Of
+    columns followed by the matched statement, NaN where nothing had been
+    published yet. Matches agree with get_simfin_statement_as_of.
+    """
+    if statement not in SIMFIN_FILES:
+        raise ValueError(f"Unknown SimFin statement: {statement}")
+
+    queries = _query_frame(tickers, dates)
+    partitions = []
+    for ticker in queries["Ticker"].unique():
+        partition = get_simfin_partition(ticker, statement, freq, data_dir)
+        if partition is not None:
+            partitions.append(partition)
+    if not partitions:
+        return queries
+
+    # Keep the first row of the file among statements published the same day,
+    # as the single-ticker lookup does; merge_asof would take the last one
+    statements = pd.concat(partitions, ignore_index=True)
+    statements = statements.dropna(subset=["Publish Date"])
+    statements = statements.drop_duplicates(["Ticker", "Publish Date"], keep="first")
+    statements = statements.sort_values("Publish Date", kind="stable")
+
+    queries["_order"] = np.arange(len(queries))
+    matched = pd.merge_asof(
+        queries.sort_values("As Of", kind="stable"),
+        statements,
+        left_on="As Of",
+        right_on="Publish Date",
+        by="Ticker",
+        direction="backward",
+    )
+    matched = matched.sort_values("_order").drop(columns="_order")
+    return matched.reset_index(drop=True)
+
+
+def _values(frame, column):
+    if column not in frame:
+        return np.full(len(frame), np.nan)
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float)
+
+
+def _sum_reported(*columns):
+    """Sum treating unreported items as 0, NaN only if none was reported."""
+    stacked = np.vstack(columns)
+    out = np.nansum(stacked, axis=0)
+    out[np.isnan(stacked).all(axis=0)] = np.nan
+    return out
+
+
+def _ratio(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = numerator / denominator
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def _text_column(frame, column):
+    if column not in frame:
+        return np.full(len(frame), np.nan, dtype=object)
+    return frame[column].to_numpy(dtype=object)
+
+
+def _date_column(frame, column):
+    if column not in frame:
+        return pd.DatetimeIndex([pd.NaT] * len(frame), tz="UTC")
+    return pd.DatetimeIndex(pd.to_datetime(frame[column], utc=True))
+
+
+def fundamental_ratios(
+    income: Annotated[pd.DataFrame, "income statement rows"],
+    balance: Annotated[pd.DataFrame, "balance sheet rows aligned with income"],
+    cash_flow: Annotated[pd.DataFrame, "cash flow rows aligned with income"],
+) -> pd.DataFrame:
+    """
+    Key figures and ratios from row-aligned income statement, balance sheet
+    and cash flow statement frames (one row per company and date).
+
+    Flow figures (revenue, income, cash flow) cover the matched reporting
+    period, so quarterly margins are per quarter. Free cash flow is operating
+    cash flow plus the (negative) change in fixed assets & intangibles.
+    Ratios with a missing or zero denominator are NaN.
+    """
+    revenue = _values(income, "Revenue")
+    net_income = _values(income, "Net Income")
+    total_debt = _sum_reported(
+        _values(balance, "Short Term Debt"), _values(balance, "Long Term Debt")
+    )
+    total_equity = _values(balance, "Total Equity")
+    operating_cash_flow = _values(cash_flow, "Net Cash from Operating Activities")
+    capital_expenditure = _values(cash_flow, "Change in Fixed Assets & Intangibles")
+    free_cash_flow = operating_cash_flow + np.nan_to_num(capital_expenditure)
+
+    return pd.DataFrame(
+        {
+            "Ticker": _text_column(income, "Ticker"),
+            "Currency": _text_column(income, "Currency"),
+            "Fiscal Year": _values(income, "Fiscal Year"),
+            "Fiscal Period": _text_column(income, "Fiscal Period"),
+            "Report Date": _date_column(income, "Report Date"),
+            "Income Published": _date_column(income, "Publish Date"),
+            "Balance Sheet Published": _date_column(balance, "Publish Date"),
+            "Cash Flow Published": _date_column(cash_flow, "Publish Date"),
+            "Revenue": revenue,
+            "Net Income": net_income,
+            "Total Debt": total_debt,
+            "Net Debt": total_debt
+            - _values(balance, "Cash, Cash Equivalents & Short Term Investments"),
+            "Total Equity": total_equity,
+            "Operating Cash Flow": operating_cash_flow,
+            "Free Cash Flow": free_cash_flow,
+            "Gross Margin": _ratio(_values(income, "Gross Profit"), revenue),
+            "Operating Margin": _ratio(
+                _values(income, "Operating Income (Loss)"), revenue
+            ),
+            "Net Margin": _ratio(net_income, revenue),
+            "FCF Margin": _ratio(free_cash_flow, revenue),
+            "Return on Equity": _ratio(net_income, total_equity),
+            "Debt to Equity": _ratio(total_debt, total_equity),
+            "Liabilities to Assets": _ratio(
+                _values(balance, "Total Liabilities"), _values(balance, "Total Assets")
+            ),
+            "Current Ratio": _ratio(
+                _values(balance, "Total Current Assets"),
+                _values(balance, "Total Current Liabilities"),
+            ),
+        }
+    )
+
+
+def get_point_in_time_fundamentals(
+    tickers: Annotated[TickersLike, "ticker symbols, broadcast against dates"],
+    dates: Annotated[DatesLike, "as-of dates (yyyy-mm-dd), broadcast against tickers"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> pd.DataFrame:
+    """
+    fundamental_ratios of the point-in-time statements of every (ticker, date)
+    query, one row per query in input order with an As Of column.
+    """
+    income, balance, cash_flow = (
+        get_point_in_time_statements(tickers, dates, statement, freq, data_dir)
+        for statement in ("income_statements", "balance_sheet", "cash_flow")
+    )
+    ratios = fundamental_ratios(income, balance, cash_flow)
+    ratios.insert(1, "As Of", income["As Of"])
+    return ratios
@@ -1,111 +1,145 @@
-import random
-import time
+import asyncio
 from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-from tenacity import (
-    retry,
-    retry_if_result,
-    stop_after_attempt,
-    wait_exponential,
-)
+from .config import get_config
+from .news_fetcher import NewsFetcher, get_news_fetcher
+from .news_parsers import get_results_parser
 
+GOOGLE_NEWS_URL = "https://www.google.com/search"
 
-def is_rate_limited(response):
-    """Check if the response indicates rate limiting (status code 429)"""
-    return response.status_code == 429
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
 
 
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
-def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+def _search_dates(start_date, end_date):
+    """Dates in the mm/dd/yyyy form the search expects."""
+    if "-" in start_date:
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+        start_date = start_date.strftime("%m/%d/%Y")
+    if "-" in end_date:
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        end_date = end_date.strftime("%m/%d/%Y")
+    return start_date, end_date
 
 
-def getNewsData(query, start_date, end_date):
+def _search_url(base_url, query, start_date, end_date, page):
+    offset = page * 10
+    return (
+        f"{base_url}?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+
+def make_request(url, headers, fetcher: Optional[NewsFetcher] = None):
+    """Make a rate-limited request, backing off and retrying on 429"""
+    return (fetcher or get_news_fetcher()).get(url, headers)
+
+
+def getNewsData(
+    query,
+    start_date,
+    end_date,
+    fetcher: Optional[NewsFetcher] = None,
+    base_url: str = GOOGLE_NEWS_URL,
+    parser: Optional[str] = None,
+):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    fetcher: NewsFetcher - rate-limited fetcher, the shared default if None
+    base_url: str - search endpoint, e.g. a local stub server in tests
+    parser: str - results page parser backend (html.parser, lxml, auto),
+        the google_news_parser config setting if None
     """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+    parse_page = get_results_parser(parser or get_config()["google_news_parser"])
+    start_date, end_date = _search_dates(start_date, end_date)
 
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+        url = _search_url(base_url, query, start_date, end_date, page)
 
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
+            response = make_request(url, HEADERS, fetcher)
+            page_results = parse_page(response.content)
 
-            if not results_on_page:
+            if not page_results.found:
                 break  # No more results found
 
-            for el in results_on_page:
-                try:
-                    link_element = el.find("a")
-                    link = link_element["href"] if link_element else "N/A"
+            news_results.extend(page_results.results)
+
+            # Check for the "Next" link (pagination)
+            if not page_results.has_next:
+                break
+
+            page += 1
 
-                    title_element = el.select_one("div.MBeuO")
-                    title = title_element.get_text() if title_element else "N/A"
+        except Exception as e:
+            print(f"Failed after multiple retries: {e}")
+            break
 
-                    snippet_element = el.select_one(".GI74Re")
-                    snippet = snippet_element.get_text() if snippet_element else "N/A"
+    return news_results
 
-                    date_element = el.select_one(".LfVVr")
-                    date = date_element.get_text() if date_element else "N/A"
 
-                    source_element = el.select_one(".NUnG9d span")
-                    source = source_element.get_text() if source_element else "N/A"
+def getNewsDataBatch(
+    queries: Iterable[Tuple[str, str, str]],
+    fetcher: Optional[NewsFetcher] = None,
+    base_url: str = GOOGLE_NEWS_URL,
+) -> List[list]:
+    """
+    Scrape several independent (query, start_date, end_date) searches in
+    parallel. Pages of one search are still fetched in order; all searches
+    share the fetcher's per-host rate limit. Results are in input order.
+    """
+    fetcher = fetcher or get_news_fetcher()
+    return fetcher.map(
+        lambda search: getNewsData(*search, fetcher=fetcher, base_url=base_url),
+        queries,
+    )
+
+
+async def agetNewsData(
+    query,
+    start_date,
+    end_date,
+    fetcher: Optional[NewsFetcher] = None,
+    base_url: str = GOOGLE_NEWS_URL,
+    parser: Optional[str] = None,
+):
+    """
+    Async getNewsData: pages are fetched on the running event loop through
+    the fetcher's shared rate limit, and parsed on a worker thread so a
+    large page does not stall other coroutines.
+    """
+    fetcher = fetcher or get_news_fetcher()
+    parse_page = get_results_parser(parser or get_config()["google_news_parser"])
+    start_date, end_date = _search_dates(start_date, end_date)
 
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
+    news_results = []
+    page = 0
+    while True:
+        url = _search_url(base_url, query, start_date, end_date, page)
+
+        try:
+            response = await fetcher.aget(url, HEADERS)
+            page_results = await asyncio.to_thread(parse_page, response.content)
 
-            # Update the progress bar with the current count of results scraped
+            if not page_results.found:
+                break  # No more results found
+
+            news_results.extend(page_results.results)
 
             # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            if not page_results.has_next:
                 break
 
             page += 1
@@ -115,3 +149,20 @@ def getNewsData(query, start_date, end_date):
             break
 
     return news_results
+
+
+async def agetNewsDataBatch(
+    queries: Iterable[Tuple[str, str, str]],
+    fetcher: Optional[NewsFetcher] = None,
+    base_url: str = GOOGLE_NEWS_URL,
+) -> List[list]:
+    """Async getNewsDataBatch: every search runs as a coroutine on one loop."""
+    fetcher = fetcher or get_news_fetcher()
+    return list(
+        await asyncio.gather(
+            *(
+                agetNewsData(*search, fetcher=fetcher, base_url=base_url)
+                for search in queries
+            )
+        )
+    )
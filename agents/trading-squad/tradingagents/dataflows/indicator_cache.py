@@ -0,0 +1,161 @@
+import hashlib
+import os
+import threading
+import uuid
+from typing import Annotated, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .indicator_engine import compute_indicators
+
+# Indicators offered to the market analyst by get_stock_stats_indicators_window
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+# Bump when the indicator definitions change so stale matrices are ignored
+CACHE_VERSION = 2
+
+# Rows of history recomputed in front of newly appended bars. The recursive
+# indicators (EMA, MACD, RSI, ATR) forget their starting point well within
+# this many bars, so extended rows match a full recompute to float rounding.
+WARMUP_ROWS = 1000
+
+_caches: Dict[str, "IndicatorCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def compute_indicator_matrix(
+    prices: Annotated[pd.DataFrame, "Date/Open/High/Low/Close/Volume history"],
+) -> np.ndarray:
+    """Compute every supported indicator, one row per indicator."""
+    indicators = compute_indicators(
+        prices["High"].to_numpy(),
+        prices["Low"].to_numpy(),
+        prices["Close"].to_numpy(),
+        prices["Volume"].to_numpy(),
+    )
+    return np.vstack([indicators[name] for name in SUPPORTED_INDICATORS])
+
+
+class IndicatorCache:
+    """
+    On-disk cache of the full supported indicator matrix per symbol.
+
+    Each entry holds the trading dates, the closes they were computed from
+    and a (len(SUPPORTED_INDICATORS), days) float64 matrix. When the price
+    history only gained new bars the matrix is extended from the tail;
+    any other change (e.g. re-adjusted history) triggers a full recompute.
+    """
+
+    def __init__(self, cache_dir: Annotated[str, "directory for cached matrices"]):
+        self.cache_dir = cache_dir
+        self._entries: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.v{CACHE_VERSION}.npz")
+
+    def _load(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        try:
+            with np.load(self._path(key)) as cached:
+                entry = (cached["dates"], cached["close"], cached["values"])
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _save(self, key, entry):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        dates, close, values = entry
+        tmp_path = f"{self._path(key)}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, dates=dates, close=close, values=values)
+        os.replace(tmp_path, self._path(key))
+        self._entries[key] = entry
+
+    def matrix(
+        self,
+        key: Annotated[str, "cache key, unique per symbol and price source"],
+        prices: Annotated[pd.DataFrame, "Date/Open/High/Low/Close/Volume history"],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (dates, indicator matrix) for the given price history."""
+        dates = prices["Date"].astype(str).str[:10].to_numpy(dtype="U10")
+        close = prices["Close"].to_numpy(dtype=float)
+
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None:
+                cached_dates, cached_close, cached_values = entry
+                n_cached = len(cached_dates)
+                is_prefix = (
+                    0 < n_cached <= len(dates)
+                    and cached_dates[0] == dates[0]
+                    and cached_dates[-1] == dates[n_cached - 1]
+                    and cached_close[-1] == close[n_cached - 1]
+                )
+                if is_prefix and n_cached == len(dates):
+                    return cached_dates, cached_values
+                if is_prefix:
+                    start = max(0, n_cached - WARMUP_ROWS)
+                    tail = compute_indicator_matrix(prices.iloc[start:])
+                    values = np.hstack([cached_values, tail[:, n_cached - start :]])
+                    self._save(key, (dates, close, values))
+                    return dates, values
+
+            values = compute_indicator_matrix(prices)
+            self._save(key, (dates, close, values))
+            return dates, values
+
+    def window(
+        self,
+        key: Annotated[str, "cache key, unique per symbol and price source"],
+        prices: Annotated[pd.DataFrame, "Date/Open/High/Low/Close/Volume history"],
+        indicator: Annotated[str, "one of SUPPORTED_INDICATORS"],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+    ) -> pd.Series:
+        """Indicator values between start_date and end_date (inclusive)."""
+        dates, values = self.matrix(key, prices)
+        start = np.searchsorted(dates, start_date[:10], "left")
+        stop = np.searchsorted(dates, end_date[:10], "right")
+        row = values[SUPPORTED_INDICATORS.index(indicator)]
+        return pd.Series(row[start:stop], index=dates[start:stop])
+
+
+def get_indicator_cache(
+    cache_dir: Annotated[str, "directory holding the data cache"],
+) -> IndicatorCache:
+    """Return the process-wide indicator cache rooted at cache_dir/indicators."""
+    cache_dir = os.path.join(cache_dir, "indicators")
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(cache_dir, IndicatorCache(cache_dir))
+    return cache
+
+
+def indicator_cache_key(
+    symbol: Annotated[str, "ticker symbol for the company"],
+    data_dir: Annotated[str, "directory the price history was loaded from"],
+    online: Annotated[bool, "whether the history came from the online source"],
+) -> str:
+    """Cache key for a symbol's history from a given price source."""
+    source = "online" if online else os.path.abspath(data_dir)
+    return f"{symbol}-{hashlib.sha1(source.encode()).hexdigest()[:10]}"
@@ -0,0 +1,268 @@
+"""
+Vectorized NumPy implementations of the indicators offered by
+get_stock_stats_indicators_window.
+
+Every function takes contiguous float64 arrays whose last axis is time, so
+the same call handles a single series (days,) or a whole watchlist
+(tickers, days). Definitions and warm-up behaviour follow stockstats
+(>= 0.6): rolling windows use min_periods=1 and the exponential averages
+are pandas' adjusted ewm.
+"""
+
+from typing import Annotated, Dict, Tuple
+
+import numpy as np
+
+ArrayLike = Annotated[np.ndarray, "float64 array, time on the last axis"]
+
+
+def _as_float(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _trailing(cumsum: np.ndarray, window: int) -> np.ndarray:
+    out = cumsum.copy()
+    out[..., window:] -= cumsum[..., :-window]
+    return out
+
+
+def _rolling_count(values: ArrayLike, window: int) -> np.ndarray:
+    """Non-NaN bars among the trailing `window` bars."""
+    valid = ~np.isnan(values)
+    if valid.all():
+        # Broadcasts against values; the common case costs nothing per row
+        return np.minimum(np.arange(1, values.shape[-1] + 1), window).astype(np.float64)
+    return _trailing(np.cumsum(valid, axis=-1, dtype=np.float64), window)
+
+
+def _rolling_sum(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Trailing sum over `window` bars, shorter at the start of the series.
+    NaN bars are skipped, as pandas' rolling sum with min_periods=1 does,
+    so one missing bar doesn't poison everything after it; the sum is NaN
+    only where the window holds no value at all.
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        return _trailing(np.cumsum(values, axis=-1), window)
+    out = _trailing(np.cumsum(np.where(missing, 0.0, values), axis=-1), window)
+    out[_rolling_count(values, window) == 0] = np.nan
+    return out
+
+
+def _ewma(values: ArrayLike, alpha: float) -> np.ndarray:
+    """
+    Adjusted exponentially weighted mean, equal to
+    pd.Series.ewm(alpha=alpha, adjust=True).mean(). NaN bars add no term
+    but still age the earlier ones (ignore_na=False), and the output is NaN
+    until the first value.
+
+    y_t = sum_k r^k x_{t-k} / sum_k r^k with r = 1 - alpha. Each block of
+    bars is solved in closed form with cumulative sums and the running
+    numerator/denominator are carried between blocks; block length is
+    capped so r^-block stays far from float overflow.
+    """
+    values = _as_float(values)
+    n = values.shape[-1]
+    out = np.empty_like(values)
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        out[...] = values
+        return out
+
+    block = int(max(1, min(256, 200 / -np.log(decay))))
+    num = np.zeros(values.shape[:-1])
+    den = np.zeros(values.shape[:-1])
+    steps = np.arange(block, dtype=np.float64)
+    grow_all = decay**-steps
+    shrink_all = decay**steps
+    weight_cumsum_all = np.cumsum(grow_all)
+    valid = ~np.isnan(values)
+    complete = valid.all()
+    if not complete:
+        values = np.where(valid, values, 0.0)
+
+    for start in range(0, n, block):
+        segment = values[..., start : start + block]
+        m = segment.shape[-1]
+        grow = grow_all[:m]
+        shrink = shrink_all[:m]
+        if complete:
+            weight_cumsum = weight_cumsum_all[:m]
+        else:
+            weight_cumsum = np.cumsum(valid[..., start : start + m] * grow, axis=-1)
+        seg_num = shrink * (decay * num[..., None] + np.cumsum(segment * grow, axis=-1))
+        seg_den = shrink * (decay * den[..., None] + weight_cumsum)
+        if complete:
+            out[..., start : start + m] = seg_num / seg_den
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out[..., start : start + m] = np.where(
+                    seg_den > 0, seg_num / seg_den, np.nan
+                )
+        num = seg_num[..., -1]
+        den = seg_den[..., -1]
+    return out
+
+
+def sma(values: ArrayLike, window: int) -> np.ndarray:
+    """Simple moving average (close_50_sma, close_200_sma)."""
+    values = _as_float(values)
+    return _rolling_sum(values, window) / _rolling_count(values, window)
+
+
+def ema(values: ArrayLike, window: int) -> np.ndarray:
+    """Exponential moving average with span=window (close_10_ema)."""
+    return _ewma(values, 2.0 / (window + 1.0))
+
+
+def smma(values: ArrayLike, window: int) -> np.ndarray:
+    """Wilder's smoothed moving average, alpha=1/window."""
+    return _ewma(values, 1.0 / window)
+
+
+def rolling_std(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Sample standard deviation over the trailing window, skipping NaN bars
+    (NaN for fewer than two values).
+    """
+    values = _as_float(values)
+    n = values.shape[-1]
+    mean = sma(values, window)
+    valid = ~np.isnan(values)
+    complete = valid.all()
+    squares = np.zeros_like(values)
+    for lag in range(min(window, n)):
+        deviation = values[..., : n - lag] - mean[..., lag:]
+        if not complete:
+            deviation = np.where(valid[..., : n - lag], deviation, 0.0)
+        squares[..., lag:] += deviation * deviation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(squares / (_rolling_count(values, window) - 1.0))
+
+
+def macd(
+    close: ArrayLike, short: int = 12, long: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram (macd, macds, macdh)."""
+    line = ema(close, short) - ema(close, long)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def rsi(close: ArrayLike, window: int = 14) -> np.ndarray:
+    """Relative Strength Index based on Wilder smoothing."""
+    close = _as_float(close)
+    diff = np.zeros_like(close)
+    diff[..., 1:] = np.diff(close, axis=-1)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    out[..., 0] = 50.0
+    return out
+
+
+def bollinger(
+    close: ArrayLike, window: int = 20, width: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger middle, upper and lower bands (boll, boll_ub, boll_lb)."""
+    middle = sma(close, window)
+    band = width * rolling_std(close, window)
+    return middle, middle + band, middle - band
+
+
+def true_range(high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+    """True range; the first bar uses its own close as the previous close."""
+    high, low, close = _as_float(high), _as_float(low), _as_float(close)
+    prev_close = np.empty_like(close)
+    prev_close[..., 0] = close[..., 0]
+    prev_close[..., 1:] = close[..., :-1]
+    out = np.maximum(
+        high - low,
+        np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+    )
+    return np.nan_to_num(out, copy=False)
+
+
+def atr(
+    high: ArrayLike, low: ArrayLike, close: ArrayLike, window: int = 14
+) -> np.ndarray:
+    """Average true range (Wilder smoothing of the true range)."""
+    return smma(true_range(high, low, close), window)
+
+
+def typical_price(high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+    """(high + low + close) / 3, with missing values treated as 0."""
+    total = _as_float(close) + _as_float(high) + _as_float(low)
+    return np.nan_to_num(total / 3.0, copy=False)
+
+
+def vwma(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    volume: ArrayLike,
+    window: int = 14,
+) -> np.ndarray:
+    """Volume weighted moving average of the typical price."""
+    volume = _as_float(volume)
+    price_volume = _rolling_sum(volume * typical_price(high, low, close), window)
+    total_volume = _rolling_sum(volume, window)
+    return np.divide(
+        price_volume,
+        total_volume,
+        out=np.zeros_like(price_volume),
+        where=total_volume != 0,
+    )
+
+
+def mfi(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    volume: ArrayLike,
+    window: int = 14,
+) -> np.ndarray:
+    """Money Flow Index as a 0..1 ratio (0.5 for the first `window` bars)."""
+    tp = typical_price(high, low, close)
+    money_flow = tp * _as_float(volume)
+    tp_diff = np.zeros_like(tp)
+    tp_diff[..., 1:] = np.diff(tp, axis=-1)
+
+    positive = _rolling_sum(np.where(tp_diff > 0, money_flow, 0.0), window)
+    negative = _rolling_sum(np.where(tp_diff < 0, money_flow, 0.0), window)
+    total = positive + negative
+    out = np.divide(positive, total, out=np.full_like(positive, 0.5), where=total > 0)
+    out[..., :window] = 0.5
+    return np.nan_to_num(out, copy=False)
+
+
+def compute_indicators(
+    high: ArrayLike, low: ArrayLike, close: ArrayLike, volume: ArrayLike
+) -> Dict[str, np.ndarray]:
+    """Compute every supported indicator in one pass, keyed by indicator name."""
+    high, low, close, volume = (
+        _as_float(high),
+        _as_float(low),
+        _as_float(close),
+        _as_float(volume),
+    )
+    macd_line, macd_signal, macd_hist = macd(close)
+    boll_mid, boll_upper, boll_lower = bollinger(close)
+    return {
+        "close_50_sma": sma(close, 50),
+        "close_200_sma": sma(close, 200),
+        "close_10_ema": ema(close, 10),
+        "macd": macd_line,
+        "macds": macd_signal,
+        "macdh": macd_hist,
+        "rsi": rsi(close),
+        "boll": boll_mid,
+        "boll_ub": boll_upper,
+        "boll_lb": boll_lower,
+        "atr": atr(high, low, close),
+        "vwma": vwma(high, low, close, volume),
+        "mfi": mfi(high, low, close, volume),
+    }
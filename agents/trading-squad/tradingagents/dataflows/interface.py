@@ -1,21 +1,48 @@
+import functools
 import os
 from datetime import datetime
 from typing import Annotated
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from dateutil.relativedelta import relativedelta
-from openai import OpenAI
 from tqdm import tqdm
 
-from .config import DATA_DIR, get_config
+from .config import get_config
+from .finnhub_store import unique_entries
 from .finnhub_utils import get_data_in_range
+from .fundamentals import fundamental_ratios
 from .googlenews_utils import *
+from .indicator_cache import (
+    SUPPORTED_INDICATORS,
+    get_indicator_cache,
+    indicator_cache_key,
+)
+from .llm_limits import llm_slot
+from .market_features import market_state_vector
+from .news_cache import cached_news
+from .openai_clients import get_async_openai_client, get_openai_client
+from .price_store import get_price_store
 from .reddit_utils import fetch_top_from_category
+from .simfin_store import get_simfin_statement_as_of
 from .stockstats_utils import *
+from .yfin_cache import get_price_range
 from .yfin_utils import *
 
+# Settings an OpenAI web search answer depends on besides its arguments
+OPENAI_CACHE_CONFIG_KEYS = ("quick_think_llm", "backend_url")
 
+
+def _data_dir():
+    # Looked up per call: each run may point at its own data directory
+    return get_config()["data_dir"]
+
+
+def _price_data_dir():
+    return os.path.join(_data_dir(), "market_data", "price_data")
+
+
+@cached_news("finnhub_news", "curr_date", query="ticker", config_keys=("data_dir",))
 def get_finnhub_news(
     ticker: Annotated[
         str,
@@ -40,7 +67,7 @@ def get_finnhub_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    result = get_data_in_range(ticker, before, curr_date, "news_data", DATA_DIR)
+    result = get_data_in_range(ticker, before, curr_date, "news_data", _data_dir())
 
     if len(result) == 0:
         return ""
@@ -79,18 +106,15 @@ def get_finnhub_company_insider_sentiment(
     before = date_obj - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_senti", DATA_DIR)
+    data = get_data_in_range(ticker, before, curr_date, "insider_senti", _data_dir())
 
     if len(data) == 0:
         return ""
 
     result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    # the same monthly entry is repeated on several days; keep the first
+    for entry in unique_entries(data):
+        result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -120,19 +144,15 @@ def get_finnhub_company_insider_transactions(
     before = date_obj - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    data = get_data_in_range(ticker, before, curr_date, "insider_trans", DATA_DIR)
+    data = get_data_in_range(ticker, before, curr_date, "insider_trans", _data_dir())
 
     if len(data) == 0:
         return ""
 
     result_str = ""
 
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    for entry in unique_entries(data):
+        result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -149,35 +169,17 @@ def get_simfin_balance_sheet(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
+    # Binary search the ticker's partition for the latest balance sheet published
+    # on or before the current date
+    latest_balance_sheet = get_simfin_statement_as_of(
+        ticker, "balance_sheet", freq, curr_date, _data_dir()
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -196,35 +198,17 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # Binary search the ticker's partition for the latest cash flow statement published
+    # on or before the current date
+    latest_cash_flow = get_simfin_statement_as_of(
+        ticker, "cash_flow", freq, curr_date, _data_dir()
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -243,35 +227,17 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+    # Binary search the ticker's partition for the latest income statement published
+    # on or before the current date
+    latest_income = get_simfin_statement_as_of(
+        ticker, "income_statements", freq, curr_date, _data_dir()
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -282,19 +248,86 @@ def get_simfin_income_statements(
     )
 
 
-def get_google_news(
-    query: Annotated[str, "Query to search with"],
-    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
-    look_back_days: Annotated[int, "how many days to look back"],
-) -> str:
-    query = query.replace(" ", "+")
+def _format_amount(value, currency):
+    if pd.isna(value):
+        return "N/A"
+    for divisor, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M")):
+        if abs(value) >= divisor:
+            return f"{value / divisor:,.2f}{suffix} {currency}"
+    return f"{value:,.0f} {currency}"
 
+
+def _format_ratio(value, percent=True):
+    if pd.isna(value):
+        return "N/A"
+    return f"{value:.1%}" if percent else f"{value:.2f}x"
+
+
+def get_simfin_fundamental_ratios(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    # Latest statement of each kind published on or before the current date
+    statements = [
+        get_simfin_statement_as_of(ticker, statement, freq, curr_date, _data_dir())
+        for statement in ("income_statements", "balance_sheet", "cash_flow")
+    ]
+    if statements[0] is None and statements[1] is None:
+        print("No financial statements available before the given current date.")
+        return ""
+
+    # Reduce them to key figures and ratios; a missing statement leaves its
+    # figures as N/A
+    row = fundamental_ratios(
+        *(
+            pd.DataFrame([statement] if statement is not None else [{}])
+            for statement in statements
+        )
+    ).iloc[0]
+
+    currency = row["Currency"] if isinstance(row["Currency"], str) else ""
+    period = f"{row['Fiscal Period']} {row['Fiscal Year']:.0f}"
+    if pd.isna(row["Fiscal Year"]):
+        period = "N/A"
+
+    lines = [
+        f"Fiscal period: {period} (report date {str(row['Report Date'])[0:10]})",
+        f"Revenue: {_format_amount(row['Revenue'], currency)}",
+        f"Net income: {_format_amount(row['Net Income'], currency)}",
+        f"Operating cash flow: {_format_amount(row['Operating Cash Flow'], currency)}",
+        f"Free cash flow: {_format_amount(row['Free Cash Flow'], currency)}",
+        f"Total debt: {_format_amount(row['Total Debt'], currency)}",
+        f"Net debt: {_format_amount(row['Net Debt'], currency)}",
+        f"Total equity: {_format_amount(row['Total Equity'], currency)}",
+        f"Gross margin: {_format_ratio(row['Gross Margin'])}",
+        f"Operating margin: {_format_ratio(row['Operating Margin'])}",
+        f"Net margin: {_format_ratio(row['Net Margin'])}",
+        f"FCF margin: {_format_ratio(row['FCF Margin'])}",
+        f"Return on equity: {_format_ratio(row['Return on Equity'])}",
+        f"Debt to equity: {_format_ratio(row['Debt to Equity'], percent=False)}",
+        f"Liabilities to assets: {_format_ratio(row['Liabilities to Assets'])}",
+        f"Current ratio: {_format_ratio(row['Current Ratio'], percent=False)}",
+    ]
+
+    return (
+        f"## {freq} key fundamentals for {ticker} as of {curr_date} (statements released on "
+        f"{str(row['Income Published'])[0:10]} / {str(row['Balance Sheet Published'])[0:10]} / {str(row['Cash Flow Published'])[0:10]} for income / balance sheet / cash flow):\n\n"
+        + "\n".join(f"- {line}" for line in lines)
+        + "\n\nFlow figures and margins cover the reported fiscal period. Free cash flow is operating cash flow less capital expenditure (change in fixed assets & intangibles). Debt is short plus long term debt; net debt subtracts cash and short term investments."
+    )
+
+
+def _google_news_range(curr_date, look_back_days):
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
-    before = before.strftime("%Y-%m-%d")
+    return before.strftime("%Y-%m-%d")
 
-    news_results = getNewsData(query, before, curr_date)
 
+def _format_google_news(query, before, curr_date, news_results):
     news_str = ""
 
     for news in news_results:
@@ -308,6 +341,35 @@ def get_google_news(
     return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
 
 
+@cached_news("google_news", "curr_date", query="query", cache_empty=False)
+def get_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    query = query.replace(" ", "+")
+    before = _google_news_range(curr_date, look_back_days)
+
+    news_results = getNewsData(query, before, curr_date)
+
+    return _format_google_news(query, before, curr_date, news_results)
+
+
+@cached_news("google_news", "curr_date", query="query", cache_empty=False)
+async def aget_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    query = query.replace(" ", "+")
+    before = _google_news_range(curr_date, look_back_days)
+
+    news_results = await agetNewsData(query, before, curr_date)
+
+    return _format_google_news(query, before, curr_date, news_results)
+
+
+@cached_news("reddit_global_news", "start_date", config_keys=("data_dir",))
 def get_reddit_global_news(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
@@ -339,7 +401,7 @@ def get_reddit_global_news(
             "global_news",
             curr_date_str,
             max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
+            data_path=os.path.join(_data_dir(), "reddit_data"),
         )
         posts.extend(fetch_result)
         curr_date += relativedelta(days=1)
@@ -360,6 +422,9 @@ def get_reddit_global_news(
     return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
 
 
+@cached_news(
+    "reddit_company_news", "start_date", query="ticker", config_keys=("data_dir",)
+)
 def get_reddit_company_news(
     ticker: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -397,7 +462,7 @@ def get_reddit_company_news(
             curr_date_str,
             max_limit_per_day,
             ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
+            data_path=os.path.join(_data_dir(), "reddit_data"),
         )
         posts.extend(fetch_result)
         curr_date += relativedelta(days=1)
@@ -510,39 +575,32 @@ def get_stock_stats_indicators_window(
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
-        )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
+    # Use appropriate data directory based on online/offline mode
+    if online:
+        data_dir = get_config()["data_cache_dir"]
     else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
+        data_dir = _price_data_dir()
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+    # Load the price history and compute the indicator once for the whole
+    # window; only trading days present in the data are reported
+    try:
+        indicator_values = StockstatsUtils.get_stock_stats_window(
+            symbol,
+            indicator,
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            data_dir,
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicator {indicator} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
+        )
+        indicator_values = pd.Series(dtype=float)
 
-            curr_date = curr_date - relativedelta(days=1)
+    ind_string = ""
+    for date, indicator_value in indicator_values[::-1].items():
+        ind_string += f"{date}: {indicator_value}\n"
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
@@ -569,13 +627,10 @@ def get_stockstats_indicator(
         # Use appropriate data directory based on online/offline mode
         if online:
             # For online mode, use the working data cache directory
-            from .config import get_config
-
-            config = get_config()
-            data_dir = config["data_cache_dir"]
+            data_dir = get_config()["data_cache_dir"]
         else:
             # For offline mode, use the configured data directory
-            data_dir = os.path.join(DATA_DIR, "market_data", "price_data")
+            data_dir = _price_data_dir()
 
         indicator_value = StockstatsUtils.get_stock_stats(
             symbol,
@@ -593,6 +648,62 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+@functools.lru_cache(maxsize=256)
+def _market_state_features(symbol, curr_date, online, price_dir, cache_dir, data_dir):
+    prices = StockstatsUtils.load_price_history(
+        symbol, cache_dir if online else price_dir, online=online
+    )
+    dates, values = get_indicator_cache(cache_dir).matrix(
+        indicator_cache_key(symbol, price_dir, online), prices
+    )
+    day = np.searchsorted(dates, curr_date, "right") - 1
+    if day < 0:
+        raise ValueError(f"No price data for {symbol} on or before {curr_date}")
+
+    try:
+        before = datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(days=90)
+        insider = unique_entries(
+            get_data_in_range(
+                symbol,
+                before.strftime("%Y-%m-%d"),
+                curr_date,
+                "insider_senti",
+                data_dir,
+            )
+        )
+        insider = list(insider)
+    except OSError:
+        insider = []
+
+    close = prices["Close"].to_numpy(dtype=float)[: day + 1]
+    indicators = dict(zip(SUPPORTED_INDICATORS, values[:, day]))
+    vector = market_state_vector(close, indicators, insider)
+    vector.setflags(write=False)
+    return vector
+
+
+def get_market_state_features(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "The current trading date, YYYY-mm-dd"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> np.ndarray:
+    """
+    Numeric market state of a symbol on the last trading day up to
+    curr_date: the indicators, returns, volatility and the last 90 days of
+    insider sentiment, as described in MARKET_FEATURES. The vector is
+    read-only and cached; runs and reflections on a day all reuse it.
+    """
+    config = get_config()
+    return _market_state_features(
+        symbol,
+        curr_date[:10],
+        online,
+        _price_data_dir(),
+        config["data_cache_dir"],
+        _data_dir(),
+    )
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -604,23 +715,10 @@ def get_YFin_data_window(
     start_date = before.strftime("%Y-%m-%d")
 
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    store = get_price_store(symbol, _price_data_dir())
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Binary search the date index for rows between the start and end dates (inclusive)
+    filtered_data = store.frame(start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -642,11 +740,8 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Serve the date range from the per-symbol history cache
+    data = get_price_range(symbol, start_date, end_date, get_config()["data_cache_dir"])
 
     # Check if data is empty
     if data.empty:
@@ -654,10 +749,6 @@ def get_YFin_data_online(
             f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
         )
 
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
-
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
     for col in numeric_columns:
@@ -681,28 +772,15 @@ def get_YFin_data(
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    store = get_price_store(symbol, _price_data_dir())
 
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Binary search the date index for rows between the start and end dates (inclusive)
+    filtered_data = store.frame(start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -710,11 +788,8 @@ def get_YFin_data(
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
+def _web_search_request(prompt, config):
+    return dict(
         model=config["quick_think_llm"],
         input=[
             {
@@ -722,7 +797,7 @@ def get_stock_news_openai(ticker, curr_date):
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -742,74 +817,100 @@ def get_stock_news_openai(ticker, curr_date):
         store=True,
     )
 
-    return response.output[1].content[0].text
-
 
-def get_global_news_openai(curr_date):
+def _openai_web_search(prompt):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = get_openai_client(config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
+    response = client.responses.create(**_web_search_request(prompt, config))
 
     return response.output[1].content[0].text
 
 
-def get_fundamentals_openai(ticker, curr_date):
+async def _aopenai_web_search(prompt):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = get_async_openai_client(config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
+    async with llm_slot(config):
+        response = await client.responses.create(**_web_search_request(prompt, config))
 
     return response.output[1].content[0].text
+
+
+def _stock_news_prompt(ticker, curr_date):
+    return f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period."
+
+
+def _global_news_prompt(curr_date):
+    return f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period."
+
+
+def _fundamentals_prompt(ticker, curr_date):
+    return f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
+
+
+# Web search answers are cached per (tool, ticker, curr_date, model, backend):
+# past dates are served from the cache for good, today's for news_cache_live_ttl.
+# The async variants share the cache entries of the sync ones.
+@cached_news(
+    "openai_stock_news",
+    "curr_date",
+    query="ticker",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+def get_stock_news_openai(ticker, curr_date):
+    return _openai_web_search(_stock_news_prompt(ticker, curr_date))
+
+
+@cached_news(
+    "openai_stock_news",
+    "curr_date",
+    query="ticker",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+async def aget_stock_news_openai(ticker, curr_date):
+    return await _aopenai_web_search(_stock_news_prompt(ticker, curr_date))
+
+
+@cached_news(
+    "openai_global_news",
+    "curr_date",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+def get_global_news_openai(curr_date):
+    return _openai_web_search(_global_news_prompt(curr_date))
+
+
+@cached_news(
+    "openai_global_news",
+    "curr_date",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+async def aget_global_news_openai(curr_date):
+    return await _aopenai_web_search(_global_news_prompt(curr_date))
+
+
+@cached_news(
+    "openai_fundamentals",
+    "curr_date",
+    query="ticker",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+def get_fundamentals_openai(ticker, curr_date):
+    return _openai_web_search(_fundamentals_prompt(ticker, curr_date))
+
+
+@cached_news(
+    "openai_fundamentals",
+    "curr_date",
+    query="ticker",
+    config_keys=OPENAI_CACHE_CONFIG_KEYS,
+    enabled_key="openai_cache_enabled",
+)
+async def aget_fundamentals_openai(ticker, curr_date):
+    return await _aopenai_web_search(_fundamentals_prompt(ticker, curr_date))
@@ -0,0 +1,43 @@
+"""
+Caps on the LLM requests an event loop has in flight to each provider.
+
+Async runs take a slot around every LLM call and OpenAI web search, so
+however many runs share the loop (apropagate, propagate_many), a provider
+never sees more than llm_max_concurrency[llm_provider] requests at once.
+Sync runs are bounded by their threads instead and are not capped.
+"""
+
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from .config import get_config
+
+_lock = threading.Lock()
+# event loop -> {(provider, cap): semaphore}; a semaphore belongs to one loop
+_semaphores = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def llm_slot(config: Optional[Mapping] = None) -> AsyncIterator[None]:
+    """
+    Hold one of the provider's slots inside the async with block; the
+    provider and cap come from config, by default the current run's.
+    """
+    config = config or get_config()
+    provider = config["llm_provider"].lower()
+    cap = (config.get("llm_max_concurrency") or {}).get(provider)
+    if not cap:
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphores = _semaphores.setdefault(loop, {})
+        semaphore = semaphores.get((provider, cap))
+        if semaphore is None:
+            semaphore = semaphores[(provider, cap)] = asyncio.Semaphore(cap)
+    async with semaphore:
+        yield
@@ -0,0 +1,75 @@
+from typing import Annotated, Dict, Iterable
+
+import numpy as np
+
+# One value per name, in this order, in every market state vector
+MARKET_FEATURES = (
+    "close_vs_50_sma",
+    "close_vs_200_sma",
+    "close_vs_10_ema",
+    "close_vs_vwma",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "mfi",
+    "boll_position",
+    "boll_width",
+    "atr",
+    "return_1d",
+    "return_5d",
+    "return_20d",
+    "volatility_20d",
+    "insider_mspr",
+    "insider_change",
+)
+
+
+def _ratio(numerator, denominator):
+    return numerator / denominator if denominator else np.nan
+
+
+def market_state_vector(
+    close: Annotated[np.ndarray, "closes up to and including the as-of day"],
+    indicators: Annotated[Dict[str, float], "SUPPORTED_INDICATORS on the as-of day"],
+    insider: Annotated[Iterable[dict], "insider sentiment entries (mspr, change)"],
+) -> np.ndarray:
+    """
+    Scale-free description of a market state, one value per MARKET_FEATURES.
+
+    Price-level indicators become the close's distance from them, MACD and
+    ATR are divided by the close, RSI and MFI are centred on 0 in [-1, 1],
+    returns are log returns and volatility is annualized. Values that can't
+    be computed yet (short histories, no insider data) are 0.
+    """
+    price = close[-1]
+    returns = np.diff(np.log(close[-21:]))
+    upper, lower = indicators["boll_ub"], indicators["boll_lb"]
+
+    insider = list(insider)
+    mspr = np.mean([entry["mspr"] for entry in insider]) if insider else 0.0
+    change = sum(entry["change"] for entry in insider)
+
+    values = [
+        _ratio(price, indicators["close_50_sma"]) - 1,
+        _ratio(price, indicators["close_200_sma"]) - 1,
+        _ratio(price, indicators["close_10_ema"]) - 1,
+        _ratio(price, indicators["vwma"]) - 1,
+        _ratio(indicators["macd"], price),
+        _ratio(indicators["macds"], price),
+        _ratio(indicators["macdh"], price),
+        (indicators["rsi"] - 50) / 50,
+        2 * indicators["mfi"] - 1,
+        2 * _ratio(price - lower, upper - lower) - 1,
+        _ratio(upper - lower, indicators["boll"]),
+        _ratio(indicators["atr"], price),
+        np.log(_ratio(price, close[-2])) if len(close) > 1 else np.nan,
+        np.log(_ratio(price, close[-6])) if len(close) > 5 else np.nan,
+        np.log(_ratio(price, close[-21])) if len(close) > 20 else np.nan,
+        returns.std() * np.sqrt(252) if len(returns) > 1 else np.nan,
+        # mspr runs from -100 to 100; net share changes span many magnitudes
+        mspr / 100,
+        np.sign(change) * np.log10(1 + abs(change)) / 7,
+    ]
+    vector = np.array(values, dtype=np.float32)
+    return np.nan_to_num(vector, nan=0.0, posinf=0.0, neginf=0.0)
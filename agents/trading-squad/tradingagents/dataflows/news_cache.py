@@ -0,0 +1,272 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date
+from typing import Annotated, Any, Callable, Dict, Optional, Tuple
+
+from .config import get_config
+
+_caches: Dict[Tuple[str, int, float], "NewsCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """Case-fold and collapse spaces / '+' separators, so equal searches share a key."""
+    if query is None:
+        return ""
+    return re.sub(r"[\s+]+", " ", str(query)).strip().casefold()
+
+
+class NewsCache:
+    """
+    Persistent cache of news tool results under cache_dir.
+
+    Entries are keyed by source, normalized query and the arguments that fix
+    the date range. Ranges ending before today can no longer change and are
+    kept until evicted; ranges that reach today (or later) expire after
+    live_ttl seconds. When the cache grows past max_bytes the least recently
+    used entries are removed. Hits and misses are counted per source.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory holding the cache entries"],
+        max_bytes: Annotated[int, "total size the cache is trimmed to"] = 256 << 20,
+        live_ttl: Annotated[float, "seconds ranges including today are kept"] = 900,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    @staticmethod
+    def key(source: str, query: Optional[str], params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            [source, normalize_query(query), params], sort_keys=True, default=str
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def get(self, source: str, key: str):
+        """Cached value for key, or None on a miss or an expired entry."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            entry = None
+
+        if entry is not None and (
+            entry["expires"] is None or entry["expires"] > time.time()
+        ):
+            # Refresh the mtime, which orders entries for eviction
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            with self._lock:
+                self.hits[source] += 1
+            return entry["value"]
+
+        with self._lock:
+            self.misses[source] += 1
+        return None
+
+    def put(self, source: str, key: str, value, end_date: str):
+        """Store value; it expires after live_ttl if end_date is today or later."""
+        expires = None
+        if end_date[:10] >= date.today().strftime("%Y-%m-%d"):
+            expires = time.time() + self.live_ttl
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps({"source": source, "expires": expires, "value": value})
+        tmp_path = f"{path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        # An expired entry being refreshed is replaced, not added
+        try:
+            replaced_size = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced_size = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(data) - replaced_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _evict(self):
+        """Remove least recently used entries down to 90% of max_bytes."""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+                size -= entry_size
+            except FileNotFoundError:
+                pass
+        self._size = size
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            for _, _, path in list(self._entries()):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._size = 0
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Hits, misses and hit rate per source."""
+        with self._lock:
+            sources = set(self.hits) | set(self.misses)
+            return {
+                source: {
+                    "hits": self.hits[source],
+                    "misses": self.misses[source],
+                    "hit_rate": self.hits[source]
+                    / (self.hits[source] + self.misses[source]),
+                }
+                for source in sorted(sources)
+            }
+
+
+def get_news_cache(
+    cache_dir: Annotated[str, "directory holding the data cache"],
+    max_bytes: Annotated[int, "total size the cache is trimmed to"] = 256 << 20,
+    live_ttl: Annotated[float, "seconds ranges including today are kept"] = 900,
+) -> NewsCache:
+    """
+    Return the process-wide news cache rooted at cache_dir/news with these
+    limits. Callers asking for different limits get their own instance, so
+    one run's config never changes the limits under another's.
+    """
+    cache_dir = os.path.join(cache_dir, "news")
+    cache_key = (cache_dir, max_bytes, live_ttl)
+    with _caches_lock:
+        cache = _caches.get(cache_key)
+        if cache is None:
+            cache = _caches[cache_key] = NewsCache(cache_dir, max_bytes, live_ttl)
+    return cache
+
+
+def cached_news(
+    source: Annotated[str, "news source name, part of the cache key"],
+    end_date: Annotated[str, "argument holding the last date of the range"],
+    query: Annotated[Optional[str], "argument holding the search query"] = None,
+    cache_empty: Annotated[bool, "also cache empty results"] = True,
+    config_keys: Annotated[tuple, "config entries the result depends on"] = (),
+    enabled_key: Annotated[str, "config flag switching the cache on"] = (
+        "news_cache_enabled"
+    ),
+) -> Callable:
+    """
+    Cache a news function's result in the news cache under data_cache_dir.
+
+    The key is the source, the normalized `query` argument, every other
+    argument of the call and the listed config entries (e.g. data_dir for
+    local dumps; clear the cache after replacing those files). Set
+    cache_empty=False for scrapers, where an empty result may be a failed
+    request rather than a quiet news day. Caching is skipped when the
+    enabled_key config flag is off. Coroutine functions are wrapped with
+    an async wrapper.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def lookup(args, kwargs):
+            """(cache, key, end date) for a call, or None when caching is off."""
+            config = get_config()
+            if not config.get(enabled_key, True):
+                return None
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            query_value = params.pop(query) if query else None
+            params.update({name: config.get(name) for name in config_keys})
+            cache = get_news_cache(
+                config["data_cache_dir"],
+                int(config.get("news_cache_max_mb", 256) * (1 << 20)),
+                config.get("news_cache_live_ttl", 900),
+            )
+            return cache, cache.key(source, query_value, params), str(params[end_date])
+
+        def store(entry, value):
+            cache, key, last_date = entry
+            if value or cache_empty:
+                cache.put(source, key, value, last_date)
+
+        def cached(args, kwargs):
+            """(lookup entry, cached value or None) for a call."""
+            entry = lookup(args, kwargs)
+            if entry is None:
+                return None, None
+            return entry, entry[0].get(source, entry[1])
+
+        if inspect.iscoroutinefunction(fn):
+            # Async variants share the entries of their sync counterparts. The
+            # cache does file I/O (and eviction walks the whole directory), so
+            # it runs on a worker thread rather than blocking the event loop
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                entry, value = await asyncio.to_thread(cached, args, kwargs)
+                if entry is None:
+                    return await fn(*args, **kwargs)
+                if value is not None:
+                    return value
+
+                value = await fn(*args, **kwargs)
+                await asyncio.to_thread(store, entry, value)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            entry, value = cached(args, kwargs)
+            if entry is None:
+                return fn(*args, **kwargs)
+            if value is not None:
+                return value
+
+            value = fn(*args, **kwargs)
+            store(entry, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,243 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Callable, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_fetchers: Dict[str, "NewsFetcher"] = {}
+_fetchers_lock = threading.Lock()
+
+
+class RateLimitedError(Exception):
+    """Raised when a host keeps answering 429 after every retry."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that spaces requests to one host.
+
+    Requests are scheduled at `rate` per second on average, with up to
+    `burst` sent back to back after an idle period. Each gap is stretched or
+    shrunk by up to `jitter` (a fraction of the mean gap) so the spacing is
+    irregular without changing the mean rate. backoff() pauses every caller
+    of the bucket, not just the one that was throttled.
+    """
+
+    def __init__(
+        self,
+        rate: Annotated[float, "mean requests per second"],
+        burst: Annotated[int, "requests allowed back to back"] = 1,
+        jitter: Annotated[float, "relative randomization of each gap, 0..1"] = 0.0,
+    ):
+        self.interval = 1.0 / rate
+        self.burst = burst
+        self.jitter = jitter
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(
+                now,
+                self._blocked_until,
+                self._next_slot - (self.burst - 1) * self.interval,
+            )
+            gap = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_slot = max(self._next_slot, start) + gap
+            return start - now
+
+    def _ready(self):
+        # A backoff may have started while this caller was waiting
+        with self._lock:
+            return self._blocked_until <= time.monotonic()
+
+    def acquire(self):
+        """Block until the caller may send its request."""
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            if self._ready():
+                return
+
+    async def acquire_async(self):
+        """Like acquire(), but waits on the event loop instead of blocking."""
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._ready():
+                return
+
+    def backoff(self, seconds: Annotated[float, "pause for every caller"]):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class NewsFetcher:
+    """
+    Rate-limited HTTP fetcher shared by the news scrapers.
+
+    All requests go through one keep-alive requests.Session and a token
+    bucket per host, so independent queries can run on the worker pool in
+    parallel while the aggregate request rate to each host stays at `rate`.
+    A 429 pauses the whole host with exponential backoff (or the server's
+    Retry-After) and the request is retried up to max_attempts times.
+
+    aget() is the asyncio counterpart of get(): it shares the buckets, so
+    sync and async callers are rate limited together, and sends requests
+    through an httpx.AsyncClient kept per event loop.
+    """
+
+    def __init__(
+        self,
+        rate: Annotated[float, "mean requests per second per host"] = 0.25,
+        burst: Annotated[int, "requests allowed back to back per host"] = 1,
+        jitter: Annotated[float, "relative randomization of request spacing"] = 0.5,
+        max_workers: Annotated[int, "queries fetched in parallel"] = 4,
+        max_attempts: Annotated[int, "attempts per request on 429"] = 5,
+        backoff_min: Annotated[float, "first 429 backoff in seconds"] = 4.0,
+        backoff_max: Annotated[float, "longest 429 backoff in seconds"] = 60.0,
+        timeout: Annotated[float, "per-request timeout in seconds"] = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._strikes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst, self.jitter)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _backoff_seconds(self, host, response):
+        with self._lock:
+            strikes = self._strikes.get(host, 0) + 1
+            self._strikes[host] = strikes
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return min(self.backoff_min * 2 ** (strikes - 1), self.backoff_max)
+
+    def _succeeded(self, host):
+        with self._lock:
+            self._strikes.pop(host, None)
+
+    def get(
+        self,
+        url: Annotated[str, "URL to fetch"],
+        headers: Annotated[Optional[Dict[str, str]], "request headers"] = None,
+    ) -> requests.Response:
+        """GET a URL within the host's rate limit, retrying on 429."""
+        host = urlsplit(url).netloc
+        bucket = self._bucket(host)
+        for _ in range(self.max_attempts):
+            bucket.acquire()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code != 429:
+                self._succeeded(host)
+                return response
+            bucket.backoff(self._backoff_seconds(host, response))
+        raise RateLimitedError(
+            f"{host} still rate limited after {self.max_attempts} attempts"
+        )
+
+    def _async_client(self):
+        import httpx
+
+        # httpx connection pools are bound to the loop that opened them
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=self.max_workers),
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def aget(
+        self,
+        url: Annotated[str, "URL to fetch"],
+        headers: Annotated[Optional[Dict[str, str]], "request headers"] = None,
+    ):
+        """GET a URL on the running event loop, within the host's rate limit."""
+        host = urlsplit(url).netloc
+        bucket = self._bucket(host)
+        client = self._async_client()
+        for _ in range(self.max_attempts):
+            await bucket.acquire_async()
+            response = await client.get(url, headers=headers)
+            if response.status_code != 429:
+                self._succeeded(host)
+                return response
+            bucket.backoff(self._backoff_seconds(host, response))
+        raise RateLimitedError(
+            f"{host} still rate limited after {self.max_attempts} attempts"
+        )
+
+    def map(
+        self,
+        fn: Annotated[Callable[[T], R], "function issuing requests via get()"],
+        items: Annotated[Iterable[T], "independent inputs, e.g. queries"],
+    ) -> List[R]:
+        """Apply fn to every item on the worker pool, results in input order."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="news-fetcher"
+                )
+        # Workers run in a copy of the caller's context, e.g. its run config
+        context = contextvars.copy_context()
+        return list(
+            self._executor.map(lambda item: context.copy().run(fn, item), items)
+        )
+
+
+def get_news_fetcher(
+    name: Annotated[str, "fetcher name, one per rate-limit domain"] = "default",
+    **settings,
+) -> NewsFetcher:
+    """
+    Return the process-wide fetcher with the given name, creating it with
+    `settings` (NewsFetcher arguments) on first use.
+    """
+    fetcher = _fetchers.get(name)
+    if fetcher is None:
+        with _fetchers_lock:
+            fetcher = _fetchers.get(name)
+            if fetcher is None:
+                fetcher = _fetchers[name] = NewsFetcher(**settings)
+    return fetcher
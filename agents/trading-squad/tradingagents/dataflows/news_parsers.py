@@ -0,0 +1,145 @@
+"""
+Parsers for Google News results pages.
+
+Each backend turns the raw bytes of a results page into a ParsedPage with
+the same result dicts (link, title, snippet, date, source). "html.parser"
+is the original BeautifulSoup implementation; "lxml" walks the tree with
+precompiled XPath and is several times faster. "auto" picks lxml when it is
+installed.
+"""
+
+import functools
+from typing import Annotated, Callable, Dict, List, NamedTuple
+
+from bs4 import BeautifulSoup
+
+
+class ParsedPage(NamedTuple):
+    results: List[Dict[str, str]]
+    # whether the page had any result elements, even ones that failed to parse
+    found: bool
+    has_next: bool
+
+
+def _result(link, title, snippet, date, source):
+    return {
+        "link": link,
+        "title": title,
+        "snippet": snippet,
+        "date": date,
+        "source": source,
+    }
+
+
+def parse_with_html_parser(content: Annotated[bytes, "results page"]) -> ParsedPage:
+    soup = BeautifulSoup(content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    results = []
+    for el in results_on_page:
+        try:
+            link_element = el.find("a")
+            link = link_element["href"] if link_element else "N/A"
+
+            title_element = el.select_one("div.MBeuO")
+            title = title_element.get_text() if title_element else "N/A"
+
+            snippet_element = el.select_one(".GI74Re")
+            snippet = snippet_element.get_text() if snippet_element else "N/A"
+
+            date_element = el.select_one(".LfVVr")
+            date = date_element.get_text() if date_element else "N/A"
+
+            source_element = el.select_one(".NUnG9d span")
+            source = source_element.get_text() if source_element else "N/A"
+
+            results.append(_result(link, title, snippet, date, source))
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    has_next = soup.find("a", id="pnnext") is not None
+    return ParsedPage(results, bool(results_on_page), has_next)
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@functools.lru_cache(maxsize=1)
+def _lxml_queries():
+    from lxml import etree
+
+    return {
+        "results": etree.XPath(f"//div[{_has_class('SoaBEf')}]"),
+        "link": etree.XPath("(.//a)[1]"),
+        "title": etree.XPath(f"(.//div[{_has_class('MBeuO')}])[1]"),
+        "snippet": etree.XPath(f"(.//*[{_has_class('GI74Re')}])[1]"),
+        "date": etree.XPath(f"(.//*[{_has_class('LfVVr')}])[1]"),
+        "source": etree.XPath(f"(.//*[{_has_class('NUnG9d')}]//span)[1]"),
+        "next": etree.XPath("//a[@id='pnnext']"),
+    }
+
+
+def parse_with_lxml(content: Annotated[bytes, "results page"]) -> ParsedPage:
+    import lxml.html
+    from lxml import etree
+
+    queries = _lxml_queries()
+    try:
+        # Like BeautifulSoup, prefer UTF-8 when the page does not say otherwise
+        try:
+            document = lxml.html.document_fromstring(content.decode("utf-8"))
+        except UnicodeDecodeError:
+            document = lxml.html.document_fromstring(content)
+    except etree.ParserError:
+        # blank page
+        return ParsedPage([], False, False)
+
+    def text(el, field):
+        found = queries[field](el)
+        return str(found[0].text_content()) if found else "N/A"
+
+    results_on_page = queries["results"](document)
+    results = []
+    for el in results_on_page:
+        link_element = queries["link"](el)
+        if link_element and link_element[0].get("href") is None:
+            print("Error processing result: 'href'")
+            continue
+        link = link_element[0].get("href") if link_element else "N/A"
+        results.append(
+            _result(
+                link,
+                text(el, "title"),
+                text(el, "snippet"),
+                text(el, "date"),
+                text(el, "source"),
+            )
+        )
+
+    has_next = bool(queries["next"](document))
+    return ParsedPage(results, bool(results_on_page), has_next)
+
+
+PARSERS: Dict[str, Callable[[bytes], ParsedPage]] = {
+    "html.parser": parse_with_html_parser,
+    "lxml": parse_with_lxml,
+}
+
+
+def get_results_parser(
+    name: Annotated[str, "html.parser, lxml or auto"] = "auto",
+) -> Callable[[bytes], ParsedPage]:
+    """Return the results page parser for a backend name."""
+    if name == "auto":
+        try:
+            import lxml.html  # noqa: F401
+
+            name = "lxml"
+        except ImportError:
+            name = "html.parser"
+    if name not in PARSERS:
+        raise ValueError(f"Unknown Google News parser backend: {name}")
+    return PARSERS[name]
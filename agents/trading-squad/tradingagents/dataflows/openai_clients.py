@@ -0,0 +1,43 @@
+import asyncio
+import threading
+import weakref
+from typing import Annotated, Dict
+
+from openai import AsyncOpenAI, OpenAI
+
+_clients: Dict[str, OpenAI] = {}
+_clients_lock = threading.Lock()
+# event loop -> {base_url: client}; an async client's pool belongs to one loop
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_openai_client(
+    base_url: Annotated[str, "OpenAI-compatible API endpoint"],
+) -> OpenAI:
+    """
+    Return the process-wide client for a backend URL. The client keeps its
+    HTTP connection pool open, so repeated calls skip the TLS handshake.
+    """
+    client = _clients.get(base_url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(base_url)
+            if client is None:
+                client = _clients[base_url] = OpenAI(base_url=base_url)
+    return client
+
+
+def get_async_openai_client(
+    base_url: Annotated[str, "OpenAI-compatible API endpoint"],
+) -> AsyncOpenAI:
+    """
+    Return the async client for a backend URL on the running event loop.
+    Coroutines on the same loop share its connection pool.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(base_url)
+        if client is None:
+            client = clients[base_url] = AsyncOpenAI(base_url=base_url)
+    return client
@@ -0,0 +1,195 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+from typing import Annotated, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+YFIN_CSV_NAME = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+STORE_DIR_NAME = "price_store"
+
+_META_FILE = "meta.json"
+_DATE_INDEX_FILE = "date_index.npy"
+
+_open_stores: Dict[str, "PriceStore"] = {}
+_open_stores_lock = threading.Lock()
+
+
+def date_to_int(date: Annotated[str, "date string, yyyy-mm-dd (time part ignored)"]):
+    """Convert a date string to an int64 day number (days since 1970-01-01)."""
+    return int(np.datetime64(str(date)[:10], "D").astype(np.int64))
+
+
+class PriceStore:
+    """
+    Memory-mapped columnar copy of one symbol's YFin price CSV.
+
+    Every CSV column is stored as its own .npy file next to a sorted int64
+    day index, so a date range query is two binary searches followed by a
+    slice of the mapped arrays.
+    """
+
+    def __init__(self, path: Annotated[str, "directory of a built store"]):
+        self.path = path
+        with open(os.path.join(path, _META_FILE), "r") as f:
+            self.meta = json.load(f)
+        self.columns: List[str] = self.meta["columns"]
+        self.dates = np.load(os.path.join(path, _DATE_INDEX_FILE), mmap_mode="r")
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the memory-mapped array backing a CSV column."""
+        array = self._arrays.get(name)
+        if array is None:
+            array = np.load(
+                os.path.join(self.path, self.meta["files"][name]), mmap_mode="r"
+            )
+            self._arrays[name] = array
+        return array
+
+    def search(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> slice:
+        """Return the row slice covering start_date..end_date (both inclusive)."""
+        start = 0
+        stop = len(self.dates)
+        if start_date is not None:
+            start = int(np.searchsorted(self.dates, date_to_int(start_date), "left"))
+        if end_date is not None:
+            stop = int(np.searchsorted(self.dates, date_to_int(end_date), "right"))
+        return slice(start, max(start, stop))
+
+    def has_date(self, date: str) -> bool:
+        """Whether the store holds a bar for the given trading date."""
+        rows = self.search(date, date)
+        return rows.stop > rows.start
+
+    def frame(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Materialize a date range as a DataFrame shaped like the source CSV.
+        The index holds the positional row numbers of the date-sorted store,
+        which match the CSV's own only when it was already in date order.
+        """
+        rows = self.search(start_date, end_date)
+        data = {
+            name: np.array(self.column(name)[rows])
+            for name in (columns or self.columns)
+        }
+        return pd.DataFrame(data, index=pd.RangeIndex(rows.start, rows.stop))
+
+
+def _source_version(csv_path: str) -> str:
+    stat = os.stat(csv_path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def build_price_store(
+    csv_path: Annotated[str, "YFin CSV file to convert"],
+    store_path: Annotated[str, "directory the store is published to"],
+) -> str:
+    """
+    Convert a YFin CSV into a columnar store.
+
+    The store is written to a private temporary directory and published with
+    a single rename, so concurrent builders never expose a partial store.
+    """
+    data = pd.read_csv(csv_path)
+    if "Date" not in data.columns:
+        raise ValueError(f"{csv_path} has no Date column")
+
+    day_index = (
+        data["Date"].astype(str).str[:10].to_numpy(dtype=str).astype("datetime64[D]")
+    ).astype(np.int64)
+    order = np.argsort(day_index, kind="stable")
+
+    tmp_path = f"{store_path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+    os.makedirs(tmp_path)
+    try:
+        files = {}
+        for i, name in enumerate(data.columns):
+            values = data[name].to_numpy()
+            if values.dtype.kind not in "biuf":
+                values = values.astype(str)
+            files[name] = f"col_{i}.npy"
+            np.save(
+                os.path.join(tmp_path, files[name]),
+                np.ascontiguousarray(values[order]),
+            )
+        np.save(os.path.join(tmp_path, _DATE_INDEX_FILE), day_index[order])
+        with open(os.path.join(tmp_path, _META_FILE), "w") as f:
+            json.dump(
+                {
+                    "source": os.path.basename(csv_path),
+                    "rows": int(len(data)),
+                    "columns": list(data.columns),
+                    "files": files,
+                },
+                f,
+            )
+
+        try:
+            os.rename(tmp_path, store_path)
+        except OSError:
+            # Another process published the same version first
+            if not os.path.isdir(store_path):
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    # Drop stores built from older versions of the CSV
+    symbol_dir = os.path.dirname(store_path)
+    for entry in os.listdir(symbol_dir):
+        entry_path = os.path.join(symbol_dir, entry)
+        if entry_path != store_path and ".tmp-" not in entry:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+    return store_path
+
+
+def get_price_store(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    price_dir: Annotated[str, "directory holding the YFin price CSVs"],
+) -> PriceStore:
+    """
+    Open the columnar store for a symbol, building it from the YFin CSV the
+    first time. Stores are keyed by the CSV's size and mtime, so a refreshed
+    CSV is picked up automatically. Opened stores are kept for the lifetime
+    of the process.
+    """
+    csv_path = os.path.join(price_dir, YFIN_CSV_NAME.format(symbol=symbol))
+    store_path = os.path.join(
+        price_dir, STORE_DIR_NAME, symbol, _source_version(csv_path)
+    )
+
+    store = _open_stores.get(store_path)
+    if store is not None:
+        return store
+
+    with _open_stores_lock:
+        store = _open_stores.get(store_path)
+        if store is None:
+            if not os.path.isdir(store_path):
+                os.makedirs(os.path.dirname(store_path), exist_ok=True)
+                build_price_store(csv_path, store_path)
+            store = PriceStore(store_path)
+            _open_stores[store_path] = store
+    return store
+
+
+def clear_open_stores():
+    """Forget every opened store (the next query re-opens from disk)."""
+    with _open_stores_lock:
+        _open_stores.clear()
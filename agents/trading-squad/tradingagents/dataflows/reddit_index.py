@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from typing import Annotated, Dict, Iterator, Tuple
+
+INDEX_DIR_NAME = "reddit_index"
+
+_POSTS_FILE = "posts.jsonl"
+_DAYS_FILE = "days.json"
+
+_indexes: Dict[str, "RedditDayIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def build_reddit_index(
+    jsonl_path: Annotated[str, "subreddit dump, one JSON post per line"],
+    index_path: Annotated[str, "directory the index is published to"],
+) -> str:
+    """
+    Rewrite a subreddit dump as a compact, date-partitioned posts file.
+
+    Posts are grouped by their UTC posting date and ordered by upvotes
+    (descending, file order among ties), so the top posts of a day are a
+    prefix of one contiguous byte range. days.json maps every date to that
+    range. The index is written to a temporary directory and published with
+    a single rename.
+    """
+    posts = []
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            # skip empty lines
+            if not line.strip():
+                continue
+            parsed_line = json.loads(line)
+            posts.append(
+                {
+                    "title": parsed_line["title"],
+                    "content": parsed_line["selftext"],
+                    "url": parsed_line["url"],
+                    "upvotes": parsed_line["ups"],
+                    "posted_date": datetime.utcfromtimestamp(
+                        parsed_line["created_utc"]
+                    ).strftime("%Y-%m-%d"),
+                }
+            )
+    # stable sort: equal upvotes keep their order in the dump
+    posts.sort(key=lambda post: (post["posted_date"], -post["upvotes"]))
+
+    tmp_path = f"{index_path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+    os.makedirs(tmp_path)
+    try:
+        days = {}
+        with open(os.path.join(tmp_path, _POSTS_FILE), "wb") as f:
+            for post in posts:
+                start = f.tell()
+                f.write(json.dumps(post).encode() + b"\n")
+                day = days.setdefault(post["posted_date"], [start, start])
+                day[1] = f.tell()
+        with open(os.path.join(tmp_path, _DAYS_FILE), "w") as f:
+            json.dump(days, f)
+
+        try:
+            os.rename(tmp_path, index_path)
+        except OSError:
+            # Another process published the same version first
+            if not os.path.isdir(index_path):
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    # Drop indexes built from older versions of the dump
+    parent_dir = os.path.dirname(index_path)
+    for entry in os.listdir(parent_dir):
+        entry_path = os.path.join(parent_dir, entry)
+        if entry_path != index_path and ".tmp-" not in entry:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+    return index_path
+
+
+class RedditDayIndex:
+    """Posts of one subreddit dump, served by date in upvote order."""
+
+    def __init__(self, index_path: Annotated[str, "published index directory"]):
+        self.index_path = index_path
+        with open(os.path.join(index_path, _DAYS_FILE), "r") as f:
+            self.days: Dict[str, Tuple[int, int]] = {
+                day: tuple(span) for day, span in json.load(f).items()
+            }
+
+    def posts(self, date: Annotated[str, "posting date, yyyy-mm-dd"]) -> Iterator[dict]:
+        """Posts of the given date, most upvoted first (one seek and read)."""
+        span = self.days.get(date)
+        if span is None:
+            return
+        start, end = span
+        with open(os.path.join(self.index_path, _POSTS_FILE), "rb") as f:
+            f.seek(start)
+            lines = f.read(end - start).splitlines()
+        for line in lines:
+            yield json.loads(line)
+
+
+def get_reddit_index(
+    data_path: Annotated[str, "reddit data folder holding one folder per category"],
+    category: Annotated[str, "category folder, e.g. global_news"],
+    data_file: Annotated[str, "subreddit .jsonl file in the category folder"],
+) -> RedditDayIndex:
+    """
+    Return the index of a subreddit dump, building it the first time.
+    Indexes live in data_path/reddit_index and are keyed by the dump's size
+    and mtime, so an updated dump is re-indexed automatically.
+    """
+    jsonl_path = os.path.join(data_path, category, data_file)
+    stat = os.stat(jsonl_path)
+    index_path = os.path.join(
+        data_path,
+        INDEX_DIR_NAME,
+        category,
+        os.path.splitext(data_file)[0],
+        f"{stat.st_size:x}-{stat.st_mtime_ns:x}",
+    )
+
+    index = _indexes.get(index_path)
+    if index is None:
+        if not os.path.isdir(index_path):
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            build_reddit_index(jsonl_path, index_path)
+        with _indexes_lock:
+            index = _indexes.setdefault(index_path, RedditDayIndex(index_path))
+    return index
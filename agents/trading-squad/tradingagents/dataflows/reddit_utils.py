@@ -1,9 +1,11 @@
-import json
+import functools
+import itertools
 import os
 import re
-from datetime import datetime
 from typing import Annotated
 
+from .reddit_index import get_reddit_index
+
 ticker_to_company = {
     "AAPL": "Apple",
     "MSFT": "Microsoft",
@@ -46,6 +48,11 @@ ticker_to_company = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _search_patterns(search_terms):
+    return tuple(re.compile(term, re.IGNORECASE) for term in search_terms)
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -71,62 +78,31 @@ def fetch_top_from_category(
         os.listdir(os.path.join(base_path, category))
     )
 
+    search_patterns = None
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    if "company" in category and query:
+        search_terms = ticker_to_company[query].split(" OR ")
+        search_terms.append(query)
+        search_patterns = _search_patterns(tuple(search_terms))
+
     for data_file in os.listdir(os.path.join(base_path, category)):
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
+        # posts of the date, already ordered by upvotes in descending order
+        posts = get_reddit_index(base_path, category, data_file).posts(date)
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+        if search_patterns is not None:
+            posts = (
+                post
+                for post in posts
+                if any(
+                    pattern.search(post["title"]) or pattern.search(post["content"])
+                    for pattern in search_patterns
+                )
+            )
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+        all_content.extend(itertools.islice(posts, limit_per_subreddit))
 
     return all_content
@@ -0,0 +1,164 @@
+import functools
+import json
+import os
+import shutil
+import uuid
+from typing import Annotated, Optional
+from urllib.parse import quote
+
+import pandas as pd
+
+# SimFin bulk files per statement type, relative to <data_dir>/fundamental_data
+SIMFIN_FILES = {
+    "balance_sheet": "us-balance-{freq}.csv",
+    "cash_flow": "us-cashflow-{freq}.csv",
+    "income_statements": "us-income-{freq}.csv",
+}
+STORE_DIR_NAME = "simfin_store"
+# Part of every store's name: bump it when the partitions change shape
+STORE_FORMAT = 2
+
+_MANIFEST_FILE = "manifest.json"
+
+
+def simfin_csv_path(
+    data_dir: Annotated[str, "root data directory"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+) -> str:
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        statement,
+        "companies",
+        "us",
+        SIMFIN_FILES[statement].format(freq=freq),
+    )
+
+
+def _partition_file(ticker):
+    return f"{quote(str(ticker), safe='')}.pkl"
+
+
+def build_simfin_store(
+    csv_path: Annotated[str, "SimFin bulk CSV covering all companies"],
+    store_path: Annotated[str, "directory the store is published to"],
+) -> str:
+    """
+    Split a SimFin bulk CSV into one pickled frame per ticker.
+
+    Dates are parsed once and every partition is stably sorted by Publish
+    Date, keeping the original row labels and the dtypes of the full file so
+    lookups print exactly like a filter over the full CSV. Rows without a
+    Publish Date are dropped: no as-of date can ever select them, and left
+    in they would break the binary search. The store is written to a
+    temporary directory and published with a single rename.
+    """
+    df = pd.read_csv(csv_path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    df = df[df["Publish Date"].notna()]
+    df = df.sort_values("Publish Date", kind="stable")
+
+    tmp_path = f"{store_path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+    os.makedirs(tmp_path)
+    try:
+        tickers = []
+        for ticker, partition in df.groupby("Ticker", sort=False):
+            partition.to_pickle(os.path.join(tmp_path, _partition_file(ticker)))
+            tickers.append(ticker)
+        with open(os.path.join(tmp_path, _MANIFEST_FILE), "w") as f:
+            json.dump(
+                {"source": os.path.basename(csv_path), "tickers": sorted(tickers)}, f
+            )
+
+        try:
+            os.rename(tmp_path, store_path)
+        except OSError:
+            # Another process published the same version first
+            if not os.path.isdir(store_path):
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    # Drop stores built from older versions of the CSV
+    parent_dir = os.path.dirname(store_path)
+    for entry in os.listdir(parent_dir):
+        entry_path = os.path.join(parent_dir, entry)
+        if entry_path != store_path and ".tmp-" not in entry:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+    return store_path
+
+
+def get_simfin_store_path(
+    data_dir: Annotated[str, "root data directory"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+) -> str:
+    """
+    Return the per-ticker store for a SimFin bulk file, ingesting it the
+    first time. Stores are keyed by the CSV's size and mtime (and the store
+    format), so a refreshed download is re-ingested automatically.
+    """
+    csv_path = simfin_csv_path(data_dir, statement, freq)
+    stat = os.stat(csv_path)
+    store_path = os.path.join(
+        data_dir,
+        "fundamental_data",
+        STORE_DIR_NAME,
+        statement,
+        freq,
+        f"v{STORE_FORMAT}-{stat.st_size:x}-{stat.st_mtime_ns:x}",
+    )
+    if not os.path.isdir(store_path):
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        build_simfin_store(csv_path, store_path)
+    return store_path
+
+
+@functools.lru_cache(maxsize=512)
+def _load_partition(path):
+    try:
+        return pd.read_pickle(path)
+    except FileNotFoundError:
+        return None
+
+
+def get_simfin_partition(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> Optional[pd.DataFrame]:
+    """All statements of one ticker sorted by Publish Date (None if unknown).
+    The frame is shared between callers and must not be modified."""
+    store_path = get_simfin_store_path(data_dir, statement, freq)
+    return _load_partition(os.path.join(store_path, _partition_file(ticker)))
+
+
+def get_simfin_statement_as_of(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    data_dir: Annotated[str, "root data directory"],
+) -> Optional[pd.Series]:
+    """
+    The latest statement published on or before curr_date, found by binary
+    search on Publish Date. Ties resolve to the first row of the bulk file,
+    as idxmax over the full file would. Returns None if there is none.
+    """
+    partition = get_simfin_partition(ticker, statement, freq, data_dir)
+    if partition is None:
+        return None
+
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    publish_dates = partition["Publish Date"]
+    position = publish_dates.searchsorted(curr_date_dt, side="right") - 1
+    if position < 0:
+        return None
+
+    first = publish_dates.searchsorted(publish_dates.iloc[position], side="left")
+    return partition.iloc[first]
@@ -1,23 +1,22 @@
-import os
 from typing import Annotated
 
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 
 from .config import get_config
+from .indicator_cache import (
+    SUPPORTED_INDICATORS,
+    get_indicator_cache,
+    indicator_cache_key,
+)
+from .price_store import get_price_store
+from .yfin_cache import update_price_history
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def load_price_history(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
             "directory where the stock data is stored.",
@@ -27,101 +26,86 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
+        """Load the full Date/Open/High/Low/Close/Volume history of a symbol."""
         data = None
 
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-
-                # Filter data to only include columns that stockstats expects
-                # stockstats expects: Date, Open, High, Low, Close, Volume
-                required_columns = ["Date", "Open", "High", "Low", "Close", "Volume"]
-
-                # Ensure we have all required columns
-                available_columns = [
-                    col for col in required_columns if col in data.columns
-                ]
-                if (
-                    len(available_columns) < 5
-                ):  # At minimum need Date, Open, High, Low, Close
-                    raise Exception(
-                        f"Missing required columns. Available: {list(data.columns)}"
-                    )
-
-                # Create clean dataframe with only required columns
-                clean_data = data[available_columns].copy()
-
-                # Handle missing Volume column (some data sources don't provide it)
-                if "Volume" not in clean_data.columns:
-                    clean_data["Volume"] = 0  # Set default volume if missing
-
-                df = wrap(clean_data)
+                data = get_price_store(symbol, data_dir).frame()
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
+            # Incrementally updated per-symbol cache of the online history
+            config = get_config()
+            data = update_price_history(symbol, config["data_cache_dir"])
+            data = data.reset_index()
+
+        # Filter data to only include columns that stockstats expects
+        # stockstats expects: Date, Open, High, Low, Close, Volume
+        required_columns = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+        # Ensure we have all required columns
+        available_columns = [col for col in required_columns if col in data.columns]
+        if len(available_columns) < 5:  # At minimum need Date, Open, High, Low, Close
+            raise Exception(
+                f"Missing required columns. Available: {list(data.columns)}"
+            )
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
+        # Create clean dataframe with only required columns
+        clean_data = data[available_columns].copy()
 
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
+        # Handle missing Volume column (some data sources don't provide it)
+        if "Volume" not in clean_data.columns:
+            clean_data["Volume"] = 0  # Set default volume if missing
 
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
+        if online:
+            clean_data["Date"] = clean_data["Date"].dt.strftime("%Y-%m-%d")
+        return clean_data
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            # Filter data to only include columns that stockstats expects
-            # stockstats expects: Date, Open, High, Low, Close, Volume
-            required_columns = ["Date", "Open", "High", "Low", "Close", "Volume"]
-
-            # Ensure we have all required columns
-            available_columns = [col for col in required_columns if col in data.columns]
-            if (
-                len(available_columns) < 5
-            ):  # At minimum need Date, Open, High, Low, Close
-                raise Exception(
-                    f"Missing required columns. Available: {list(data.columns)}"
-                )
-
-            # Create clean dataframe with only required columns
-            clean_data = data[available_columns].copy()
-
-            # Handle missing Volume column (some data sources don't provide it)
-            if "Volume" not in clean_data.columns:
-                clean_data["Volume"] = 0  # Set default volume if missing
-
-            df = wrap(clean_data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+    @staticmethod
+    def load_stock_frame(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        """Load the full price history of a symbol as a stockstats frame."""
+        return wrap(StockstatsUtils.load_price_history(symbol, data_dir, online))
 
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
+
+        if indicator in SUPPORTED_INDICATORS:
+            values = StockstatsUtils.get_stock_stats_window(
+                symbol, indicator, curr_date, curr_date, data_dir, online
+            )
+            if values.empty:
+                return "N/A: Not a trading day (weekend or holiday)"
+            return values.iloc[0]
+
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
         df[indicator]  # trigger stockstats to calculate the indicator
         matching_rows = df[df["Date"].str.startswith(curr_date)]
 
@@ -130,3 +114,45 @@ class StockstatsUtils:
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Indicator values for every trading day between start_date and end_date
+        (inclusive), indexed by YYYY-mm-dd in ascending order. The price
+        history is loaded and the indicator computed once for the whole window.
+        Supported indicators are served from the persistent indicator cache.
+        """
+        if indicator in SUPPORTED_INDICATORS:
+            prices = StockstatsUtils.load_price_history(symbol, data_dir, online)
+            cache = get_indicator_cache(get_config()["data_cache_dir"])
+            return cache.window(
+                indicator_cache_key(symbol, data_dir, online),
+                prices,
+                indicator,
+                start_date,
+                end_date,
+            )
+
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
+
+        values = df[indicator].to_numpy()
+        dates = df["Date"].astype(str).str[:10]
+        in_window = ((dates >= start_date) & (dates <= end_date)).to_numpy()
+
+        return pd.Series(values[in_window], index=dates.to_numpy()[in_window])
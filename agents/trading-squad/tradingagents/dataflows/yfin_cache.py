@@ -0,0 +1,148 @@
+import glob
+import json
+import os
+import threading
+import uuid
+from datetime import date
+from typing import Annotated, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+# Depth of history fetched the first time a symbol is cached
+HISTORY_YEARS = 15
+
+_loaded: Dict[str, Tuple[int, pd.DataFrame]] = {}
+_loaded_lock = threading.Lock()
+
+
+def _cache_paths(symbol, cache_dir):
+    base = os.path.join(cache_dir, f"{symbol.upper()}-YFin-data")
+    return f"{base}.csv", f"{base}.json"
+
+
+def _fetch_history(symbol, start_date, end_date):
+    data = yf.Ticker(symbol.upper()).history(start=start_date, end=end_date)
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index.name = "Date"
+    return data
+
+
+def _read_history(csv_path):
+    """Read a cached history, reusing the parsed frame while the file is unchanged."""
+    try:
+        mtime = os.stat(csv_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    loaded = _loaded.get(csv_path)
+    if loaded is not None and loaded[0] == mtime:
+        return loaded[1]
+
+    data = pd.read_csv(csv_path, index_col="Date", parse_dates=["Date"])
+    with _loaded_lock:
+        _loaded[csv_path] = (mtime, data)
+    return data
+
+
+def _write_atomic(path, write):
+    tmp_path = f"{path}.tmp-{os.getpid()}-{uuid.uuid4().hex}"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def update_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    cache_dir: Annotated[str, "directory holding the online data cache"],
+) -> pd.DataFrame:
+    """
+    Return the cached daily history of a symbol, bringing it up to date first.
+
+    The cache is one {SYMBOL}-YFin-data.csv per symbol plus a small JSON
+    sidecar recording the last stored bar and the day it was last checked.
+    Only the bars after the last stored one are downloaded, at most once per
+    day. If the overlapping bar no longer matches (the history was
+    re-adjusted for a split or dividend) the full range is downloaded again.
+
+    Both files are replaced atomically, so a concurrent reader sees either
+    the old or the new history. Concurrent writers merge into the same
+    result, and any bars lost to a race are fetched on the next update.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    csv_path, meta_path = _cache_paths(symbol, cache_dir)
+    today = date.today().strftime("%Y-%m-%d")
+
+    cached = _read_history(csv_path)
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, ValueError):
+        meta = {}
+
+    if cached is not None and not cached.empty and meta.get("checked") == today:
+        return cached
+
+    if cached is None or cached.empty:
+        start_date = pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)
+        history = _fetch_history(symbol, start_date.strftime("%Y-%m-%d"), today)
+    else:
+        last_bar = cached.index[-1]
+        tail = _fetch_history(symbol, last_bar.strftime("%Y-%m-%d"), today)
+        if last_bar in tail.index and not np.isclose(
+            tail.loc[last_bar, "Close"], cached.loc[last_bar, "Close"], rtol=1e-6
+        ):
+            history = _fetch_history(
+                symbol, cached.index[0].strftime("%Y-%m-%d"), today
+            )
+        else:
+            history = pd.concat([cached, tail])
+            history = history[~history.index.duplicated(keep="last")].sort_index()
+
+    if history.empty:
+        return history
+
+    _write_atomic(csv_path, lambda path: history.to_csv(path))
+    last_bar = history.index[-1].strftime("%Y-%m-%d")
+
+    def write_meta(path):
+        with open(path, "w") as f:
+            json.dump({"last_bar": last_bar, "checked": today}, f)
+
+    _write_atomic(meta_path, write_meta)
+
+    # Remove the per-day snapshots written by earlier versions of the cache
+    for stale_file in glob.glob(
+        os.path.join(cache_dir, f"{glob.escape(symbol)}-YFin-data-*-*.csv")
+    ):
+        try:
+            os.remove(stale_file)
+        except OSError:
+            pass
+
+    return _read_history(csv_path)
+
+
+def get_price_range(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (exclusive)"],
+    cache_dir: Annotated[str, "directory holding the online data cache"],
+) -> pd.DataFrame:
+    """
+    Daily bars with start_date <= Date < end_date, the same range
+    yf.Ticker.history(start, end) returns, served from the per-symbol cache.
+    Ranges starting before the cached history are downloaded directly.
+    """
+    history = update_price_history(symbol, cache_dir)
+    if history.empty or pd.Timestamp(start_date) < history.index[0]:
+        return _fetch_history(symbol, start_date, end_date)
+
+    start = history.index.searchsorted(pd.Timestamp(start_date), "left")
+    stop = history.index.searchsorted(pd.Timestamp(end_date), "left")
+    return history.iloc[start:stop].copy()
@@ -20,6 +20,62 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Async runs (apropagate, propagate_many): LLM requests in flight at once
+    # per llm_provider, shared by every run on the event loop, e.g.
+    # {"openai": 16, "ollama": 2}. Providers missing from the mapping are not
+    # capped
+    "llm_max_concurrency": {},
+    # Runs propagate_many keeps in progress at once
+    "batch_max_concurrency": 16,
+    # "sequential" chains the selected analysts, so graph.stream() shows
+    # every analyst's messages in turn (as the CLI displays them); opt in to
+    # "parallel" to run them concurrently, each with its own messages
+    "analyst_execution": "sequential",
     # Tool settings
     "online_tools": True,
+    # Local Finnhub data: parsed files kept in memory, or a SQLite file to
+    # index them into instead (e.g. os.path.join(data_cache_dir, "finnhub.sqlite"))
+    "finnhub_cache_files": 64,
+    "finnhub_sqlite_path": None,
+    # Google News results page parser: "auto" (lxml if installed), "lxml" or
+    # "html.parser"
+    "google_news_parser": "auto",
+    # News tool results cached under data_cache_dir/news; ranges that include
+    # today expire after news_cache_live_ttl seconds
+    "news_cache_enabled": True,
+    "news_cache_max_mb": 256,
+    "news_cache_live_ttl": 900,
+    # Cache the OpenAI web search tools the same way (past dates permanently)
+    "openai_cache_enabled": True,
+    # Embeddings used by the agent memories, cached per (model, text) in
+    # process and, with embedding_cache_disk, in data_cache_dir/embeddings.sqlite
+    "embedding_cache_enabled": True,
+    "embedding_cache_size": 4096,
+    "embedding_cache_disk": True,
+    # Texts per embeddings request and requests in flight when adding memories
+    "embedding_batch_size": 64,
+    "embedding_max_concurrency": 4,
+    # Keep agent memories in an on-disk store (memory_dir, by default
+    # results_dir/memory) so reflections survive restarts
+    "memory_persist": False,
+    "memory_dir": None,
+    # Memory backends: "openai" embeddings (the configured backend_url) or
+    # "hashing", local hashed term vectors of width embedding_dim; vectors
+    # stored in "chroma" or "numpy" (exact brute-force cosine search)
+    "embedding_backend": "openai",
+    "embedding_dim": 1024,
+    "memory_store": "chroma",
+    # Size cap per memory: past memory_max_entries, near-duplicates (cosine
+    # similarity >= memory_compaction_threshold) are merged and summarized,
+    # then the lowest-retention entries evicted (recency halves every
+    # memory_half_life_entries newer entries, weighted up by |outcome|)
+    "memory_max_entries": 1000,
+    "memory_compaction_threshold": 0.95,
+    "memory_half_life_entries": 250,
+    # How memories match the current situation: "text" (embedding
+    # similarity), "features" (nearest numeric market state: indicators,
+    # returns, volatility and insider sentiment; no embedding call) or
+    # "hybrid" (memory_feature_weight * feature similarity + the rest * text)
+    "memory_retrieval": "text",
+    "memory_feature_weight": 0.5,
 }
@@ -1,5 +1,6 @@
 # TradingAgents/graph/__init__.py
 
+from .batch import BatchResult, BatchRun, BatchStats
 from .conditional_logic import ConditionalLogic
 from .propagation import Propagator
 from .reflection import Reflector
@@ -9,6 +10,9 @@ from .trading_graph import TradingAgentsGraph
 
 __all__ = [
     "TradingAgentsGraph",
+    "BatchResult",
+    "BatchRun",
+    "BatchStats",
     "ConditionalLogic",
     "GraphSetup",
     "Propagator",
@@ -0,0 +1,168 @@
+# TradingAgents/graph/batch.py
+
+import asyncio
+import contextvars
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class BatchResult(NamedTuple):
+    """One (ticker, trade_date) run of propagate_many."""
+
+    ticker: str
+    trade_date: str
+    final_state: Optional[dict]
+    decision: Optional[str]
+    # The exception the run raised; final_state and decision are None then
+    error: Optional[Exception]
+    # Seconds from the start of the run to its result
+    latency: float
+
+
+class BatchStats(NamedTuple):
+    """Throughput and latency of the runs of a batch finished so far."""
+
+    completed: int
+    failed: int
+    elapsed: float
+    runs_per_minute: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+
+    def __str__(self):
+        return (
+            f"{self.completed} runs ({self.failed} failed) in {self.elapsed:.1f} s, "
+            f"{self.runs_per_minute:.1f} runs/min, latency p50 "
+            f"{self.latency_p50:.1f} s, p90 {self.latency_p90:.1f} s, "
+            f"p99 {self.latency_p99:.1f} s, max {self.latency_max:.1f} s"
+        )
+
+
+class BatchRun:
+    """
+    The runs of TradingAgentsGraph.propagate_many.
+
+    Iterate it once, with for or async for, to get a BatchResult per
+    (ticker, trade_date) as each run completes. Up to max_concurrency runs
+    are in progress at once on one event loop, and the next pair is only
+    read from jobs when a run finishes, so memory stays bounded however
+    long the list is. A run that raises yields a result carrying the
+    error; the other runs carry on. stats covers the runs finished so far.
+
+    Iterating with for runs the loop only while waiting for the next
+    result, so the runs in progress pause while the loop body executes.
+    Under a running event loop (Jupyter, async web apps) that loop is
+    driven from a worker thread; async for avoids blocking the host's loop.
+    """
+
+    def __init__(
+        self,
+        graph,
+        jobs: Annotated[Iterable[Tuple[str, str]], "(ticker, trade_date) pairs"],
+        max_concurrency: Annotated[int, "runs in progress at once"],
+    ):
+        self.graph = graph
+        self.jobs = jobs
+        self.max_concurrency = max_concurrency
+        self._start = None
+        self._latencies: List[float] = []
+        self._failed = 0
+
+    async def _run(self, ticker, trade_date):
+        start = time.perf_counter()
+        try:
+            final_state, decision = await self.graph.apropagate(ticker, trade_date)
+        except Exception as e:
+            return BatchResult(
+                ticker, trade_date, None, None, e, time.perf_counter() - start
+            )
+        return BatchResult(
+            ticker, trade_date, final_state, decision, None, time.perf_counter() - start
+        )
+
+    async def __aiter__(self):
+        self._start = time.perf_counter()
+        jobs = iter(self.jobs)
+        pending = set()
+        try:
+            while True:
+                for ticker, trade_date in itertools.islice(
+                    jobs, self.max_concurrency - len(pending)
+                ):
+                    pending.add(asyncio.ensure_future(self._run(ticker, trade_date)))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    self._latencies.append(result.latency)
+                    self._failed += result.error is not None
+                    yield result
+        finally:
+            # The caller stopped early: don't leave runs going in the background
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def __iter__(self):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            worker = None
+        else:
+            # A second loop can't run on a thread whose loop is running, so
+            # run ours on a worker thread, in a copy of the caller's context
+            worker = ThreadPoolExecutor(max_workers=1)
+            context = contextvars.copy_context()
+
+        loop = asyncio.new_event_loop()
+
+        def run(coro):
+            if worker is None:
+                return loop.run_until_complete(coro)
+            return worker.submit(context.run, loop.run_until_complete, coro).result()
+
+        results = self.__aiter__()
+        try:
+            while True:
+                try:
+                    yield run(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            try:
+                run(results.aclose())
+                run(loop.shutdown_default_executor())
+            finally:
+                loop.close()
+                if worker is not None:
+                    worker.shutdown()
+
+    @property
+    def stats(self) -> BatchStats:
+        elapsed = time.perf_counter() - self._start if self._start else 0.0
+        completed = len(self._latencies)
+        if completed:
+            latencies = np.array(self._latencies)
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            slowest = latencies.max()
+        else:
+            p50 = p90 = p99 = slowest = 0.0
+        return BatchStats(
+            completed,
+            self._failed,
+            elapsed,
+            60 * completed / elapsed if elapsed else 0.0,
+            float(p50),
+            float(p90),
+            float(p99),
+            float(slowest),
+        )
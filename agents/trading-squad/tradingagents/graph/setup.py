@@ -2,6 +2,7 @@
 
 from typing import Dict
 
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
@@ -11,6 +12,40 @@ from tradingagents.agents.utils.agent_utils import Toolkit
 
 from .conditional_logic import ConditionalLogic
 
+# State key each analyst writes its report to
+ANALYST_REPORTS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
+def create_analyst_branch(branch, report_key):
+    """
+    Run an analyst's compiled subgraph as one node. The subgraph keeps its
+    own messages; only the report is written back, so branches running side
+    by side never update the same state key.
+    """
+
+    def analyst_branch_node(state, config):
+        final_state = branch.invoke(state, config)
+        return {report_key: final_state[report_key]}
+
+    async def aanalyst_branch_node(state, config):
+        final_state = await branch.ainvoke(state, config)
+        return {report_key: final_state[report_key]}
+
+    return RunnableLambda(analyst_branch_node, afunc=aanalyst_branch_node)
+
+
+def create_analyst_join():
+    def analyst_join_node(state):
+        """Wait for every analyst branch; the reports are already in the state."""
+        return {}
+
+    return analyst_join_node
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -40,8 +75,30 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
 
+    def _analyst_subgraph(self, analyst_type, analyst_node, tool_node):
+        """One analyst's tool loop as a graph of its own, ending with its report."""
+        current_analyst = f"{analyst_type.capitalize()} Analyst"
+        current_tools = f"tools_{analyst_type}"
+
+        branch = StateGraph(AgentState)
+        branch.add_node(current_analyst, analyst_node)
+        branch.add_node(current_tools, tool_node)
+        branch.add_edge(START, current_analyst)
+        branch.add_conditional_edges(
+            current_analyst,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {
+                current_tools: current_tools,
+                f"Msg Clear {analyst_type.capitalize()}": END,
+            },
+        )
+        branch.add_edge(current_tools, current_analyst)
+        return branch.compile()
+
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        analyst_execution="sequential",
     ):
         """Set up and compile the agent workflow graph.
 
@@ -51,9 +108,16 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            analyst_execution (str): How the analysts run:
+                - "sequential": one after another, sharing the messages channel
+                - "parallel": concurrently, each in its own branch with its own
+                  messages; an "Analyst Join" node waits for all of them
+                  before the Bull Researcher
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
+        if analyst_execution not in ("sequential", "parallel"):
+            raise ValueError(f"Unknown analyst execution mode: {analyst_execution}")
 
         # Create analyst nodes
         analyst_nodes = {}
@@ -112,12 +176,24 @@ class GraphSetup:
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+        if analyst_execution == "parallel":
+            for analyst_type, node in analyst_nodes.items():
+                branch = self._analyst_subgraph(
+                    analyst_type, node, tool_nodes[analyst_type]
+                )
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    create_analyst_branch(branch, ANALYST_REPORTS[analyst_type]),
+                )
+            workflow.add_node("Analyst Join", create_analyst_join())
+        else:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+                workflow.add_node(
+                    f"Msg Clear {analyst_type.capitalize()}",
+                    delete_nodes[analyst_type],
+                )
+                workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
@@ -130,30 +206,41 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i + 1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        if analyst_execution == "parallel":
+            # Fan out to every analyst at once, fan in at the join
+            branches = [
+                f"{analyst_type.capitalize()} Analyst"
+                for analyst_type in selected_analysts
+            ]
+            for branch in branches:
+                workflow.add_edge(START, branch)
+            workflow.add_edge(branches, "Analyst Join")
+            workflow.add_edge("Analyst Join", "Bull Researcher")
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i + 1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -10,6 +10,15 @@ class SignalProcessor:
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
 
+    def _messages(self, full_signal: str):
+        return [
+            (
+                "system",
+                "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
+            ),
+            ("human", full_signal),
+        ]
+
     def process_signal(self, full_signal: str) -> str:
         """
         Process a full trading signal to extract the core decision.
@@ -20,12 +29,9 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
-            (
-                "system",
-                "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
-            ),
-            ("human", full_signal),
-        ]
+        return self.quick_thinking_llm.invoke(self._messages(full_signal)).content
 
-        return self.quick_thinking_llm.invoke(messages).content
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async version of process_signal."""
+        response = await self.quick_thinking_llm.ainvoke(self._messages(full_signal))
+        return response.content
@@ -1,9 +1,10 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -11,9 +12,15 @@ from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import ToolNode
 from tradingagents.agents import *
 from tradingagents.agents.utils.memory import FinancialSituationMemory
-from tradingagents.dataflows.config import set_config
-from tradingagents.default_config import DEFAULT_CONFIG
-
+from tradingagents.dataflows.config import (
+    aiterate_in_context,
+    config_context,
+    freeze_config,
+    iterate_in_context,
+)
+from tradingagents.dataflows.llm_limits import llm_slot
+
+from .batch import BatchRun
 from .conditional_logic import ConditionalLogic
 from .propagation import Propagator
 from .reflection import Reflector
@@ -38,10 +45,9 @@ class TradingAgentsGraph:
             config: Configuration dictionary. If None, uses default config
         """
         self.debug = debug
-        self.config = config or DEFAULT_CONFIG
-
-        # Update the interface's config
-        set_config(self.config)
+        # Read-only from here on; the dataflows see it only within this
+        # graph's runs, so graphs with different configs can run side by side
+        self.config = freeze_config(config)
 
         # Create necessary directories
         os.makedirs(
@@ -115,13 +121,16 @@ class TradingAgentsGraph:
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
 
-        # State tracking
+        # State tracking: the last propagate / propagate_stream run (the
+        # async runs may be concurrent and don't set these)
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to date to full state dict
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, self.config["analyst_execution"]
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -161,6 +170,7 @@ class TradingAgentsGraph:
                     # offline tools
                     self.toolkit.get_finnhub_company_insider_sentiment,
                     self.toolkit.get_finnhub_company_insider_transactions,
+                    self.toolkit.get_simfin_fundamental_ratios,
                     self.toolkit.get_simfin_balance_sheet,
                     self.toolkit.get_simfin_cashflow,
                     self.toolkit.get_simfin_income_stmt,
@@ -179,20 +189,27 @@ class TradingAgentsGraph:
         )
         args = self.propagator.get_graph_args()
 
+        context = config_context(self.config)
+
         if self.debug:
-            # Debug mode with tracing
+            # Debug mode with tracing. Parallel analysts keep their messages
+            # in their own subgraphs, so stream those too; only top-level
+            # chunks are states of the whole run
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for namespace, chunk in iterate_in_context(
+                context, self.graph.stream(init_agent_state, subgraphs=True, **args)
+            ):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
                     chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                    if not namespace:
+                        trace.append(chunk)
 
             final_state = trace[-1]
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            final_state = context.run(self.graph.invoke, init_agent_state, **args)
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -203,9 +220,76 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def apropagate(self, company_name, trade_date):
+        """
+        Async version of propagate. Nodes await their LLM calls and tool
+        nodes run the tools' async implementations, so one event loop can
+        drive many concurrent runs of this graph.
+
+        Unlike propagate, it leaves self.ticker and self.curr_state alone:
+        concurrent runs share the graph, so use the returned state instead.
+        """
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        context = config_context(self.config)
+
+        if self.debug:
+            trace = []
+            async for namespace, chunk in aiterate_in_context(
+                context, self.graph.astream(init_agent_state, subgraphs=True, **args)
+            ):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    if not namespace:
+                        trace.append(chunk)
+
+            final_state = trace[-1]
+        else:
+            # A task runs in a copy of the context it is created in
+            final_state = await context.run(
+                asyncio.ensure_future, self.graph.ainvoke(init_agent_state, **args)
+            )
+
+        self._log_state(trade_date, final_state)
+
+        return final_state, await self.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+
+    def propagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> BatchRun:
+        """Run the graph for many (company_name, trade_date) pairs.
+
+        Runs go through apropagate on this one graph, so they share its
+        memories and the dataflow caches, up to max_concurrency (default
+        batch_max_concurrency) at a time; LLM calls are further capped per
+        provider by llm_max_concurrency. Like apropagate, the runs leave
+        self.curr_state alone: reflect on a result with
+        reflect_and_remember(returns_losses, result.final_state).
+
+        Returns:
+            A BatchRun: iterate it (for or async for) to get a BatchResult
+            per pair as its run completes, failed runs included with their
+            error. Its stats give throughput and tail latency.
+        """
+        return BatchRun(
+            self, jobs, max_concurrency or self.config["batch_max_concurrency"]
+        )
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        # The ticker comes from the state: concurrent runs may share this graph
+        ticker = final_state["company_of_interest"]
+        ticker_log = self.log_states_dict.setdefault(ticker, {})
+        ticker_log[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -236,14 +320,14 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(ticker_log, f, indent=4)
 
     def propagate_stream(self, company_name, trade_date):
         """Stream the trading agents graph for real-time UI updates.
@@ -259,8 +343,12 @@ class TradingAgentsGraph:
         )
         args = self.propagator.get_graph_args()
 
+        context = config_context(self.config)
+
         last_chunk = None
-        for chunk in self.graph.stream(init_agent_state, **args):
+        for chunk in iterate_in_context(
+            context, self.graph.stream(init_agent_state, **args)
+        ):
             last_chunk = chunk
             yield chunk
 
@@ -269,24 +357,56 @@ class TradingAgentsGraph:
             self.curr_state = final_state
             self._log_state(trade_date, final_state)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+    async def apropagate_stream(self, company_name, trade_date):
+        """Async version of propagate_stream.
+
+        Yields:
+            chunk: A streaming chunk from langgraph with messages and state updates.
+        At the end, logs the final state similarly to apropagate(), which
+        like it leaves self.ticker and self.curr_state alone.
+        """
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
         )
+        args = self.propagator.get_graph_args()
+
+        context = config_context(self.config)
+
+        last_chunk = None
+        async for chunk in aiterate_in_context(
+            context, self.graph.astream(init_agent_state, **args)
+        ):
+            last_chunk = chunk
+            yield chunk
+
+        if last_chunk is not None:
+            self._log_state(trade_date, last_chunk)
+
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        Args:
+            returns_losses: The returns of the position taken on the decision
+            state: Final state of the run to reflect on, e.g. a
+                BatchResult.final_state or the state apropagate returned.
+                Defaults to the last propagate run's (self.curr_state)
+        """
+        state = state if state is not None else self.curr_state
+        self.reflector.reflect_bull_researcher(state, returns_losses, self.bull_memory)
+        self.reflector.reflect_bear_researcher(state, returns_losses, self.bear_memory)
+        self.reflector.reflect_trader(state, returns_losses, self.trader_memory)
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Async version of process_signal."""
+        async with llm_slot(self.config):
+            return await self.signal_processor.aprocess_signal(full_signal)